@@ -1,13 +1,149 @@
+import argparse
+import json
 import os
 import sys
 from src.controller.controlador import Controlador
+from src.controller.eventos import DisparoDeshecho, DisparoResuelto, JuegoIniciado, NaveHundida
+from src.utilidades.logs import configurar_desde_entorno
+from src.utilidades.metricas import REGISTRO, habilitar_metricas, iniciar_servidor_metricas
+from src.utilidades.perfilado import leer_guion, perfilar
 
 class BatallaNavalCLI:
-    def __init__(self):
+    def __init__(self, entrada=None, interactivo=True):
         self.controlador = Controlador()
+        self.entrada = entrada or input
+        # Sin terminal (guiones, perfilado) no se limpia la pantalla ni se espera Enter
+        self.interactivo = interactivo
+        # Tablero ya dibujado; los eventos lo invalidan y avisan de las naves hundidas
+        self._tablero = None
+        self._hundidas = []
+        self.controlador.eventos.suscribir(
+            self._al_evento, (JuegoIniciado, DisparoResuelto, DisparoDeshecho, NaveHundida)
+        )
+
+    def _al_evento(self, evento):
+        if isinstance(evento, NaveHundida):
+            self._hundidas.append(evento)
+        else:
+            self._tablero = None
+
+    def tablero(self):
+        """Representación del tablero; solo se vuelve a generar si un evento indicó que cambió."""
+        if self._tablero is None:
+            self._tablero = self.controlador.obtener_representacion_tablero()
+        return self._tablero
 
     def limpiar_pantalla(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self.interactivo:
+            os.system('cls' if os.name == 'nt' else 'clear')
+
+    def preguntar(self, mensaje):
+        return self.entrada(mensaje)
+
+    def pausar(self, mensaje):
+        if self.interactivo:
+            self.entrada(mensaje)
+        else:
+            print(mensaje)
+
+    def ejecutar(self):
+        """Ejecuta el menú hasta que el usuario sale o se agota la entrada."""
+        try:
+            self.mostrar_menu()
+        except EOFError:
+            pass
+
+    def ejecutar_lote(self, entrada, salida):
+        """Procesa comandos JSON (uno por línea) de `entrada` y escribe una respuesta JSON por línea en `salida`.
+
+        Las operaciones son las del servidor de red: registrar, iniciar_sesion,
+        iniciar_juego, disparar, disparar_lote, salva, reiniciar_juego, tablero
+        y puntuaciones. Devuelve la cantidad de comandos procesados.
+        """
+        operaciones = {
+            'registrar': self._lote_registrar,
+            'iniciar_sesion': self._lote_iniciar_sesion,
+            'iniciar_juego': self._lote_iniciar_juego,
+            'disparar': self._lote_disparar,
+            'disparar_lote': self._lote_disparar_lote,
+            'salva': self._lote_salva,
+            'reiniciar_juego': self._lote_reiniciar_juego,
+            'tablero': self._lote_tablero,
+            'puntuaciones': self._lote_puntuaciones,
+        }
+        procesados = 0
+
+        for linea in entrada:
+            if not linea.strip():
+                continue
+
+            comando = {}
+            try:
+                comando = json.loads(linea)
+                operacion = operaciones.get(comando.get('op'))
+                if operacion is None:
+                    raise ValueError(f"Operación desconocida: {comando.get('op')}")
+                respuesta = operacion(comando)
+                respuesta['ok'] = True
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                respuesta = {'ok': False, 'error': str(e)}
+
+            if isinstance(comando, dict) and 'id' in comando:
+                respuesta['id'] = comando['id']
+            salida.write(json.dumps(respuesta, ensure_ascii=False) + "\n")
+            procesados += 1
+
+        salida.flush()
+        return procesados
+
+    def _lote_registrar(self, comando):
+        return {'registrado': self.controlador.registrar_jugador(comando['nombre'], comando['contraseña'])}
+
+    def _lote_iniciar_sesion(self, comando):
+        if not self.controlador.iniciar_sesion(comando['nombre'], comando['contraseña']):
+            raise ValueError("Credenciales incorrectas")
+        return {'nombre': self.controlador.jugador_activo.nombre_usuario}
+
+    def _lote_iniciar_juego(self, comando):
+        self.controlador.iniciar_juego(
+            int(comando.get('ancho', 10)), int(comando.get('alto', 10)), int(comando.get('num_naves', 5)),
+            bool(comando.get('disperso', False)),
+            [int(longitud) for longitud in comando['flota']] if comando.get('flota') else None
+        )
+        return {}
+
+    def _lote_disparar(self, comando):
+        impacto = self.controlador.realizar_disparo(int(comando['fila']), int(comando['columna']))
+        hundida = getattr(self.controlador.juego.campo, 'ultima_nave_hundida', None) is not None
+        return {'impacto': impacto, 'hundida': hundida, 'terminado': self.controlador.juego_terminado()}
+
+    def _lote_disparar_lote(self, comando):
+        resultados = []
+        for fila, columna in comando['disparos']:
+            if self.controlador.juego_terminado():
+                break
+            try:
+                resultados.append(self.controlador.realizar_disparo(int(fila), int(columna)))
+            except ValueError as e:
+                resultados.append(str(e))
+        return {'resultados': resultados, 'terminado': self.controlador.juego_terminado()}
+
+    def _lote_salva(self, comando):
+        impactos, hundidas = self.controlador.realizar_salva(
+            comando.get('arma', 'explosion'), int(comando['fila']), int(comando['columna'])
+        )
+        return {'impactos': impactos, 'hundidas': hundidas, 'terminado': self.controlador.juego_terminado()}
+
+    def _lote_reiniciar_juego(self, comando):
+        if not self.controlador.reiniciar_juego():
+            raise ValueError("No hay un juego activo")
+        return {}
+
+    def _lote_tablero(self, comando):
+        return {'tablero': self.tablero()}
+
+    def _lote_puntuaciones(self, comando):
+        return {'puntuaciones': self.controlador.obtener_puntuaciones(int(comando.get('limite', 10)))}
 
     def mostrar_menu(self):
         while True:
@@ -19,10 +155,11 @@ class BatallaNavalCLI:
             print("2. Registrarse")
             print("3. Iniciar sesión")
             print("4. Ver puntuaciones")
-            print("5. Salir")
+            print("5. Reanudar partida guardada")
+            print("6. Salir")
             print("=" * 40)
 
-            opcion = input("Seleccione una opción (1-5): ")
+            opcion = self.preguntar("Seleccione una opción (1-6): ")
 
             if opcion == "1":
                 self.jugar_sin_registro()
@@ -33,10 +170,12 @@ class BatallaNavalCLI:
             elif opcion == "4":
                 self.mostrar_puntuaciones()
             elif opcion == "5":
+                self.reanudar_partida()
+            elif opcion == "6":
                 print("¡Gracias por jugar!")
                 sys.exit(0)
             else:
-                input("Opción inválida. Presione Enter para continuar...")
+                self.pausar("Opción inválida. Presione Enter para continuar...")
 
     def registrar_usuario(self):
         self.limpiar_pantalla()
@@ -44,17 +183,17 @@ class BatallaNavalCLI:
         print("       REGISTRO DE USUARIO")
         print("=" * 40)
 
-        nombre = input("Nombre de usuario: ")
-        contraseña = input("Contraseña: ")
+        nombre = self.preguntar("Nombre de usuario: ")
+        contraseña = self.preguntar("Contraseña: ")
 
         if not nombre or not contraseña:
-            input("Todos los campos son obligatorios. Presione Enter para continuar...")
+            self.pausar("Todos los campos son obligatorios. Presione Enter para continuar...")
             return
 
         if self.controlador.registrar_jugador(nombre, contraseña):
-            input("Usuario registrado correctamente. Presione Enter para continuar...")
+            self.pausar("Usuario registrado correctamente. Presione Enter para continuar...")
         else:
-            input("Error al registrar usuario. El nombre de usuario ya existe o es inválido. Presione Enter para continuar...")
+            self.pausar("Error al registrar usuario. El nombre de usuario ya existe o es inválido. Presione Enter para continuar...")
 
     def iniciar_sesion(self):
         self.limpiar_pantalla()
@@ -62,18 +201,18 @@ class BatallaNavalCLI:
         print("       INICIAR SESIÓN")
         print("=" * 40)
 
-        nombre = input("Nombre de usuario: ")
-        contraseña = input("Contraseña: ")
+        nombre = self.preguntar("Nombre de usuario: ")
+        contraseña = self.preguntar("Contraseña: ")
 
         if not nombre or not contraseña:
-            input("Todos los campos son obligatorios. Presione Enter para continuar...")
+            self.pausar("Todos los campos son obligatorios. Presione Enter para continuar...")
             return
 
         if self.controlador.iniciar_sesion(nombre, contraseña):
-            input("Inicio de sesión exitoso. Presione Enter para jugar...")
+            self.pausar("Inicio de sesión exitoso. Presione Enter para jugar...")
             self.jugar()
         else:
-            input("Credenciales incorrectas. Presione Enter para continuar...")
+            self.pausar("Credenciales incorrectas. Presione Enter para continuar...")
 
     def mostrar_puntuaciones(self):
         self.limpiar_pantalla()
@@ -93,7 +232,7 @@ class BatallaNavalCLI:
                 print(f"{i:^9} | {p['nombre_usuario']:<10} | {p['puntaje']:>6}")
 
         print("\n" + "=" * 40)
-        input("\nPresione Enter para volver al menú principal...")
+        self.pausar("\nPresione Enter para volver al menú principal...")
 
     def jugar_sin_registro(self):
         self.limpiar_pantalla()
@@ -106,11 +245,22 @@ class BatallaNavalCLI:
         num_naves = 5
 
         print(f"Configuración: Tablero de {ancho}x{alto} con {num_naves} naves")
-        input("Presione Enter para comenzar...")
+        self.pausar("Presione Enter para comenzar...")
 
         self.controlador.iniciar_juego(ancho, alto, num_naves)
         self.jugar()
 
+    def reanudar_partida(self):
+        try:
+            if not self.controlador.reanudar_partida():
+                self.pausar("No hay una partida guardada. Presione Enter para continuar...")
+                return
+        except (OSError, ValueError) as e:
+            self.pausar(f"No se pudo cargar la partida: {str(e)}. Presione Enter para continuar...")
+            return
+
+        self.jugar()
+
     def jugar(self):
         if not self.controlador.juego:
             self.limpiar_pantalla()
@@ -119,9 +269,9 @@ class BatallaNavalCLI:
             print("=" * 40)
 
             try:
-                ancho = int(input("Ancho del tablero (2-20, predeterminado 10): ") or "10")
-                alto = int(input("Alto del tablero (2-20, predeterminado 10): ") or "10")
-                num_naves = int(input("Número de naves (1-100, predeterminado 5): ") or "5")
+                ancho = int(self.preguntar("Ancho del tablero (2-20, predeterminado 10): ") or "10")
+                alto = int(self.preguntar("Alto del tablero (2-20, predeterminado 10): ") or "10")
+                num_naves = int(self.preguntar("Número de naves (1-100, predeterminado 5): ") or "5")
 
                 if ancho < 2 or ancho > 20:
                     ancho = 10
@@ -132,7 +282,7 @@ class BatallaNavalCLI:
 
                 self.controlador.iniciar_juego(ancho, alto, num_naves)
             except ValueError:
-                input("Entrada inválida. Se usarán valores predeterminados. Presione Enter para continuar...")
+                self.pausar("Entrada inválida. Se usarán valores predeterminados. Presione Enter para continuar...")
                 self.controlador.iniciar_juego(10, 10, 5)
 
         while not self.controlador.juego_terminado():
@@ -146,39 +296,104 @@ class BatallaNavalCLI:
                 print(f"Puntaje: {self.controlador.jugador_activo.puntaje}")
 
             print("\nTablero:")
-            print(self.controlador.obtener_representacion_tablero())
+            print(self.tablero())
 
             try:
-                fila = int(input("Fila: "))
-                columna = int(input("Columna: "))
-
+                entrada = self.preguntar("Fila (g para guardar y salir, d para deshacer): ")
+                if entrada.strip().lower() == "g":
+                    try:
+                        self.controlador.guardar_partida()
+                    except (OSError, ValueError) as e:
+                        self.pausar(f"No se pudo guardar la partida: {str(e)}. Presione Enter para continuar...")
+                        continue
+                    self.pausar("Partida guardada. Presione Enter para volver al menú principal...")
+                    return
+                if entrada.strip().lower() == "d":
+                    if self.controlador.deshacer_disparo():
+                        self.pausar("Disparo deshecho. Presione Enter para continuar...")
+                    else:
+                        self.pausar("No hay disparos para deshacer. Presione Enter para continuar...")
+                    continue
+
+                fila = int(entrada)
+                columna = int(self.preguntar("Columna: "))
+
+                self._hundidas.clear()
                 impacto = self.controlador.realizar_disparo(fila, columna)
 
-                if impacto:
-                    input("¡Impacto en una nave! Presione Enter para continuar...")
+                if self._hundidas:
+                    self.pausar(f"¡Nave de {len(self._hundidas[0].celdas)} celda(s) hundida! Presione Enter para continuar...")
+                elif impacto:
+                    self.pausar("¡Impacto en una nave! Presione Enter para continuar...")
                 else:
-                    input("Disparo al agua. Presione Enter para continuar...")
+                    self.pausar("Disparo al agua. Presione Enter para continuar...")
             except ValueError as e:
                 if "ya ha sido impactada" in str(e):
-                    input("Esta celda ya ha sido impactada. Presione Enter para continuar...")
+                    self.pausar("Esta celda ya ha sido impactada. Presione Enter para continuar...")
                 else:
-                    input("Entrada inválida. Use números enteros. Presione Enter para continuar...")
+                    self.pausar("Entrada inválida. Use números enteros. Presione Enter para continuar...")
+            except EOFError:
+                raise
             except Exception as e:
-                input(f"Error: {str(e)}. Presione Enter para continuar...")
+                self.pausar(f"Error: {str(e)}. Presione Enter para continuar...")
 
         self.limpiar_pantalla()
         print("=" * 40)
         print("       ¡JUEGO TERMINADO!")
         print("=" * 40)
         print("\nTablero final:")
-        print(self.controlador.obtener_representacion_tablero())
+        print(self.tablero())
 
         if self.controlador.jugador_activo:
             print(f"\nJugador: {self.controlador.jugador_activo.nombre_usuario}")
             print(f"Puntaje final: {self.controlador.jugador_activo.puntaje}")
 
-        input("\nPresione Enter para volver al menú principal...")
+        self.pausar("\nPresione Enter para volver al menú principal...")
+
+def _parsear_argumentos(argumentos=None):
+    parser = argparse.ArgumentParser(description="Batalla Naval en la terminal")
+    parser.add_argument("--metricas", metavar="RUTA",
+                        help="activa las métricas y las vuelca en RUTA (formato Prometheus) al salir")
+    parser.add_argument("--puerto-metricas", type=int, metavar="PUERTO",
+                        help="activa las métricas y las sirve en http://127.0.0.1:PUERTO/metrics")
+    parser.add_argument("--guion", metavar="RUTA",
+                        help="lee las respuestas (opciones del menú, disparos...) de RUTA, una por línea")
+    parser.add_argument("--perfil", "--profile", metavar="RUTA_BASE",
+                        help="perfila la sesión y escribe RUTA_BASE.pstats y RUTA_BASE.folded")
+    parser.add_argument("--lote", nargs="?", const="-", metavar="RUTA",
+                        help="modo no interactivo: lee comandos JSON Lines de RUTA (o stdin) y escribe respuestas JSON Lines")
+    return parser.parse_args(argumentos)
+
+def _sesion(argumentos):
+    if argumentos.lote:
+        cli = BatallaNavalCLI(interactivo=False)
+        if argumentos.lote == "-":
+            cli.ejecutar_lote(sys.stdin, sys.stdout)
+        else:
+            with open(argumentos.lote, 'r', encoding='utf-8') as entrada:
+                cli.ejecutar_lote(entrada, sys.stdout)
+        return
+
+    if argumentos.guion:
+        cli = BatallaNavalCLI(leer_guion(argumentos.guion), interactivo=False)
+    else:
+        cli = BatallaNavalCLI()
+    cli.ejecutar()
 
 if __name__ == "__main__":
-    cli = BatallaNavalCLI()
-    cli.mostrar_menu()
+    configurar_desde_entorno()
+    argumentos = _parsear_argumentos()
+
+    if argumentos.metricas or argumentos.puerto_metricas:
+        habilitar_metricas()
+    if argumentos.puerto_metricas:
+        iniciar_servidor_metricas(argumentos.puerto_metricas)
+
+    try:
+        if argumentos.perfil:
+            perfilar(lambda: _sesion(argumentos), argumentos.perfil)
+        else:
+            _sesion(argumentos)
+    finally:
+        if argumentos.metricas:
+            REGISTRO.volcar(argumentos.metricas)
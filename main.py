@@ -5,7 +5,9 @@ from src.view.juego import JuegoScreen
 from src.view.registro import RegistroScreen
 from src.view.login import LoginScreen
 from src.view.puntuaciones import PuntuacionesScreen
+from src.view.segundo_plano import EJECUTOR_UI
 from src.controller.controlador import Controlador
+from src.utilidades.logs import configurar_desde_entorno
 
 class BatallaNavalApp(App):
     def build(self):
@@ -17,6 +19,8 @@ class BatallaNavalApp(App):
 
         juego_screen = JuegoScreen(name="juego")
         juego_screen.controlador = controlador
+        # La puntuación de cada victoria se escribe fuera del hilo de la interfaz
+        controlador.usar_ejecutor_puntuaciones(EJECUTOR_UI)
 
         registro_screen = RegistroScreen(name="registro")
         registro_screen.controlador = controlador
@@ -35,4 +39,5 @@ class BatallaNavalApp(App):
         return sm
 
 if __name__ == "__main__":
+    configurar_desde_entorno()
     BatallaNavalApp().run()
@@ -0,0 +1,265 @@
+import argparse
+import json
+import math
+import os
+import random
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from src.model.campo import Campo
+from src.utilidades.logs import obtener_logger
+
+DIRECTORIO_CACHE = os.path.join('datos', 'simulaciones')
+
+# z de un intervalo de confianza del 95 %
+_Z_95 = 1.96
+
+logger = obtener_logger('simulador')
+
+
+def _aleatoria(campo, aleatorio):
+    """Dispara a celdas al azar sin repetir."""
+    ancho = campo.ancho
+    disparos = 0
+    for indice in aleatorio.sample(range(ancho * campo.alto), ancho * campo.alto):
+        disparos += 1
+        if campo.verificar_impacto(*divmod(indice, ancho)) and campo.naves_restantes == 0:
+            break
+    return disparos
+
+
+def _barrido(campo, aleatorio):
+    """Recorre el tablero fila por fila."""
+    ancho = campo.ancho
+    disparos = 0
+    for indice in range(ancho * campo.alto):
+        disparos += 1
+        if campo.verificar_impacto(*divmod(indice, ancho)) and campo.naves_restantes == 0:
+            break
+    return disparos
+
+
+def _caza(campo, aleatorio):
+    """Dispara al azar hasta impactar y luego a las celdas vecinas hasta hundir la nave."""
+    ancho, alto = campo.ancho, campo.alto
+    pendientes = aleatorio.sample(range(ancho * alto), ancho * alto)
+    disparadas = set()
+    objetivos = []
+    disparos = 0
+
+    while campo.naves_restantes > 0:
+        indice = objetivos.pop() if objetivos else pendientes.pop()
+        if indice in disparadas:
+            continue
+        disparadas.add(indice)
+        disparos += 1
+
+        fila, columna = divmod(indice, ancho)
+        if not campo.verificar_impacto(fila, columna):
+            continue
+        if campo.ultima_nave_hundida is not None:
+            objetivos.clear()
+            continue
+        for f, c in ((fila - 1, columna), (fila + 1, columna), (fila, columna - 1), (fila, columna + 1)):
+            if 0 <= f < alto and 0 <= c < ancho and f * ancho + c not in disparadas:
+                objetivos.append(f * ancho + c)
+
+    return disparos
+
+
+ESTRATEGIAS = {
+    'aleatoria': _aleatoria,
+    'barrido': _barrido,
+    'caza': _caza,
+}
+
+
+def simular_lote(ancho, alto, num_naves, estrategia, partidas, semilla, flota=None):
+    """Juega `partidas` partidas con la estrategia indicada y devuelve {disparos: cantidad}.
+
+    Es la unidad de trabajo de los procesos: solo recibe y devuelve datos
+    simples y es reproducible a partir de la semilla.
+    """
+    jugar = ESTRATEGIAS[estrategia]
+    aleatorio = random.Random(semilla)
+    resultados = Counter()
+    for _ in range(partidas):
+        campo = Campo(ancho, alto, num_naves, aleatorio.getrandbits(32), flota)
+        resultados[jugar(campo, aleatorio)] += 1
+    return dict(resultados)
+
+
+class Distribucion:
+    """Acumula la distribución de disparos necesarios para ganar."""
+
+    def __init__(self):
+        self.frecuencias = Counter()
+        self.partidas = 0
+        self._suma = 0
+        self._suma_cuadrados = 0
+
+    def agregar(self, frecuencias):
+        for disparos, cantidad in frecuencias.items():
+            self.frecuencias[disparos] += cantidad
+            self.partidas += cantidad
+            self._suma += disparos * cantidad
+            self._suma_cuadrados += disparos * disparos * cantidad
+
+    @property
+    def media(self):
+        return self._suma / self.partidas if self.partidas else 0.0
+
+    @property
+    def desviacion(self):
+        if self.partidas < 2:
+            return 0.0
+        varianza = (self._suma_cuadrados - self._suma * self._suma / self.partidas) / (self.partidas - 1)
+        return math.sqrt(max(varianza, 0.0))
+
+    @property
+    def semiancho(self):
+        """Semiancho del intervalo de confianza del 95 % de la media."""
+        if self.partidas < 2:
+            return math.inf
+        return _Z_95 * self.desviacion / math.sqrt(self.partidas)
+
+    def percentil(self, p):
+        objetivo = p / 100 * self.partidas
+        acumulado = 0
+        for disparos in sorted(self.frecuencias):
+            acumulado += self.frecuencias[disparos]
+            if acumulado >= objetivo:
+                return disparos
+        return 0
+
+    def como_dict(self):
+        return {
+            'partidas': self.partidas,
+            'media': self.media,
+            'desviacion': self.desviacion,
+            'intervalo_95': [self.media - self.semiancho, self.media + self.semiancho],
+            'percentiles': {str(p): self.percentil(p) for p in (5, 25, 50, 75, 95, 99)},
+            'distribucion': {str(disparos): cantidad for disparos, cantidad in sorted(self.frecuencias.items())},
+        }
+
+
+def _ruta_cache(directorio, ancho, alto, num_naves, estrategia, flota):
+    nombre = f"{ancho}x{alto}x{num_naves}-{estrategia}"
+    if flota is not None:
+        nombre += "-" + "-".join(str(longitud) for longitud in flota)
+    return os.path.join(directorio, nombre + ".json")
+
+
+def _leer_cache(ruta, precision):
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            resultado = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Solo sirve si se calculó con al menos la precisión pedida
+    precision_cache = resultado.get('precision')
+    return resultado if precision_cache is not None and precision_cache <= precision else None
+
+
+def _escribir_cache(ruta, resultado):
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    temporal = ruta + ".tmp"
+    with open(temporal, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+    os.replace(temporal, ruta)
+
+
+def estimar_disparos(ancho, alto, num_naves, estrategia='aleatoria', flota=None, precision=0.005,
+                     minimo=2000, maximo=1000000, lote=500, procesos=None, semilla=None,
+                     directorio_cache=DIRECTORIO_CACHE):
+    """Estima la distribución de disparos para ganar con simulaciones de Monte Carlo.
+
+    Reparte lotes de `lote` partidas entre `procesos` procesos y se detiene
+    cuando el semiancho del intervalo de confianza del 95 % de la media cae
+    por debajo de `precision` veces la media (o al llegar a `maximo`
+    partidas). El resultado se guarda en `directorio_cache` por
+    configuración; directorio_cache=None desactiva la cache.
+    """
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia desconocida: {estrategia}")
+    if precision <= 0 or lote <= 0 or maximo < minimo:
+        raise ValueError("Parámetros de simulación inválidos")
+    # Valida la configuración antes de lanzar procesos
+    Campo(ancho, alto, num_naves, 0, flota)
+
+    ruta = None
+    if directorio_cache is not None:
+        ruta = _ruta_cache(directorio_cache, ancho, alto, num_naves, estrategia, flota)
+        resultado = _leer_cache(ruta, precision)
+        if resultado is not None:
+            return resultado
+
+    semilla = semilla if semilla is not None else random.getrandbits(32)
+    procesos = procesos or os.cpu_count() or 1
+    distribucion = Distribucion()
+
+    def convergio():
+        return distribucion.partidas >= minimo and distribucion.semiancho <= precision * distribucion.media
+
+    argumentos = (ancho, alto, num_naves, estrategia)
+    if procesos == 1:
+        numero_lote = 0
+        while not convergio() and distribucion.partidas < maximo:
+            distribucion.agregar(simular_lote(*argumentos, lote, semilla + numero_lote, flota))
+            numero_lote += 1
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as executor:
+            enviados = 0
+            pendientes = set()
+            while True:
+                # Dos lotes en vuelo por proceso mantienen a todos ocupados sin pasarse mucho de `maximo`
+                while len(pendientes) < 2 * procesos and enviados * lote < maximo:
+                    pendientes.add(executor.submit(simular_lote, *argumentos, lote, semilla + enviados, flota))
+                    enviados += 1
+                if not pendientes:
+                    break
+                listos, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in listos:
+                    distribucion.agregar(futuro.result())
+                if convergio() or distribucion.partidas >= maximo:
+                    for futuro in pendientes:
+                        futuro.cancel()
+                    break
+
+    resultado = {
+        'ancho': ancho,
+        'alto': alto,
+        'num_naves': num_naves,
+        'flota': flota,
+        'estrategia': estrategia,
+        'precision': precision if convergio() else None,
+    }
+    resultado.update(distribucion.como_dict())
+    logger.info("Simulación %s: %d partidas, media %.2f", os.path.basename(ruta or estrategia),
+                distribucion.partidas, distribucion.media)
+
+    if ruta is not None and convergio():
+        _escribir_cache(ruta, resultado)
+    return resultado
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estima cuántos disparos hacen falta para ganar")
+    parser.add_argument("ancho", type=int)
+    parser.add_argument("alto", type=int)
+    parser.add_argument("num_naves", type=int)
+    parser.add_argument("--estrategia", choices=sorted(ESTRATEGIAS), default="aleatoria")
+    parser.add_argument("--flota", type=int, nargs="+", help="Longitud de cada nave")
+    parser.add_argument("--precision", type=float, default=0.005)
+    parser.add_argument("--procesos", type=int)
+    parser.add_argument("--sin-cache", action="store_true")
+    argumentos = parser.parse_args()
+
+    resultado = estimar_disparos(
+        argumentos.ancho, argumentos.alto, argumentos.num_naves, argumentos.estrategia, argumentos.flota,
+        argumentos.precision, procesos=argumentos.procesos,
+        directorio_cache=None if argumentos.sin_cache else DIRECTORIO_CACHE
+    )
+    print(f"Partidas simuladas: {resultado['partidas']}")
+    print(f"Media: {resultado['media']:.2f} disparos "
+          f"(IC 95 %: {resultado['intervalo_95'][0]:.2f} - {resultado['intervalo_95'][1]:.2f})")
+    print("Percentiles: " + ", ".join(f"p{p}={v}" for p, v in resultado['percentiles'].items()))
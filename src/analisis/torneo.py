@@ -0,0 +1,305 @@
+import argparse
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from src.analisis.simulador import ESTRATEGIAS
+from src.model.campo import Campo
+from src.model.sistema_usuario import SistemaUsuario
+from src.utilidades.logs import obtener_logger
+
+RUTA_CHECKPOINT = os.path.join('datos', 'torneo.json')
+
+ELO_INICIAL = 1500
+FACTOR_K = 16
+PUNTOS_VICTORIA = 10
+
+logger = obtener_logger('torneo')
+
+
+def jugar_partida(estrategia_a, estrategia_b, ancho, alto, num_naves, semilla):
+    """Ambos bots juegan el mismo tablero; gana el que necesita menos disparos.
+
+    Devuelve 1 si gana A, 0 si gana B y 0.5 en caso de empate.
+    """
+    disparos = []
+    for desplazamiento, estrategia in enumerate((estrategia_a, estrategia_b)):
+        campo = Campo(ancho, alto, num_naves, semilla)
+        disparos.append(ESTRATEGIAS[estrategia](campo, random.Random(semilla * 2 + desplazamiento)))
+
+    if disparos[0] == disparos[1]:
+        return 0.5
+    return 1.0 if disparos[0] < disparos[1] else 0.0
+
+
+def jugar_bloque(partidas, ancho, alto, num_naves):
+    """Unidad de trabajo de los procesos: juega [(estrategia_a, estrategia_b, semilla), ...] en orden."""
+    return [jugar_partida(a, b, ancho, alto, num_naves, semilla) for a, b, semilla in partidas]
+
+
+def esperado(elo_a, elo_b):
+    return 1 / (1 + 10 ** ((elo_b - elo_a) / 400))
+
+
+def actualizar_elo(elo, nombre_a, nombre_b, resultado, k=FACTOR_K):
+    """Aplica el resultado de A (1, 0.5 o 0) a las puntuaciones Elo de `elo`."""
+    cambio = k * (resultado - esperado(elo[nombre_a], elo[nombre_b]))
+    elo[nombre_a] += cambio
+    elo[nombre_b] -= cambio
+
+
+def emparejar_todos(nombres, ronda):
+    """Todos contra todos; alterna quién es A para no favorecer a nadie."""
+    parejas = []
+    for i, a in enumerate(nombres):
+        for b in nombres[i + 1:]:
+            parejas.append((a, b) if ronda % 2 == 0 else (b, a))
+    return parejas
+
+
+def emparejar_suizo(nombres, elo, rivales=None, descansos=None):
+    """Empareja vecinos en la clasificación Elo actual sin repetir rivales mientras se pueda.
+
+    `rivales` es nombre -> nombres ya enfrentados y `descansos` nombre ->
+    rondas sin jugar. Con un número impar descansa el peor clasificado entre
+    los que menos descansaron, así el descanso rota.
+    """
+    rivales = rivales or {}
+    descansos = descansos or {}
+    ordenados = sorted(nombres, key=lambda nombre: (-elo[nombre], nombre))
+    if len(ordenados) % 2:
+        # min() se queda con el primero: recorriendo al revés, el peor clasificado
+        ordenados.remove(min(reversed(ordenados), key=lambda nombre: descansos.get(nombre, 0)))
+
+    parejas = _emparejar_sin_repetir(ordenados, rivales)
+    if parejas is None:
+        # Ya se enfrentaron todos los emparejamientos posibles: se vuelve a jugar por vecinos
+        parejas = [(ordenados[i], ordenados[i + 1]) for i in range(0, len(ordenados) - 1, 2)]
+    return parejas
+
+
+def _emparejar_sin_repetir(ordenados, rivales):
+    """Empareja al primero con el mejor clasificado que no haya enfrentado, retrocediendo si no se puede."""
+    if not ordenados:
+        return []
+
+    primero, resto = ordenados[0], ordenados[1:]
+    for i, rival in enumerate(resto):
+        if rival in rivales.get(primero, ()):
+            continue
+        parejas = _emparejar_sin_repetir(resto[:i] + resto[i + 1:], rivales)
+        if parejas is not None:
+            return [(primero, rival)] + parejas
+    return None
+
+
+class Torneo:
+    """Torneo entre bots registrados como jugadores de SistemaUsuario.
+
+    Cada ronda juega `partidas_por_pareja` partidas por emparejamiento
+    (todos contra todos o suizo), repartidas en bloques entre `procesos`
+    procesos. Al terminar la ronda aplica los resultados al Elo en el orden
+    del calendario, registra las victorias con una sola escritura en lote y
+    guarda un checkpoint JSON; al reanudar con el mismo checkpoint se
+    continúa en la ronda siguiente con exactamente los mismos resultados.
+    El checkpoint de la ronda se guarda antes de escribir sus victorias, así
+    que reanudar nunca las registra dos veces: si el proceso cae durante esa
+    escritura, las victorias de esa ronda pueden perderse (se avisa en el log).
+    """
+
+    def __init__(self, sistema_usuario, bots=None, formato='todos', rondas=10, partidas_por_pareja=100,
+                 ancho=10, alto=10, num_naves=5, procesos=1, semilla=0, ruta_checkpoint=RUTA_CHECKPOINT,
+                 contraseña_bots='bot'):
+        if formato not in ('todos', 'suizo'):
+            raise ValueError(f"Formato de torneo desconocido: {formato}")
+
+        self.bots = dict(bots) if bots else {f"bot_{nombre}": nombre for nombre in ESTRATEGIAS}
+        for estrategia in self.bots.values():
+            if estrategia not in ESTRATEGIAS:
+                raise ValueError(f"Estrategia desconocida: {estrategia}")
+        if len(self.bots) < 2:
+            raise ValueError("Un torneo necesita al menos dos bots")
+
+        Campo(ancho, alto, num_naves, 0)
+        self.sistema_usuario = sistema_usuario
+        self.formato = formato
+        self.rondas = rondas
+        self.partidas_por_pareja = partidas_por_pareja
+        self.ancho = ancho
+        self.alto = alto
+        self.num_naves = num_naves
+        self.procesos = procesos
+        self.semilla = semilla
+        self.ruta_checkpoint = ruta_checkpoint
+        self.contraseña_bots = contraseña_bots
+
+        self.ronda = 0
+        self.elo = {nombre: float(ELO_INICIAL) for nombre in self.bots}
+        self.estadisticas = {nombre: {'ganadas': 0, 'perdidas': 0, 'empates': 0} for nombre in self.bots}
+        self.rivales = {nombre: [] for nombre in self.bots}
+        self.descansos = {nombre: 0 for nombre in self.bots}
+        # Ronda cuyas victorias se están escribiendo; None fuera de esa escritura
+        self.registrando = None
+        self.jugadores = {}
+
+        self._cargar_checkpoint()
+
+    def _configuracion(self):
+        return {
+            'bots': self.bots,
+            'formato': self.formato,
+            'partidas_por_pareja': self.partidas_por_pareja,
+            'ancho': self.ancho,
+            'alto': self.alto,
+            'num_naves': self.num_naves,
+            'semilla': self.semilla,
+        }
+
+    def _cargar_checkpoint(self):
+        if not self.ruta_checkpoint or not os.path.exists(self.ruta_checkpoint):
+            return
+
+        with open(self.ruta_checkpoint, 'r', encoding='utf-8') as f:
+            datos = json.load(f)
+        if datos['configuracion'] != self._configuracion():
+            raise ValueError("El checkpoint pertenece a un torneo con otra configuración")
+
+        self.ronda = datos['ronda']
+        self.elo = datos['elo']
+        self.estadisticas = datos['estadisticas']
+        self.rivales = datos.get('rivales', self.rivales)
+        self.descansos = datos.get('descansos', self.descansos)
+        if datos.get('registrando') is not None:
+            logger.warning("El torneo se interrumpió al registrar las victorias de la ronda %d; "
+                           "no se vuelven a registrar para no duplicarlas", datos['registrando'] + 1)
+        logger.info("Torneo reanudado en la ronda %d", self.ronda)
+
+    def _guardar_checkpoint(self):
+        if not self.ruta_checkpoint:
+            return
+
+        directorio = os.path.dirname(self.ruta_checkpoint)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        temporal = self.ruta_checkpoint + ".tmp"
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump({
+                'configuracion': self._configuracion(),
+                'ronda': self.ronda,
+                'elo': self.elo,
+                'estadisticas': self.estadisticas,
+                'rivales': self.rivales,
+                'descansos': self.descansos,
+                'registrando': self.registrando,
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(temporal, self.ruta_checkpoint)
+
+    def registrar_bots(self):
+        """Registra cada bot como jugador (si no existía) e inicia su sesión para obtener su id."""
+        for nombre in self.bots:
+            self.sistema_usuario.registrar_jugador(nombre, self.contraseña_bots)
+            jugador = self.sistema_usuario.iniciar_sesion(nombre, self.contraseña_bots)
+            if jugador is None:
+                raise ValueError(f"No se pudo iniciar sesión con el bot {nombre}")
+            self.jugadores[nombre] = jugador
+
+    def calendario(self, ronda):
+        """Partidas de la ronda como (nombre_a, nombre_b, semilla), en orden."""
+        nombres = sorted(self.bots)
+        if self.formato == 'todos':
+            parejas = emparejar_todos(nombres, ronda)
+        else:
+            parejas = emparejar_suizo(nombres, self.elo, self.rivales, self.descansos)
+
+        aleatorio = random.Random(f"{self.semilla}-{ronda}")
+        return [(a, b, aleatorio.getrandbits(32)) for a, b in parejas for _ in range(self.partidas_por_pareja)]
+
+    def _jugar(self, partidas, executor):
+        trabajos = [(self.bots[a], self.bots[b], semilla) for a, b, semilla in partidas]
+        if executor is None:
+            return jugar_bloque(trabajos, self.ancho, self.alto, self.num_naves)
+
+        # Unos cuatro bloques por proceso: reparto parejo sin pagar el envío partida a partida
+        tamaño = max(1, -(-len(trabajos) // (self.procesos * 4)))
+        bloques = [trabajos[i:i + tamaño] for i in range(0, len(trabajos), tamaño)]
+        futuros = [executor.submit(jugar_bloque, bloque, self.ancho, self.alto, self.num_naves) for bloque in bloques]
+        return [resultado for futuro in futuros for resultado in futuro.result()]
+
+    def _aplicar_ronda(self, partidas, resultados):
+        """Aplica los resultados al Elo y las estadísticas y devuelve las victorias a registrar."""
+        sin_jugar = set(self.bots)
+        for a, b, _ in partidas:
+            if b not in self.rivales[a]:
+                self.rivales[a].append(b)
+                self.rivales[b].append(a)
+            sin_jugar -= {a, b}
+        for nombre in sin_jugar:
+            self.descansos[nombre] += 1
+
+        victorias = []
+        for (a, b, _), resultado in zip(partidas, resultados):
+            actualizar_elo(self.elo, a, b, resultado)
+            if resultado == 0.5:
+                self.estadisticas[a]['empates'] += 1
+                self.estadisticas[b]['empates'] += 1
+                continue
+            ganador, perdedor = (a, b) if resultado == 1.0 else (b, a)
+            self.estadisticas[ganador]['ganadas'] += 1
+            self.estadisticas[perdedor]['perdidas'] += 1
+            if ganador in self.jugadores:
+                victorias.append((self.jugadores[ganador], PUNTOS_VICTORIA))
+        return victorias
+
+    def ejecutar(self):
+        """Juega las rondas pendientes y devuelve la clasificación [(nombre, elo), ...]."""
+        if not self.jugadores:
+            self.registrar_bots()
+
+        executor = ProcessPoolExecutor(max_workers=self.procesos) if self.procesos > 1 else None
+        try:
+            while self.ronda < self.rondas:
+                partidas = self.calendario(self.ronda)
+                victorias = self._aplicar_ronda(partidas, self._jugar(partidas, executor))
+
+                # Primero el checkpoint: una caída durante la escritura no repite la ronda
+                self.registrando = self.ronda
+                self.ronda += 1
+                self._guardar_checkpoint()
+                if victorias:
+                    self.sistema_usuario.actualizar_puntuaciones(victorias)
+                self.registrando = None
+                self._guardar_checkpoint()
+                logger.info("Ronda %d/%d terminada (%d partidas)", self.ronda, self.rondas, len(partidas))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return self.clasificacion()
+
+    def clasificacion(self):
+        return sorted(self.elo.items(), key=lambda item: (-item[1], item[0]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Torneo de bots de Batalla Naval con clasificación Elo")
+    parser.add_argument("--formato", choices=["todos", "suizo"], default="todos")
+    parser.add_argument("--rondas", type=int, default=10)
+    parser.add_argument("--partidas", type=int, default=100, help="Partidas por pareja y ronda")
+    parser.add_argument("--tablero", type=int, nargs=3, default=[10, 10, 5], metavar=("ANCHO", "ALTO", "NAVES"))
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--checkpoint", default=RUTA_CHECKPOINT)
+    parser.add_argument("--almacenamiento", choices=["auto", "postgres", "json", "memoria"])
+    argumentos = parser.parse_args()
+
+    config = {'backend': argumentos.almacenamiento} if argumentos.almacenamiento else None
+    torneo = Torneo(
+        SistemaUsuario(config), formato=argumentos.formato, rondas=argumentos.rondas,
+        partidas_por_pareja=argumentos.partidas, ancho=argumentos.tablero[0], alto=argumentos.tablero[1],
+        num_naves=argumentos.tablero[2], procesos=argumentos.procesos, semilla=argumentos.semilla,
+        ruta_checkpoint=argumentos.checkpoint
+    )
+    for posicion, (nombre, elo) in enumerate(torneo.ejecutar(), 1):
+        estadisticas = torneo.estadisticas[nombre]
+        print(f"{posicion}. {nombre}: {elo:.0f} "
+              f"({estadisticas['ganadas']}G {estadisticas['empates']}E {estadisticas['perdidas']}P)")
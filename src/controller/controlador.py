@@ -1,46 +1,230 @@
 from src.model.sistema_usuario import SistemaUsuario
+from src.controller.eventos import (BusEventos, DisparoDeshecho, DisparoResuelto, JuegoGanado, JuegoIniciado,
+                                    NaveHundida, PuntuacionRegistrada, RespaldoActivado)
 from src.model.juego import Juego
 from src.model.puntuaciones import Puntuaciones
+from src.model.instantanea import guardar_campo, cargar_campo
+from src.utilidades.metricas import REGISTRO, cronometrar
+import os
+import random
+
+_DISPARO = REGISTRO.histograma('batalla_naval_disparo_segundos', 'Duración de Controlador.realizar_disparo')
+_PUNTUACIONES = REGISTRO.histograma('batalla_naval_controlador_puntuaciones_segundos', 'Duración de Controlador.obtener_puntuaciones')
+_IMPACTOS = REGISTRO.contador('batalla_naval_impactos_total', 'Disparos que alcanzaron una nave')
+_SALVA = REGISTRO.histograma('batalla_naval_salva_segundos', 'Duración de Controlador.realizar_salva')
+
+PUNTOS_VICTORIA = 10
+# Por cada impacto de una salva que alcanza al menos dos celdas con nave
+PUNTOS_IMPACTO_SALVA = 2
+
+RUTA_PARTIDA = os.path.join('datos', 'partida.bnav')
 
 class Controlador:
     def __init__(self):
+        # Antes que sistema_usuario: su setter suscribe el controlador a los respaldos
+        self.eventos = BusEventos()
+        self._sistema_usuario = None
         self.sistema_usuario = SistemaUsuario()
         self.juego = None
         self.jugador_activo = None
         self.puntuaciones = None
+        self.bitacora = None
+        self._grabando = False
+        self.pool_tableros = None
+        # Último nodo del historial que sumó puntos: deshacerlo los dejaría registrados de más
+        self._jugada_puntuada = None
+        self.ejecutor_puntuaciones = None
+        self.al_registrar_puntuacion = None
+
+    @property
+    def sistema_usuario(self):
+        return self._sistema_usuario
+
+    @sistema_usuario.setter
+    def sistema_usuario(self, sistema):
+        if self._sistema_usuario is not None:
+            self._sistema_usuario.quitar_observador_respaldo(self._respaldo_activado)
+        self._sistema_usuario = sistema
+        if sistema is not None:
+            sistema.agregar_observador_respaldo(self._respaldo_activado)
+
+    def _respaldo_activado(self, operacion, backend, error):
+        self.eventos.publicar(RespaldoActivado(operacion, backend, str(error)))
 
     def registrar_jugador(self, nombre, contraseña):
         return self.sistema_usuario.registrar_jugador(nombre, contraseña)
 
     def iniciar_sesion(self, nombre, contraseña):
-        jugador = self.sistema_usuario.iniciar_sesion(nombre, contraseña)
+        return self.establecer_jugador_activo(self.sistema_usuario.iniciar_sesion(nombre, contraseña))
+
+    def establecer_jugador_activo(self, jugador):
+        """Activa un jugador ya autenticado (p. ej. en un hilo de fondo). Devuelve False si es None."""
         if jugador:
             self.jugador_activo = jugador
             self.puntuaciones = Puntuaciones(jugador, self.sistema_usuario.session, self.sistema_usuario)
             return True
         return False
 
-    def iniciar_juego(self, ancho, alto, num_naves):
-        self.juego = Juego(ancho, alto, num_naves)
+    def usar_ejecutor_puntuaciones(self, ejecutor, al_registrar=None):
+        """Registra las puntuaciones con un EjecutorTareas en lugar de bloquear quien dispara.
+
+        al_registrar(puntaje) se llama, por medio del ejecutor, al terminar cada escritura.
+        """
+        self.ejecutor_puntuaciones = ejecutor
+        self.al_registrar_puntuacion = al_registrar
+
+    def _registrar_puntos(self, puntos):
+        nombre = self.jugador_activo.nombre_usuario
+
+        def registrada(resultado):
+            if resultado is not None:
+                self.eventos.publicar(PuntuacionRegistrada(nombre, puntos))
+            if self.al_registrar_puntuacion is not None:
+                self.al_registrar_puntuacion(resultado)
+
+        if self.ejecutor_puntuaciones is None:
+            registrada(self.puntuaciones.actualizar_puntuacion(puntos))
+            return
+        self.ejecutor_puntuaciones.enviar(self.puntuaciones.actualizar_puntuacion, puntos, al_terminar=registrada)
+
+    def activar_bitacora(self, bitacora):
+        """Graba en `bitacora` (una BitacoraDisparos) los juegos iniciados a partir de ahora."""
+        self.bitacora = bitacora
+
+    def usar_pool_tableros(self, pool):
+        """Toma los tableros nuevos de un PoolTableros en lugar de generarlos en el momento."""
+        self.pool_tableros = pool
+
+    def _publicar_disparos(self, indices, naves_antes):
+        """Publica el resultado de las celdas recién disparadas, las naves hundidas y la victoria."""
+        if not self.eventos.activo or not indices:
+            return
+        campo = self.juego.campo
+        celdas = []
+        impactadas = []
+        for indice in indices:
+            fila, columna = divmod(indice, campo.ancho)
+            impacto = campo.estado(fila, columna) == 3
+            if impacto:
+                impactadas.append(indice)
+            celdas.append((fila, columna, impacto))
+        self.eventos.publicar(DisparoResuelto(tuple(celdas)))
+
+        if campo.naves_restantes < naves_antes:
+            indice_naves = getattr(campo, 'indice_naves', {})
+            vistas = set()
+            for indice in impactadas:
+                nave = indice_naves.get(indice)
+                if nave is None:
+                    # Campo disperso o celda marcada a mano: nave de una celda
+                    self.eventos.publicar(NaveHundida((divmod(indice, campo.ancho),)))
+                elif nave.hundida and id(nave) not in vistas:
+                    vistas.add(id(nave))
+                    self.eventos.publicar(NaveHundida(tuple(sorted(nave.posicion))))
+
+        if naves_antes and campo.naves_restantes == 0:
+            self.eventos.publicar(JuegoGanado(campo.jugada.profundidad if campo.jugada else 0))
+
+    def _publicar_inicio(self):
+        self._jugada_puntuada = None
+        if self.eventos.activo:
+            self.eventos.publicar(JuegoIniciado(self.juego.ancho, self.juego.alto, self.juego.num_naves))
+
+    def _nueva_semilla(self):
+        if self.bitacora is None:
+            return None
+        return random.getrandbits(32)
+
+    def iniciar_juego(self, ancho, alto, num_naves, disperso=False, flota=None):
+        if self.pool_tableros is not None and not disperso and flota is None:
+            self.juego = Juego.desde_campo(self.pool_tableros.obtener(ancho, alto, num_naves))
+        else:
+            self.juego = Juego(ancho, alto, num_naves, self._nueva_semilla(), disperso, flota)
+        self._grabar_inicio(self.juego.campo.semilla)
+        self._publicar_inicio()
 
+    def _grabar_inicio(self, semilla):
+        # La bitácora solo reproduce campos densos con naves de una celda
+        self._grabando = (self.bitacora is not None and semilla is not None
+                          and self.juego.flota is None and hasattr(self.juego.campo, 'celdas'))
+        if self._grabando:
+            self.bitacora.iniciar_juego(semilla, self.juego.ancho, self.juego.alto, self.juego.num_naves)
+
+    @cronometrar(_DISPARO)
     def realizar_disparo(self, fila, columna):
         if not self.juego:
             raise ValueError("No hay un juego activo")
+        # Un juego ganado ya sumó sus puntos: otro disparo los volvería a registrar
+        if self.juego_terminado():
+            raise ValueError("El juego ya terminó")
 
+        naves_antes = self.juego.campo.naves_restantes
         impacto = self.juego.realizar_disparo(fila, columna)
+        if impacto:
+            _IMPACTOS.incrementar()
+
+        if self._grabando:
+            self.bitacora.registrar_disparo(fila, columna)
+
+        self._publicar_disparos((fila * self.juego.campo.ancho + columna,), naves_antes)
 
         if self.juego.verificar_ganador() and self.jugador_activo and self.puntuaciones:
-            self.puntuaciones.actualizar_puntuacion(10)
+            self._registrar_puntos(PUNTOS_VICTORIA)
 
         return impacto
 
-    def obtener_puntuaciones(self, limite=10):
+    @cronometrar(_SALVA)
+    def realizar_salva(self, arma, fila, columna):
+        """Dispara un arma de área. Devuelve (impactos, naves_hundidas)."""
+        if not self.juego:
+            raise ValueError("No hay un juego activo")
+        if self.juego_terminado():
+            raise ValueError("El juego ya terminó")
+
+        campo = self.juego.campo
+        jugada_antes = campo.jugada
+        naves_antes = campo.naves_restantes
+
+        impactos, hundidas = self.juego.disparar_salva(arma, fila, columna)
+        if impactos:
+            _IMPACTOS.incrementar(impactos)
+        # La salva es un solo nodo del historial con sus celdas nuevas
+        nuevas = campo.jugada.indices if campo.jugada is not jugada_antes else ()
+
+        if self._grabando:
+            for indice in nuevas:
+                self.bitacora.registrar_disparo(*divmod(indice, self.juego.ancho))
+        self._publicar_disparos(nuevas, naves_antes)
+
+        if self.jugador_activo and self.puntuaciones:
+            puntos = PUNTOS_IMPACTO_SALVA * impactos if impactos >= 2 else 0
+            if self.juego.verificar_ganador():
+                puntos += PUNTOS_VICTORIA
+            if puntos:
+                self._jugada_puntuada = campo.jugada
+                self._registrar_puntos(puntos)
+
+        return impactos, hundidas
+
+    @cronometrar(_PUNTUACIONES)
+    def obtener_puntuaciones(self, limite=10, desplazamiento=0):
         if self.puntuaciones:
-            return self.puntuaciones.mostrar_puntuaciones(limite)
+            return self.puntuaciones.mostrar_puntuaciones(limite, desplazamiento)
         elif self.sistema_usuario:
-            return self.sistema_usuario.obtener_puntuaciones(limite)
+            return self.sistema_usuario.obtener_puntuaciones(limite, desplazamiento)
         return []
 
+    def contar_puntuaciones(self):
+        if self.sistema_usuario:
+            return self.sistema_usuario.contar_puntuaciones()
+        return 0
+
+    def buscar_en_clasificacion(self, nombre_usuario):
+        """Devuelve el índice (desde 0) de la mejor puntuación del jugador, o None."""
+        if self.sistema_usuario:
+            return self.sistema_usuario.indice_en_clasificacion(nombre_usuario)
+        return None
+
     def obtener_representacion_tablero(self):
         if self.juego:
             return self.juego.campo.mostrar_campo()
@@ -48,10 +232,53 @@ class Controlador:
 
     def reiniciar_juego(self):
         if self.juego:
-            self.juego.reiniciar_juego()
+            if self.pool_tableros is not None and self.juego.flota is None and hasattr(self.juego.campo, 'celdas'):
+                self.juego.campo = self.pool_tableros.obtener(self.juego.ancho, self.juego.alto, self.juego.num_naves)
+            else:
+                self.juego.reiniciar_juego(self._nueva_semilla())
+            self._grabar_inicio(self.juego.campo.semilla)
+            self._publicar_inicio()
             return True
         return False
 
+    def deshacer_disparo(self):
+        """Deshace el último disparo o la última salva entera.
+
+        Un juego ganado o una salva que sumó puntos no se deshacen: los puntos
+        ya están registrados y se volverían a sumar al repetir la jugada.
+        """
+        if not self.juego or self.juego_terminado():
+            return False
+        jugada = self.juego.campo.jugada
+        if jugada is not None and jugada is self._jugada_puntuada:
+            return False
+        if not self.juego.deshacer_disparo():
+            return False
+        if self.eventos.activo:
+            ancho = self.juego.campo.ancho
+            self.eventos.publicar(DisparoDeshecho(tuple(divmod(indice, ancho) for indice in jugada.indices)))
+        # La bitácora no representa disparos deshechos; deja de grabar este juego
+        self._grabando = False
+        return True
+
+    def guardar_partida(self, ruta=RUTA_PARTIDA):
+        if not self.juego:
+            return False
+        guardar_campo(self.juego.campo, ruta)
+        return True
+
+    def hay_partida_guardada(self, ruta=RUTA_PARTIDA):
+        return os.path.exists(ruta)
+
+    def reanudar_partida(self, ruta=RUTA_PARTIDA):
+        if not os.path.exists(ruta):
+            return False
+        self.juego = Juego.desde_campo(cargar_campo(ruta))
+        # Una partida reanudada no tiene semilla: no se puede grabar en la bitácora
+        self._grabando = False
+        self._publicar_inicio()
+        return True
+
     def juego_terminado(self):
         if self.juego:
             return self.juego.verificar_ganador() is not None
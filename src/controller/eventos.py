@@ -0,0 +1,165 @@
+import asyncio
+from src.utilidades.logs import obtener_logger
+
+logger = obtener_logger('eventos')
+
+
+class Evento:
+    """Base de los eventos del controlador. Los campos son los __slots__ de cada subclase."""
+
+    __slots__ = ()
+    tipo = 'evento'
+
+    def __init__(self, *valores):
+        for campo, valor in zip(self.__slots__, valores, strict=True):
+            setattr(self, campo, valor)
+
+    def a_dict(self):
+        """Representación serializable, p. ej. para enviarla por una sesión de red."""
+        datos = {'tipo': self.tipo}
+        for campo in self.__slots__:
+            datos[campo] = getattr(self, campo)
+        return datos
+
+    def __eq__(self, otro):
+        return type(otro) is type(self) and all(getattr(self, c) == getattr(otro, c) for c in self.__slots__)
+
+    def __repr__(self):
+        campos = ", ".join(f"{c}={getattr(self, c)!r}" for c in self.__slots__)
+        return f"{type(self).__name__}({campos})"
+
+
+class JuegoIniciado(Evento):
+    """Tablero nuevo, reiniciado o reanudado: los renderizadores deben recargarlo entero."""
+    __slots__ = ('ancho', 'alto', 'num_naves')
+    tipo = 'inicio'
+
+
+class DisparoResuelto(Evento):
+    """`celdas` son las (fila, columna, impacto) recién disparadas: una por disparo, todas las de una salva."""
+    __slots__ = ('celdas',)
+    tipo = 'disparo'
+
+
+class DisparoDeshecho(Evento):
+    """`celdas` son las (fila, columna) que volvieron a quedar sin disparar."""
+    __slots__ = ('celdas',)
+    tipo = 'deshecho'
+
+
+class NaveHundida(Evento):
+    """`celdas` son las coordenadas (fila, columna) de la nave, ordenadas."""
+    __slots__ = ('celdas',)
+    tipo = 'hundida'
+
+
+class JuegoGanado(Evento):
+    __slots__ = ('disparos',)
+    tipo = 'ganado'
+
+
+class PuntuacionRegistrada(Evento):
+    __slots__ = ('jugador', 'puntos')
+    tipo = 'puntuacion'
+
+
+class RespaldoActivado(Evento):
+    """El backend principal falló en `operacion` y se reintentó con JSON."""
+    __slots__ = ('operacion', 'backend', 'error')
+    tipo = 'respaldo'
+
+
+class BusEventos:
+    """Reparte eventos a funciones suscritas y a flujos asíncronos.
+
+    Sin suscriptores, publicar no hace nada, así que el controlador puede
+    comprobar `activo` antes de construir eventos. Un suscriptor que falla
+    se registra en el log y no interrumpe al resto ni a quien publica.
+    """
+
+    def __init__(self):
+        self._suscriptores = []
+
+    @property
+    def activo(self):
+        return bool(self._suscriptores)
+
+    def suscribir(self, funcion, tipos=None):
+        """Llama a funcion(evento) por cada evento de las clases `tipos` (todas si es None)."""
+        tipos = tuple(tipos) if tipos is not None else None
+        # Se reemplaza la lista: publicar recorre la anterior sin bloqueos aunque otro hilo suscriba
+        self._suscriptores = [s for s in self._suscriptores if s[0] != funcion] + [(funcion, tipos)]
+        return funcion
+
+    def desuscribir(self, funcion):
+        self._suscriptores = [s for s in self._suscriptores if s[0] != funcion]
+
+    def publicar(self, evento):
+        for funcion, tipos in self._suscriptores:
+            if tipos is not None and not isinstance(evento, tipos):
+                continue
+            try:
+                funcion(evento)
+            except Exception as e:
+                logger.error("Suscriptor %r falló con %s: %s", funcion, evento, e, exc_info=True)
+
+    def flujo(self, tipos=None, capacidad=1024):
+        """Devuelve un FlujoEventos para `async for`; debe llamarse dentro del bucle que lo consume."""
+        return FlujoEventos(self, tipos, capacidad)
+
+
+class FlujoEventos:
+    """Iterador asíncrono sobre los eventos de un BusEventos.
+
+    Los eventos se pueden publicar desde cualquier hilo: llegan a la cola
+    del bucle con call_soon_threadsafe. Si el consumidor se atrasa más de
+    `capacidad` eventos se descartan los más viejos y se cuentan en
+    `perdidos`. Termina al llamar a cerrar() o al salir del `async with`.
+    """
+
+    _FIN = object()
+
+    def __init__(self, bus, tipos=None, capacidad=1024):
+        self.bus = bus
+        self.perdidos = 0
+        self._bucle = asyncio.get_running_loop()
+        self._cola = asyncio.Queue(capacidad)
+        self._cerrado = False
+        bus.suscribir(self._recibir, tipos)
+
+    def _recibir(self, evento):
+        try:
+            self._bucle.call_soon_threadsafe(self._encolar, evento)
+        except RuntimeError:
+            # El bucle ya se cerró: nadie va a consumir el flujo
+            self.bus.desuscribir(self._recibir)
+
+    def _encolar(self, evento):
+        if self._cola.full():
+            self._cola.get_nowait()
+            self.perdidos += 1
+        self._cola.put_nowait(evento)
+
+    def cerrar(self):
+        if self._cerrado:
+            return
+        self._cerrado = True
+        self.bus.desuscribir(self._recibir)
+        self._bucle.call_soon_threadsafe(self._encolar, self._FIN)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        evento = await self._cola.get()
+        if evento is self._FIN:
+            # Deja la marca para que las siguientes esperas también terminen
+            self._cola.put_nowait(evento)
+            raise StopAsyncIteration
+        return evento
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *excepcion):
+        self.cerrar()
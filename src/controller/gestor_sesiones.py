@@ -0,0 +1,264 @@
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from src.model.campo_compacto import CampoCompacto
+from src.model.instantanea import codificar_campo, decodificar_campo
+from src.model.juego import Juego
+from src.utilidades.logs import obtener_logger
+from src.utilidades.metricas import REGISTRO
+
+logger = obtener_logger('sesiones')
+
+_ID_VALIDO = re.compile(r'[A-Za-z0-9_-]{1,64}')
+
+_SESIONES = REGISTRO.medidor('batalla_naval_sesiones_en_memoria', 'Juegos cargados en GestorSesiones')
+_EXPULSADAS = REGISTRO.contador('batalla_naval_sesiones_expulsadas_total', 'Juegos expulsados por TTL o LRU')
+
+
+def serializar_juego(juego):
+    """Serializa un juego con el formato binario de instantáneas (planos de bits)."""
+    return codificar_campo(juego.campo)
+
+
+def deserializar_juego(datos, compacto=False):
+    campo = decodificar_campo(datos)
+    return Juego.desde_campo(CampoCompacto.desde_campo(campo) if compacto else campo)
+
+
+def _compactar(juego):
+    if not hasattr(juego.campo, 'celdas'):
+        return juego
+    return Juego.desde_campo(CampoCompacto.desde_campo(juego.campo))
+
+
+class _Sesion:
+    __slots__ = ('juego', 'lock', 'ultimo_acceso', 'expulsada')
+
+    def __init__(self, juego, ahora):
+        self.juego = juego
+        self.lock = threading.Lock()
+        self.ultimo_acceso = ahora
+        # Se marca bajo `lock` al expulsarla o eliminarla: quien la tenga debe volver a pedirla al gestor
+        self.expulsada = False
+
+
+class _Recuperacion:
+    __slots__ = ('lock', 'esperando')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.esperando = 0
+
+
+class GestorSesiones:
+    """Mantiene muchos juegos simultáneos indexados por id de sesión.
+
+    Las sesiones inactivas más de `ttl` segundos, o las menos usadas cuando se
+    supera `max_sesiones`, se expulsan de memoria cada vez que se crea o se
+    pide una sesión (o con expulsar_inactivas). Si hay `directorio_derrame`,
+    los juegos expulsados se guardan allí como instantáneas binarias y se
+    recuperan al volver a pedirlos; si no se pueden guardar, siguen en memoria.
+    Cada sesión tiene su propio lock, así que los disparos en juegos distintos
+    no compiten entre sí; un disparo que llega mientras su sesión se expulsa
+    espera a que se derrame y se aplica sobre el juego recuperado. Con `pool`
+    (un PoolTableros) los juegos nuevos toman tableros ya generados.
+    Con `compacto` los campos densos se guardan en memoria como CampoCompacto
+    (buffers planos en lugar de listas de listas y objetos Nave), a cambio de
+    no tener historial para deshacer disparos.
+    """
+
+    def __init__(self, max_sesiones=10000, ttl=1800, directorio_derrame=None, reloj=time.monotonic, pool=None,
+                 compacto=False):
+        if max_sesiones <= 0:
+            raise ValueError("max_sesiones debe ser positivo")
+
+        self.max_sesiones = max_sesiones
+        self.ttl = ttl
+        self.directorio_derrame = directorio_derrame
+        self.reloj = reloj
+        self.pool = pool
+        self.compacto = compacto
+
+        self._sesiones = OrderedDict()
+        # Sesiones ya sacadas de _sesiones cuyo archivo de derrame todavía no está escrito
+        self._derramando = {}
+        # Una sola recuperación desde disco por id; el resto espera y la encuentra en memoria
+        self._recuperando = {}
+        self._lock = threading.Lock()
+
+        if directorio_derrame:
+            os.makedirs(directorio_derrame, exist_ok=True)
+
+    def __len__(self):
+        return len(self._sesiones)
+
+    def __contains__(self, id_sesion):
+        ruta = self._ruta_derrame(id_sesion)
+        return (id_sesion in self._sesiones or id_sesion in self._derramando
+                or (ruta is not None and os.path.exists(ruta)))
+
+    def crear_sesion(self, ancho, alto, num_naves, id_sesion=None):
+        if self.pool is not None:
+            juego = Juego.desde_campo(self.pool.obtener(ancho, alto, num_naves))
+        else:
+            juego = Juego(ancho, alto, num_naves)
+        return self.agregar_sesion(juego, id_sesion)
+
+    def agregar_sesion(self, juego, id_sesion=None):
+        id_sesion = id_sesion or uuid.uuid4().hex
+        if not _ID_VALIDO.fullmatch(id_sesion):
+            raise ValueError("Id de sesión inválido")
+
+        self._insertar(id_sesion, _compactar(juego) if self.compacto else juego)
+        return id_sesion
+
+    def _insertar(self, id_sesion, juego):
+        ahora = self.reloj()
+        sesion = _Sesion(juego, ahora)
+
+        with self._lock:
+            self._sesiones[id_sesion] = sesion
+            self._sesiones.move_to_end(id_sesion)
+            expulsadas = self._sacar_expulsables(ahora - self.ttl, sesion)
+
+        self._derramar(expulsadas)
+        return sesion
+
+    def _sacar_expulsables(self, limite, conservar=None):
+        """Con self._lock: pasa a _derramando las sesiones que sobran o que no se usan desde `limite`."""
+        expulsadas = []
+        # El OrderedDict está en orden LRU: basta con mirar desde el principio
+        while self._sesiones:
+            id_sesion, sesion = next(iter(self._sesiones.items()))
+            if sesion is conservar or (len(self._sesiones) <= self.max_sesiones and sesion.ultimo_acceso > limite):
+                break
+            self._sesiones.popitem(last=False)
+            self._derramando[id_sesion] = sesion
+            expulsadas.append((id_sesion, sesion))
+        return expulsadas
+
+    def _obtener_sesion(self, id_sesion):
+        with self._lock:
+            sesion = self._sesiones.get(id_sesion)
+            if sesion is not None:
+                ahora = self.reloj()
+                sesion.ultimo_acceso = ahora
+                self._sesiones.move_to_end(id_sesion)
+                expulsadas = self._sacar_expulsables(ahora - self.ttl, sesion)
+            else:
+                sesion = self._derramando.get(id_sesion)
+                if sesion is not None:
+                    # Tomar su lock espera al derrame; al verla expulsada se pide de nuevo
+                    return sesion
+
+                recuperacion = self._recuperando.get(id_sesion)
+                if recuperacion is None:
+                    recuperacion = self._recuperando[id_sesion] = _Recuperacion()
+                recuperacion.esperando += 1
+
+        if sesion is not None:
+            if expulsadas:
+                self._derramar(expulsadas)
+            return sesion
+
+        try:
+            with recuperacion.lock:
+                with self._lock:
+                    sesion = self._sesiones.get(id_sesion) or self._derramando.get(id_sesion)
+                if sesion is not None:
+                    return sesion
+
+                juego = self._recuperar(id_sesion)
+                if juego is None:
+                    raise KeyError(f"Sesión desconocida: {id_sesion}")
+                return self._insertar(id_sesion, juego)
+        finally:
+            with self._lock:
+                recuperacion.esperando -= 1
+                if not recuperacion.esperando:
+                    del self._recuperando[id_sesion]
+
+    def obtener_juego(self, id_sesion):
+        return self._obtener_sesion(id_sesion).juego
+
+    def realizar_disparo(self, id_sesion, fila, columna):
+        return self.ejecutar(id_sesion, lambda juego: juego.realizar_disparo(fila, columna))
+
+    def ejecutar(self, id_sesion, funcion):
+        """Ejecuta funcion(juego) bajo el lock de la sesión."""
+        while True:
+            sesion = self._obtener_sesion(id_sesion)
+            with sesion.lock:
+                if not sesion.expulsada:
+                    return funcion(sesion.juego)
+
+    def eliminar_sesion(self, id_sesion):
+        with self._lock:
+            sesion = self._sesiones.pop(id_sesion, None) or self._derramando.pop(id_sesion, None)
+        _SESIONES.establecer(len(self._sesiones))
+
+        existia = sesion is not None
+        if sesion is not None:
+            # Si se estaba derramando, espera a que termine para borrar también el archivo
+            with sesion.lock:
+                sesion.expulsada = True
+
+        ruta = self._ruta_derrame(id_sesion)
+        if ruta and os.path.exists(ruta):
+            os.remove(ruta)
+            existia = True
+        return existia
+
+    def expulsar_inactivas(self):
+        """Expulsa las sesiones que superaron el TTL. Devuelve cuántas expulsó."""
+        limite = self.reloj() - self.ttl
+        with self._lock:
+            expulsadas = self._sacar_expulsables(limite)
+
+        self._derramar(expulsadas)
+        return len(expulsadas)
+
+    def _ruta_derrame(self, id_sesion):
+        if not self.directorio_derrame or not _ID_VALIDO.fullmatch(id_sesion):
+            return None
+        return os.path.join(self.directorio_derrame, f"{id_sesion}.juego")
+
+    def _derramar(self, expulsadas):
+        _SESIONES.establecer(len(self._sesiones))
+        if not expulsadas:
+            return
+        _EXPULSADAS.incrementar(len(expulsadas))
+
+        for id_sesion, sesion in expulsadas:
+            with sesion.lock:
+                try:
+                    # Ya marcada: se eliminó mientras esperaba su turno
+                    if not sesion.expulsada:
+                        if self.directorio_derrame:
+                            with open(self._ruta_derrame(id_sesion), 'wb') as f:
+                                f.write(serializar_juego(sesion.juego))
+                        sesion.expulsada = True
+                except Exception as e:
+                    logger.error("No se pudo derramar la sesión %s, sigue en memoria: %s", id_sesion, e, exc_info=True)
+                finally:
+                    with self._lock:
+                        if self._derramando.get(id_sesion) is sesion:
+                            del self._derramando[id_sesion]
+                            # Sin archivo, la única copia es esta: vuelve a memoria como la próxima a expulsar
+                            if not sesion.expulsada and id_sesion not in self._sesiones:
+                                self._sesiones[id_sesion] = sesion
+                                self._sesiones.move_to_end(id_sesion, last=False)
+                                _SESIONES.establecer(len(self._sesiones))
+
+    def _recuperar(self, id_sesion):
+        ruta = self._ruta_derrame(id_sesion)
+        if not ruta or not os.path.exists(ruta):
+            return None
+
+        with open(ruta, 'rb') as f:
+            juego = deserializar_juego(f.read(), self.compacto)
+        os.remove(ruta)
+        return juego
@@ -0,0 +1,95 @@
+class Arma:
+    """Tipo de disparo que afecta a un grupo de celdas alrededor del objetivo.
+
+    La huella se da como desplazamientos (fila, columna) respecto del
+    objetivo, o como fila_completa. La máscara de índices relativos y sus
+    tramos de celdas contiguas se calculan una sola vez por recorte de bordes
+    y se reutilizan en todos los disparos; resolver una salva es sumar la base
+    y pasar los tramos a Campo.aplicar_tramos, que los aplica por slices.
+    """
+
+    __slots__ = ('nombre', 'desplazamientos', 'fila_completa', 'alcance', '_mascaras', '_tramos')
+
+    def __init__(self, nombre, desplazamientos=((0, 0),), fila_completa=False):
+        self.nombre = nombre
+        self.desplazamientos = tuple(desplazamientos)
+        self.fila_completa = fila_completa
+        self.alcance = max(max(abs(df), abs(dc)) for df, dc in self.desplazamientos)
+        self._mascaras = {}
+        self._tramos = {}
+
+    def _mascara_relativa(self, ancho, arriba, abajo, izquierda, derecha):
+        clave = (ancho, arriba, abajo, izquierda, derecha)
+        mascara = self._mascaras.get(clave)
+        if mascara is None:
+            mascara = tuple(
+                df * ancho + dc for df, dc in self.desplazamientos
+                if -arriba <= df <= abajo and -izquierda <= dc <= derecha
+            )
+            self._mascaras[clave] = mascara
+        return mascara
+
+    def _tramos_relativos(self, arriba, abajo, izquierda, derecha):
+        clave = (arriba, abajo, izquierda, derecha)
+        tramos = self._tramos.get(clave)
+        if tramos is None:
+            por_fila = {}
+            for df, dc in self.desplazamientos:
+                if -arriba <= df <= abajo and -izquierda <= dc <= derecha:
+                    por_fila.setdefault(df, set()).add(dc)
+
+            tramos = []
+            for df in sorted(por_fila):
+                columnas = sorted(por_fila[df])
+                inicio = anterior = columnas[0]
+                for dc in columnas[1:]:
+                    if dc != anterior + 1:
+                        tramos.append((df, inicio, anterior + 1))
+                        inicio = dc
+                    anterior = dc
+                tramos.append((df, inicio, anterior + 1))
+            tramos = self._tramos[clave] = tuple(tramos)
+        return tramos
+
+    def _recorte(self, ancho, alto, fila, columna):
+        if fila < 0 or fila >= alto or columna < 0 or columna >= ancho:
+            raise ValueError("Coordenadas fuera del tablero")
+        # El recorte solo depende de la distancia a cada borde, acotada por el alcance
+        alcance = self.alcance
+        return (min(fila, alcance), min(alto - 1 - fila, alcance),
+                min(columna, alcance), min(ancho - 1 - columna, alcance))
+
+    def mascara(self, ancho, alto, fila, columna):
+        """Índices (fila * ancho + columna) que cubre la salva, recortados al tablero."""
+        recorte = self._recorte(ancho, alto, fila, columna)
+        if self.fila_completa:
+            return range(fila * ancho, (fila + 1) * ancho)
+
+        relativa = self._mascara_relativa(ancho, *recorte)
+        base = fila * ancho + columna
+        return [base + desplazamiento for desplazamiento in relativa]
+
+    def tramos(self, ancho, alto, fila, columna):
+        """La huella de mascara() como tramos (fila, columna_inicio, columna_fin) de celdas contiguas."""
+        recorte = self._recorte(ancho, alto, fila, columna)
+        if self.fila_completa:
+            return [(fila, 0, ancho)]
+
+        return [(fila + df, columna + inicio, columna + fin)
+                for df, inicio, fin in self._tramos_relativos(*recorte)]
+
+
+ARMAS = {
+    'simple': Arma('simple'),
+    'cruz': Arma('cruz', ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1))),
+    'explosion': Arma('explosion', tuple((df, dc) for df in (-1, 0, 1) for dc in (-1, 0, 1))),
+    'sonar': Arma('sonar', fila_completa=True),
+}
+
+
+def obtener_arma(arma):
+    if isinstance(arma, Arma):
+        return arma
+    if arma not in ARMAS:
+        raise ValueError(f"Arma desconocida: {arma}")
+    return ARMAS[arma]
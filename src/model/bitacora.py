@@ -0,0 +1,113 @@
+from src.model.juego import Juego
+
+# Formato de la bitácora: una secuencia de enteros varint (LEB128 sin signo).
+#   0, semilla, ancho, alto, num_naves   -> comienza un juego
+#   fila * ancho + columna + 1           -> un disparo válido del juego en curso
+# Varios juegos (por ejemplo, reinicios) pueden ir en la misma bitácora.
+MARCA_JUEGO = 0
+
+
+def codificar_varint(numero):
+    if numero < 0:
+        raise ValueError("Los varint solo codifican enteros no negativos")
+
+    resultado = bytearray()
+    while numero > 0x7F:
+        resultado.append((numero & 0x7F) | 0x80)
+        numero >>= 7
+    resultado.append(numero)
+    return bytes(resultado)
+
+
+def leer_varints(datos):
+    """Decodifica todos los varint completos de `datos`; ignora uno truncado al final."""
+    valores = []
+    numero = 0
+    desplazamiento = 0
+
+    for byte in datos:
+        numero |= (byte & 0x7F) << desplazamiento
+        if byte & 0x80:
+            desplazamiento += 7
+        else:
+            valores.append(numero)
+            numero = 0
+            desplazamiento = 0
+
+    return valores
+
+
+class BitacoraDisparos:
+    """Registro binario de solo anexado de los juegos y sus disparos.
+
+    `destino` es una ruta o un archivo binario abierto. Con vaciar_siempre=True
+    cada evento llega al sistema operativo en cuanto se registra, de modo que
+    un cierre inesperado pierde como mucho el disparo en curso.
+    """
+
+    def __init__(self, destino, vaciar_siempre=True):
+        if isinstance(destino, (str, bytes)) or hasattr(destino, '__fspath__'):
+            self.archivo = open(destino, 'ab')
+            self._propio = True
+        else:
+            self.archivo = destino
+            self._propio = False
+
+        self.vaciar_siempre = vaciar_siempre
+        self.ancho = None
+
+    def _escribir(self, datos):
+        self.archivo.write(datos)
+        if self.vaciar_siempre:
+            self.archivo.flush()
+
+    def iniciar_juego(self, semilla, ancho, alto, num_naves):
+        self.ancho = ancho
+        self._escribir(b''.join(codificar_varint(n) for n in (MARCA_JUEGO, semilla, ancho, alto, num_naves)))
+
+    def registrar_disparo(self, fila, columna):
+        if self.ancho is None:
+            raise ValueError("No hay un juego iniciado en la bitácora")
+        self._escribir(codificar_varint(fila * self.ancho + columna + 1))
+
+    def cerrar(self):
+        self.archivo.flush()
+        if self._propio:
+            self.archivo.close()
+
+
+def reproducir(datos):
+    """Reconstruye todos los juegos registrados en `datos`, en orden.
+
+    Cada tablero se regenera con su semilla y los disparos se aplican en
+    bloque con Campo.aplicar_disparos, sin pasar por la validación de un
+    disparo en vivo; en el historial quedan como un solo nodo.
+    """
+    valores = leer_varints(datos)
+    juegos = []
+    i = 0
+
+    while i < len(valores):
+        if valores[i] != MARCA_JUEGO:
+            raise ValueError("Bitácora corrupta: disparo fuera de un juego")
+        if i + 5 > len(valores):
+            break
+
+        semilla, ancho, alto, num_naves = valores[i + 1:i + 5]
+        i += 5
+
+        fin = i
+        while fin < len(valores) and valores[fin] != MARCA_JUEGO:
+            fin += 1
+
+        juego = Juego(ancho, alto, num_naves, semilla)
+        juego.campo.aplicar_disparos([v - 1 for v in valores[i:fin]])
+        juegos.append(juego)
+        i = fin
+
+    return juegos
+
+
+def cargar_bitacora(ruta):
+    with open(ruta, 'rb') as f:
+        return reproducir(f.read())
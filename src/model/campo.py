@@ -1,44 +1,168 @@
 import random
+import re
+from src.model.historial import Jugada, JugadaEnBloque, ruta_entre
+from src.model.nave import Nave
+from src.model.vista import VistaNiebla
+from src.model.zobrist import clave_zobrist, hash_celdas, hash_publico
+
+# Estado de celda -> estado visible para el rival (las naves sin impactar son agua)
+_PUBLICO = bytes.maketrans(bytes([0, 1, 2, 3]), bytes([0, 0, 2, 3]))
+
+# Celdas con nave (intacta o impactada) en un buffer de estados, un byte por celda
+_NAVE = re.compile(rb'[\x01\x03]')
+# Estado tras recibir un disparo: el agua pasa a 2 y la nave a 3; las ya disparadas no cambian
+_DISPARAR = bytes.maketrans(bytes([0, 1]), bytes([2, 3]))
+_SIN_DISPARAR = re.compile(rb'[\x00\x01]')
+_NAVE_INTACTA = re.compile(rb'\x01')
+
+# Intentos por nave antes de dar por imposible colocar una flota de naves largas
+_MAX_INTENTOS = 10000
 
 class Campo:
-    def __init__(self, ancho, alto, num_naves):
+    def __init__(self, ancho, alto, num_naves, semilla=None, flota=None):
         if ancho <= 0 or alto <= 0 or num_naves <= 0:
             raise ValueError("Los parámetros deben ser positivos")
 
         if ancho < 2 or alto < 2:
             raise ValueError("El tamaño mínimo del tablero es 2x2")
 
-        if num_naves > ancho * alto:
+        if flota is not None:
+            if len(flota) != num_naves:
+                raise ValueError("La flota debe tener num_naves naves")
+            if any(longitud <= 0 for longitud in flota):
+                raise ValueError("Las longitudes de las naves deben ser positivas")
+
+        if sum(flota or ()) > ancho * alto or num_naves > ancho * alto:
             raise ValueError("No se pueden colocar más naves que celdas disponibles")
 
         self.ancho = ancho
         self.alto = alto
         self.num_naves = num_naves
         self.naves_restantes = num_naves
+        self.semilla = semilla
+        # Longitud de cada nave; por defecto todas ocupan una celda
+        self.flota = list(flota) if flota is not None else None
 
         self.celdas = [[0 for _ in range(ancho)] for _ in range(alto)]
+        # Plano público de un byte por celda que comparten todas las vistas de niebla
+        self.publico = bytearray(ancho * alto)
+        # Hash de Zobrist del plano público, actualizado en O(1) con cada disparo
+        self.hash_publico = 0
+        # Último disparo del historial (None si no hay); deshacer es recorrerlo hacia atrás
+        self.jugada = None
+        self._vista = None
 
         self.posiciones_naves = []
+        self.naves = []
+        # fila * ancho + columna -> Nave: cada impacto resuelve su nave en O(1)
+        self.indice_naves = {}
+        self.ultima_nave_hundida = None
 
         self.naves_aleatorias()
 
+    @classmethod
+    def desde_celdas(cls, celdas, num_naves, naves=()):
+        """Reconstruye un campo a partir de su matriz de estados sin colocar naves nuevas.
+
+        `naves` son las coordenadas de las naves de más de una celda; las demás
+        celdas con nave se toman como naves de una celda.
+        """
+        campo = cls.__new__(cls)
+        campo.alto = len(celdas)
+        campo.ancho = len(celdas[0]) if celdas else 0
+        campo.num_naves = num_naves
+        campo.semilla = None
+        campo.naves = []
+        campo.indice_naves = {}
+        campo.ultima_nave_hundida = None
+        campo.celdas = celdas
+        estados = b''.join(map(bytes, celdas))
+        campo.publico = bytearray(estados.translate(_PUBLICO))
+        campo.hash_publico = hash_publico(campo.publico)
+        campo.jugada = None
+        campo._vista = None
+        campo.posiciones_naves = [divmod(nave.start(), campo.ancho) for nave in _NAVE.finditer(estados)]
+
+        for coordenadas in naves:
+            campo._indexar_nave(coordenadas)
+        for fila, columna in campo.posiciones_naves:
+            if fila * campo.ancho + columna not in campo.indice_naves:
+                campo._indexar_nave([(fila, columna)])
+
+        campo.flota = [len(nave) for nave in campo.naves] if naves else None
+        campo.naves_restantes = sum(not nave.hundida for nave in campo.naves)
+        return campo
+
+    def _indexar_nave(self, coordenadas):
+        nave = Nave(coordenadas)
+        for fila, columna in coordenadas:
+            estado = self.celdas[fila][columna]
+            if estado not in (1, 3) or fila * self.ancho + columna in self.indice_naves:
+                raise ValueError("Las naves deben ocupar celdas con nave, sin superponerse")
+            if estado == 3:
+                nave.impactos_restantes -= 1
+            self.indice_naves[fila * self.ancho + columna] = nave
+        self.naves.append(nave)
+
     def naves_aleatorias(self):
-        naves_colocadas = 0
+        # Con semilla la colocación es reproducible (bitácoras y repeticiones)
+        aleatorio = random.Random(self.semilla) if self.semilla is not None else random
 
-        while naves_colocadas < self.num_naves:
-            fila = random.randint(0, self.alto - 1)
-            columna = random.randint(0, self.ancho - 1)
+        for longitud in self.flota or [1] * self.num_naves:
+            if longitud == 1:
+                coordenadas = self._posicion_celda_libre(aleatorio)
+            else:
+                coordenadas = self._posicion_nave_larga(aleatorio, longitud)
 
-            if self.celdas[fila][columna] == 0:
+            nave = Nave(coordenadas)
+            self.naves.append(nave)
+            for fila, columna in coordenadas:
                 self.celdas[fila][columna] = 1
+                self.indice_naves[fila * self.ancho + columna] = nave
+            self.posiciones_naves.extend(coordenadas)
+
+    def _posicion_celda_libre(self, aleatorio):
+        while True:
+            fila = aleatorio.randint(0, self.alto - 1)
+            columna = aleatorio.randint(0, self.ancho - 1)
+
+            if self.celdas[fila][columna] == 0:
+                return [(fila, columna)]
+
+    def _posicion_nave_larga(self, aleatorio, longitud):
+        for _ in range(_MAX_INTENTOS):
+            horizontal = aleatorio.random() < 0.5
+            filas_libres = self.alto - (1 if horizontal else longitud)
+            columnas_libres = self.ancho - (longitud if horizontal else 1)
+            if filas_libres < 0 or columnas_libres < 0:
+                continue
 
-                self.posiciones_naves.append((fila, columna))
+            fila = aleatorio.randint(0, filas_libres)
+            columna = aleatorio.randint(0, columnas_libres)
+            if horizontal:
+                coordenadas = [(fila, columna + k) for k in range(longitud)]
+            else:
+                coordenadas = [(fila + k, columna) for k in range(longitud)]
 
-                naves_colocadas += 1
+            if all(self.celdas[f][c] == 0 for f, c in coordenadas):
+                return coordenadas
+
+        raise ValueError(f"No se pudo colocar una nave de longitud {longitud} en el tablero")
 
     def colocar_naves(self):
         self.naves_aleatorias()
 
+    def estado(self, fila, columna):
+        if fila < 0 or fila >= self.alto or columna < 0 or columna >= self.ancho:
+            raise ValueError("Coordenadas fuera del tablero")
+        return self.celdas[fila][columna]
+
+    def vista(self):
+        """Vista de niebla compartida por todos los que observan este campo."""
+        if self._vista is None:
+            self._vista = VistaNiebla(self)
+        return self._vista
+
     def verificar_impacto(self, fila, columna):
         if fila < 0 or fila >= self.alto or columna < 0 or columna >= self.ancho:
             raise ValueError("Coordenadas fuera del tablero")
@@ -46,16 +170,144 @@ class Campo:
         if self.celdas[fila][columna] >= 2:
             raise ValueError("Esta celda ya ha sido impactada")
 
+        indice = fila * self.ancho + columna
+        es_nave = self._aplicar(indice)
+        self.jugada = Jugada(self.jugada, indice)
+        return es_nave
+
+    def _aplicar(self, indice):
+        fila, columna = divmod(indice, self.ancho)
         es_nave = self.celdas[fila][columna] == 1
+        self.ultima_nave_hundida = None
 
         if es_nave:
             self.celdas[fila][columna] = 3
-            self.naves_restantes -= 1
+            self.publico[indice] = 3
+            self.hash_publico ^= clave_zobrist(indice, 3)
+            nave = self.indice_naves.get(indice)
+            # Una celda marcada a mano (sin Nave en el índice) cuenta como nave de una celda
+            if nave is None or nave.recibir_impacto():
+                self.naves_restantes -= 1
+                self.ultima_nave_hundida = nave
         else:
             self.celdas[fila][columna] = 2
+            self.publico[indice] = 2
+            self.hash_publico ^= clave_zobrist(indice, 2)
 
         return es_nave
 
+    def _revertir(self, indice):
+        fila, columna = divmod(indice, self.ancho)
+        estado = self.celdas[fila][columna]
+        self.celdas[fila][columna] = 1 if estado == 3 else 0
+        self.publico[indice] = 0
+        self.hash_publico ^= clave_zobrist(indice, estado)
+
+        if estado == 3:
+            nave = self.indice_naves.get(indice)
+            if nave is None or nave.hundida:
+                self.naves_restantes += 1
+            if nave is not None:
+                nave.impactos_restantes += 1
+
+    def ir_a(self, jugada):
+        """Lleva el campo al estado posterior a `jugada` (None: sin disparos del historial).
+
+        Deshace los disparos hasta el ancestro común y rehace los de la rama
+        de destino, así que cuesta lo que mide ese camino y no el tablero.
+        """
+        deshacer, rehacer = ruta_entre(self.jugada, jugada)
+        for nodo in deshacer:
+            for indice in nodo.indices:
+                self._revertir(indice)
+        for nodo in rehacer:
+            for indice in nodo.indices:
+                self._aplicar(indice)
+        self.jugada = jugada
+        self.ultima_nave_hundida = None
+
+    def aplicar_disparos(self, indices):
+        """Aplica en bloque disparos ya validados, dados como fila * ancho + columna.
+
+        Las celdas ya disparadas se ignoran y las nuevas forman un solo nodo
+        del historial. Devuelve la cantidad de impactos. Sirve para celdas
+        sueltas (p. ej. una bitácora); las salvas usan aplicar_tramos.
+        """
+        celdas = self.celdas
+        ancho = self.ancho
+        publico = self.publico
+        nuevas = []
+        impactadas = []
+
+        for indice in indices:
+            fila = celdas[indice // ancho]
+            columna = indice % ancho
+            estado = fila[columna]
+            if estado < 2:
+                fila[columna] = publico[indice] = estado + 2
+                nuevas.append(indice)
+                if estado == 1:
+                    impactadas.append(indice)
+
+        return self._cerrar_bloque(nuevas, impactadas)
+
+    def aplicar_tramos(self, tramos):
+        """Aplica una salva dada como tramos (fila, columna_inicio, columna_fin) de celdas contiguas.
+
+        Cada tramo se traduce y se asigna de una vez a su fila y al plano
+        público; en Python solo se recorren las celdas nuevas, para el hash,
+        y las impactadas, para descontar su nave. Devuelve los impactos.
+        """
+        ancho = self.ancho
+        publico = self.publico
+        nuevas = []
+        impactadas = []
+
+        for fila, inicio, fin in tramos:
+            valores = self.celdas[fila]
+            if fin - inicio == 1:
+                # Una celda suelta sale más barata sin slices
+                estado = valores[inicio]
+                if estado < 2:
+                    indice = fila * ancho + inicio
+                    valores[inicio] = publico[indice] = estado + 2
+                    nuevas.append(indice)
+                    if estado == 1:
+                        impactadas.append(indice)
+                continue
+
+            antes = bytes(valores[inicio:fin])
+            despues = antes.translate(_DISPARAR)
+            if despues == antes:
+                continue
+            base = fila * ancho + inicio
+            valores[inicio:fin] = despues
+            publico[base:base + fin - inicio] = despues
+            if 2 in antes or 3 in antes:
+                nuevas.extend(base + celda.start() for celda in _SIN_DISPARAR.finditer(antes))
+            else:
+                nuevas.extend(range(base, base + fin - inicio))
+            if 1 in antes:
+                impactadas.extend(base + celda.start() for celda in _NAVE_INTACTA.finditer(antes))
+
+        return self._cerrar_bloque(nuevas, impactadas)
+
+    def _cerrar_bloque(self, nuevas, impactadas):
+        """Hash, naves y nodo del historial de un bloque de celdas ya marcadas como disparadas."""
+        if not nuevas:
+            return 0
+
+        self.hash_publico = hash_celdas(self.publico, nuevas, self.hash_publico)
+        indice_naves = self.indice_naves
+        hundidas = 0
+        for indice in impactadas:
+            nave = indice_naves.get(indice)
+            if nave is None or nave.recibir_impacto():
+                hundidas += 1
+        self.naves_restantes -= hundidas
+        self.jugada = JugadaEnBloque(self.jugada, tuple(nuevas))
+        return len(impactadas)
+
     def mostrar_campo(self):
         representacion = ""
 
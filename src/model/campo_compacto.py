@@ -0,0 +1,99 @@
+from array import array
+from src.model.campo import Campo
+from src.model.vista import VistaNiebla
+from src.model.zobrist import clave_zobrist
+
+
+class CampoCompacto:
+    """Campo guardado en buffers planos, para servidores con miles de partidas.
+
+    Usa un byte por celda para el estado real, otro para el estado público
+    (el que comparten las vistas de niebla) y un número de nave por celda,
+    en lugar de listas de listas de enteros y un objeto Nave por barco. La
+    colocación es la de Campo con la misma semilla, y cada disparo se
+    resuelve en O(1). ultima_nave_hundida es el número (desde 0) de la nave
+    hundida por el último disparo.
+    """
+
+    __slots__ = ('ancho', 'alto', 'num_naves', 'naves_restantes', 'semilla', 'flota', 'estados', 'publico',
+                 'hash_publico', 'nave_por_celda', 'vida_naves', 'ultima_nave_hundida', '_vista')
+
+    def __init__(self, ancho, alto, num_naves, semilla=None, flota=None):
+        self._copiar(Campo(ancho, alto, num_naves, semilla, flota))
+
+    @classmethod
+    def desde_campo(cls, campo):
+        compacto = cls.__new__(cls)
+        compacto._copiar(campo)
+        return compacto
+
+    def _copiar(self, campo):
+        self.ancho = campo.ancho
+        self.alto = campo.alto
+        self.num_naves = campo.num_naves
+        self.naves_restantes = campo.naves_restantes
+        self.semilla = campo.semilla
+        self.flota = campo.flota
+        self.estados = bytearray(b''.join(bytes(fila) for fila in campo.celdas))
+        self.publico = bytearray(campo.publico)
+        self.hash_publico = campo.hash_publico
+        self.ultima_nave_hundida = None
+        self._vista = None
+
+        # 0 = celda sin nave indexada; n = nave n - 1. Un byte por celda mientras alcance
+        self.nave_por_celda = bytearray(len(self.estados)) if len(campo.naves) < 256 else array('H', bytes(2 * len(self.estados)))
+        numeros = {id(nave): numero for numero, nave in enumerate(campo.naves, 1)}
+        for indice, nave in campo.indice_naves.items():
+            self.nave_por_celda[indice] = numeros[id(nave)]
+        self.vida_naves = array('I', (nave.impactos_restantes for nave in campo.naves))
+
+    @property
+    def posiciones_naves(self):
+        return [divmod(indice, self.ancho) for indice, estado in enumerate(self.estados) if estado in (1, 3)]
+
+    def celdas_nave(self, numero):
+        """Índices de las celdas de la nave `numero` (desde 0), como ultima_nave_hundida."""
+        return tuple(indice for indice, n in enumerate(self.nave_por_celda) if n == numero + 1)
+
+    def estado(self, fila, columna):
+        if fila < 0 or fila >= self.alto or columna < 0 or columna >= self.ancho:
+            raise ValueError("Coordenadas fuera del tablero")
+        return self.estados[fila * self.ancho + columna]
+
+    def vista(self):
+        if self._vista is None:
+            self._vista = VistaNiebla(self)
+        return self._vista
+
+    def verificar_impacto(self, fila, columna):
+        if fila < 0 or fila >= self.alto or columna < 0 or columna >= self.ancho:
+            raise ValueError("Coordenadas fuera del tablero")
+
+        indice = fila * self.ancho + columna
+        estado = self.estados[indice]
+        if estado >= 2:
+            raise ValueError("Esta celda ya ha sido impactada")
+
+        self.ultima_nave_hundida = None
+        if estado == 0:
+            self.estados[indice] = 2
+            self.publico[indice] = 2
+            self.hash_publico ^= clave_zobrist(indice, 2)
+            return False
+
+        self.estados[indice] = 3
+        self.publico[indice] = 3
+        self.hash_publico ^= clave_zobrist(indice, 3)
+
+        numero = self.nave_por_celda[indice]
+        if numero == 0:
+            self.naves_restantes -= 1
+        else:
+            self.vida_naves[numero - 1] -= 1
+            if self.vida_naves[numero - 1] == 0:
+                self.naves_restantes -= 1
+                self.ultima_nave_hundida = numero - 1
+        return True
+
+    def mostrar_campo(self):
+        return self.vista().mostrar_campo()
@@ -0,0 +1,144 @@
+import random
+from src.model.historial import Jugada, JugadaEnBloque, ruta_entre
+from src.model.zobrist import clave_zobrist
+
+
+class CampoDisperso:
+    """Campo que solo guarda las naves y los disparos, no la matriz completa.
+
+    Cada coordenada se codifica como un entero fila * ancho + columna; las
+    naves y los disparos son conjuntos de esos enteros, así que la memoria es
+    O(naves + disparos) sin importar las dimensiones y las comprobaciones
+    siguen siendo O(1). Sirve para tableros enormes (p. ej. 1.000.000 x
+    1.000.000) con pocas naves. Los estados devueltos por estado() son los
+    mismos que usa Campo: 0 agua, 1 nave, 2 agua impactada, 3 nave impactada.
+    """
+
+    def __init__(self, ancho, alto, num_naves, semilla=None):
+        if ancho <= 0 or alto <= 0 or num_naves <= 0:
+            raise ValueError("Los parámetros deben ser positivos")
+
+        if ancho < 2 or alto < 2:
+            raise ValueError("El tamaño mínimo del tablero es 2x2")
+
+        if num_naves > ancho * alto:
+            raise ValueError("No se pueden colocar más naves que celdas disponibles")
+
+        self.ancho = ancho
+        self.alto = alto
+        self.num_naves = num_naves
+        self.naves_restantes = num_naves
+        self.semilla = semilla
+
+        self.naves = set()
+        self.impactos = set()
+        self.fallos = set()
+        # Mismo hash de Zobrist que Campo: dos campos con los mismos disparos y resultados coinciden
+        self.hash_publico = 0
+        self.jugada = None
+
+        self.naves_aleatorias()
+
+    def naves_aleatorias(self):
+        aleatorio = random.Random(self.semilla) if self.semilla is not None else random
+        # sample() sobre un range no materializa la población
+        self.naves.update(aleatorio.sample(range(self.ancho * self.alto), self.num_naves))
+
+    @property
+    def posiciones_naves(self):
+        return [divmod(indice, self.ancho) for indice in self.naves]
+
+    def _indice(self, fila, columna):
+        if fila < 0 or fila >= self.alto or columna < 0 or columna >= self.ancho:
+            raise ValueError("Coordenadas fuera del tablero")
+        return fila * self.ancho + columna
+
+    def estado(self, fila, columna):
+        indice = self._indice(fila, columna)
+        if indice in self.naves:
+            return 3 if indice in self.impactos else 1
+        return 2 if indice in self.fallos else 0
+
+    def verificar_impacto(self, fila, columna):
+        indice = self._indice(fila, columna)
+
+        if indice in self.impactos or indice in self.fallos:
+            raise ValueError("Esta celda ya ha sido impactada")
+
+        es_nave = self._aplicar(indice)
+        self.jugada = Jugada(self.jugada, indice)
+        return es_nave
+
+    def _aplicar(self, indice):
+        if indice in self.naves:
+            self.impactos.add(indice)
+            self.hash_publico ^= clave_zobrist(indice, 3)
+            self.naves_restantes -= 1
+            return True
+
+        self.fallos.add(indice)
+        self.hash_publico ^= clave_zobrist(indice, 2)
+        return False
+
+    def _revertir(self, indice):
+        if indice in self.impactos:
+            self.impactos.discard(indice)
+            self.hash_publico ^= clave_zobrist(indice, 3)
+            self.naves_restantes += 1
+        else:
+            self.fallos.discard(indice)
+            self.hash_publico ^= clave_zobrist(indice, 2)
+
+    def ir_a(self, jugada):
+        """Igual que Campo.ir_a: deshace y rehace disparos hasta el estado posterior a `jugada`."""
+        deshacer, rehacer = ruta_entre(self.jugada, jugada)
+        for nodo in deshacer:
+            for indice in nodo.indices:
+                self._revertir(indice)
+        for nodo in rehacer:
+            for indice in nodo.indices:
+                self._aplicar(indice)
+        self.jugada = jugada
+
+    def aplicar_disparos(self, indices):
+        """Aplica en bloque disparos ya validados, dados como fila * ancho + columna.
+
+        Igual que en Campo, las celdas nuevas forman un solo nodo del historial.
+        """
+        indices = set(indices)
+        nuevos_impactos = (indices & self.naves) - self.impactos
+        nuevos_fallos = indices - self.naves - self.fallos
+        if not nuevos_impactos and not nuevos_fallos:
+            return 0
+
+        for indice in nuevos_impactos:
+            self.hash_publico ^= clave_zobrist(indice, 3)
+        for indice in nuevos_fallos:
+            self.hash_publico ^= clave_zobrist(indice, 2)
+        self.impactos |= nuevos_impactos
+        self.fallos |= nuevos_fallos
+        self.naves_restantes -= len(nuevos_impactos)
+        self.jugada = JugadaEnBloque(self.jugada, tuple(sorted(nuevos_impactos | nuevos_fallos)))
+        return len(nuevos_impactos)
+
+    def aplicar_tramos(self, tramos):
+        """Como Campo.aplicar_tramos; con conjuntos no hay slices, así que se expanden a índices."""
+        ancho = self.ancho
+        return self.aplicar_disparos(
+            indice for fila, inicio, fin in tramos for indice in range(fila * ancho + inicio, fila * ancho + fin)
+        )
+
+    def mostrar_campo(self, fila_inicio=0, columna_inicio=0, filas=20, columnas=20):
+        """Representa solo la ventana indicada del tablero."""
+        fila_fin = min(self.alto, fila_inicio + filas)
+        columna_fin = min(self.ancho, columna_inicio + columnas)
+        simbolos = "~~OX"
+
+        representacion = "  " + " ".join(str(j) for j in range(columna_inicio, columna_fin)) + "\n"
+        for i in range(fila_inicio, fila_fin):
+            representacion += f"{i} "
+            for j in range(columna_inicio, columna_fin):
+                representacion += simbolos[self.estado(i, j)] + " "
+            representacion += "\n"
+
+        return representacion
@@ -1,4 +1,6 @@
 class Celda:
+    __slots__ = ('nave', 'disparada')
+
     def __init__(self):
         self.nave = False
         self.disparada = False
@@ -0,0 +1,65 @@
+class Jugada:
+    """Nodo inmutable del historial de disparos de un campo.
+
+    Cada nodo apunta a su padre, así que las ramas exploradas desde un mismo
+    estado comparten su prefijo y capturar el estado actual es guardar una
+    referencia. La raíz es None: el campo tal como se creó o se cargó.
+    """
+
+    __slots__ = ('padre', 'indice', 'profundidad')
+
+    def __init__(self, padre, indice):
+        self.padre = padre
+        self.indice = indice
+        self.profundidad = padre.profundidad + 1 if padre is not None else 1
+
+    @property
+    def indices(self):
+        """Celdas que cambió este nodo."""
+        return (self.indice,)
+
+
+class JugadaEnBloque(Jugada):
+    """Nodo de varios disparos aplicados juntos (una salva): se deshacen y rehacen en un solo paso."""
+
+    __slots__ = ('indices',)
+
+    def __init__(self, padre, indices):
+        super().__init__(padre, indices[0])
+        self.indices = indices
+
+
+class Captura:
+    """Estado de un juego en un instante; Juego.restaurar() vuelve a él."""
+
+    __slots__ = ('campo', 'jugada')
+
+    def __init__(self, campo, jugada):
+        self.campo = campo
+        self.jugada = jugada
+
+
+def _profundidad(jugada):
+    return jugada.profundidad if jugada is not None else 0
+
+
+def ruta_entre(origen, destino):
+    """Devuelve (a_deshacer, a_rehacer) para ir de `origen` a `destino` pasando por su ancestro común.
+
+    a_deshacer va de `origen` hacia arriba y a_rehacer baja hasta `destino`,
+    ambos en el orden en que hay que aplicarlos.
+    """
+    deshacer, rehacer = [], []
+    while _profundidad(origen) > _profundidad(destino):
+        deshacer.append(origen)
+        origen = origen.padre
+    while _profundidad(destino) > _profundidad(origen):
+        rehacer.append(destino)
+        destino = destino.padre
+    while origen is not destino:
+        deshacer.append(origen)
+        origen = origen.padre
+        rehacer.append(destino)
+        destino = destino.padre
+    rehacer.reverse()
+    return deshacer, rehacer
@@ -0,0 +1,163 @@
+import mmap
+import struct
+from src.model.campo import Campo
+
+# Formato binario de un campo en juego:
+#   cabecera: magia, versión, ancho, alto, num_naves, naves_restantes y
+#   cantidad de enteros de la tabla de naves
+#   tres planos de bits (naves, fallos, impactos), una fila por bloque de
+#   ceil(ancho / 8) bytes, bit más significativo primero.
+#   tabla de naves (uint32 little endian): por cada nave de más de una celda,
+#   su longitud seguida de los índices fila * ancho + columna de sus celdas.
+#   Las celdas del plano de naves que no figuran en la tabla son naves de una celda.
+# Un tablero de 1000x1000 con naves de una celda ocupa 25 + 3 * 125000 bytes (~375 KB).
+MAGIA = b'BNAV'
+VERSION = 2
+_CABECERA = struct.Struct('<4sBIIIII')
+_ENTERO = struct.calcsize('<I')
+
+# Estado de celda -> '1' si pertenece al plano
+_PLANO_NAVES = bytes.maketrans(bytes([0, 1, 2, 3]), b'0101')
+_PLANO_FALLOS = bytes.maketrans(bytes([0, 1, 2, 3]), b'0010')
+_PLANO_IMPACTOS = bytes.maketrans(bytes([0, 1, 2, 3]), b'0001')
+
+# Byte de un plano -> sus ocho bits como bytes 0/1, el más significativo primero
+_BITS = [bytes((byte >> (7 - k)) & 1 for k in range(8)) for byte in range(256)]
+
+
+def _bytes_por_fila(ancho):
+    return (ancho + 7) // 8
+
+
+def tamaño_instantanea(ancho, alto, tamaño_tabla=0):
+    return _CABECERA.size + 3 * alto * _bytes_por_fila(ancho) + _ENTERO * tamaño_tabla
+
+
+def _empaquetar(bits, bytes_fila):
+    return int(bits.ljust(bytes_fila * 8, b'0'), 2).to_bytes(bytes_fila, 'big')
+
+
+def _expandir(plano, ancho, bytes_fila):
+    """Plano de bits -> un byte 0/1 por celda, fila tras fila, sin el relleno de cada fila."""
+    bits = b''.join(map(_BITS.__getitem__, plano))
+    paso = bytes_fila * 8
+    if paso == ancho:
+        return bits
+    return b''.join(bits[i:i + ancho] for i in range(0, len(bits), paso))
+
+
+def _estados(datos, ancho, alto):
+    """Estados de todas las celdas (un byte cada una, fila tras fila) a partir de los tres planos.
+
+    Se opera sobre planos enteros como enteros grandes: los disparos son
+    fallos OR impactos y el estado es nave + 2 * disparo, que cabe en un
+    byte sin acarreo.
+    """
+    bytes_fila = _bytes_por_fila(ancho)
+    tamaño_plano = alto * bytes_fila
+    inicio = _CABECERA.size
+    naves = datos[inicio:inicio + tamaño_plano]
+    fallos = int.from_bytes(datos[inicio + tamaño_plano:inicio + 2 * tamaño_plano], 'big')
+    impactos = int.from_bytes(datos[inicio + 2 * tamaño_plano:inicio + 3 * tamaño_plano], 'big')
+    disparos = (fallos | impactos).to_bytes(tamaño_plano, 'big')
+
+    naves = int.from_bytes(_expandir(naves, ancho, bytes_fila), 'big')
+    disparos = int.from_bytes(_expandir(disparos, ancho, bytes_fila), 'big')
+    return (naves + 2 * disparos).to_bytes(ancho * alto, 'big')
+
+
+def _filas(campo):
+    """Estados de cada fila como bytes; admite campos densos y compactos."""
+    if hasattr(campo, 'celdas'):
+        return map(bytes, campo.celdas)
+    if hasattr(campo, 'estados'):
+        return (campo.estados[i:i + campo.ancho] for i in range(0, len(campo.estados), campo.ancho))
+    raise ValueError("Solo los campos densos admiten instantáneas binarias")
+
+
+def _naves_largas(campo):
+    """Índices de las celdas de cada nave de más de una celda."""
+    if hasattr(campo, 'naves'):
+        naves = ([fila * campo.ancho + columna for fila, columna in nave.posicion] for nave in campo.naves)
+    else:
+        por_numero = {}
+        for indice, numero in enumerate(campo.nave_por_celda):
+            if numero:
+                por_numero.setdefault(numero, []).append(indice)
+        naves = (por_numero[numero] for numero in sorted(por_numero))
+    return [indices for indices in naves if len(indices) > 1]
+
+
+def codificar_campo(campo):
+    filas = _filas(campo)
+    bytes_fila = _bytes_por_fila(campo.ancho)
+    planos = {tabla: bytearray() for tabla in (_PLANO_NAVES, _PLANO_FALLOS, _PLANO_IMPACTOS)}
+
+    for estados in filas:
+        for tabla, plano in planos.items():
+            plano += _empaquetar(estados.translate(tabla), bytes_fila)
+
+    tabla = []
+    for indices in _naves_largas(campo):
+        tabla.append(len(indices))
+        tabla.extend(indices)
+    cabecera = _CABECERA.pack(MAGIA, VERSION, campo.ancho, campo.alto, campo.num_naves, campo.naves_restantes,
+                              len(tabla))
+    return cabecera + b''.join(planos.values()) + struct.pack(f'<{len(tabla)}I', *tabla)
+
+
+def _leer_naves(datos, desplazamiento, tamaño_tabla, ancho, alto):
+    """Convierte la tabla de naves en listas de coordenadas (fila, columna)."""
+    tabla = struct.unpack_from(f'<{tamaño_tabla}I', datos, desplazamiento)
+    naves = []
+    i = 0
+    while i < len(tabla):
+        longitud = tabla[i]
+        indices = tabla[i + 1:i + 1 + longitud]
+        if longitud < 2 or len(indices) != longitud or max(indices) >= ancho * alto:
+            raise ValueError("Tabla de naves corrupta")
+        naves.append([divmod(indice, ancho) for indice in indices])
+        i += 1 + longitud
+    return naves
+
+
+def leer_cabecera(datos):
+    """Devuelve (ancho, alto, num_naves, naves_restantes, tamaño_tabla) validando magia y tamaño."""
+    if len(datos) < _CABECERA.size:
+        raise ValueError("Instantánea truncada")
+
+    magia, version, ancho, alto, num_naves, naves_restantes, tamaño_tabla = _CABECERA.unpack_from(datos)
+    if magia != MAGIA:
+        raise ValueError("El archivo no es una instantánea de Batalla Naval")
+    if version != VERSION:
+        raise ValueError(f"Versión de instantánea no soportada: {version}")
+    if len(datos) < tamaño_instantanea(ancho, alto, tamaño_tabla):
+        raise ValueError("Instantánea truncada")
+
+    return ancho, alto, num_naves, naves_restantes, tamaño_tabla
+
+
+def decodificar_campo(datos):
+    ancho, alto, num_naves, naves_restantes, tamaño_tabla = leer_cabecera(datos)
+    datos = memoryview(datos)
+    estados = _estados(datos, ancho, alto)
+    celdas = [list(estados[i:i + ancho]) for i in range(0, ancho * alto, ancho)]
+    naves = _leer_naves(datos, _CABECERA.size + 3 * alto * _bytes_por_fila(ancho), tamaño_tabla, ancho, alto)
+    datos.release()
+
+    campo = Campo.desde_celdas(celdas, num_naves, naves)
+    if campo.naves_restantes != naves_restantes:
+        raise ValueError("La instantánea no coincide con sus naves restantes")
+    return campo
+
+
+def guardar_campo(campo, ruta):
+    with open(ruta, 'wb') as f:
+        f.write(codificar_campo(campo))
+
+
+def cargar_campo(ruta):
+    """Carga un campo mapeando el archivo en memoria, sin leerlo entero a un buffer intermedio."""
+    with open(ruta, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            return decodificar_campo(mapa)
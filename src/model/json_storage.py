@@ -1,8 +1,14 @@
 import json
 import os
 from datetime import datetime
+from src.model.almacenamiento import Almacenamiento
+from src.utilidades.logs import obtener_logger
+
+logger = obtener_logger('json_storage')
+
+class JSONStorage(Almacenamiento):
+    nombre = "json"
 
-class JSONStorage:
     def __init__(self, json_dir='datos'):
         self.json_dir = json_dir
         self.jugadores_file = os.path.join(json_dir, 'jugadores.json')
@@ -22,7 +28,8 @@ class JSONStorage:
         try:
             with open(self.jugadores_file, 'r') as f:
                 return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            logger.warning("No se pudo leer %s: %s", self.jugadores_file, e)
             return []
     
     def _guardar_jugadores(self, jugadores):
@@ -33,7 +40,8 @@ class JSONStorage:
         try:
             with open(self.puntuaciones_file, 'r') as f:
                 return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+        except (json.JSONDecodeError, FileNotFoundError) as e:
+            logger.warning("No se pudo leer %s: %s", self.puntuaciones_file, e)
             return []
     
     def _guardar_puntuaciones(self, puntuaciones):
@@ -68,6 +76,12 @@ class JSONStorage:
         
         return None
     
+    def obtener_jugador(self, nombre_usuario):
+        for jugador in self._cargar_jugadores():
+            if jugador['nombre_usuario'] == nombre_usuario:
+                return jugador
+        return None
+    
     def actualizar_puntuacion(self, id_jugador, puntos):
         puntuaciones = self._cargar_puntuaciones()
         
@@ -82,25 +96,57 @@ class JSONStorage:
         self._guardar_puntuaciones(puntuaciones)
         return puntos
     
-    def obtener_puntuaciones(self, limite=10):
+    def actualizar_puntuaciones(self, registros):
+        # Una lectura y una escritura del archivo para todo el lote
         puntuaciones = self._cargar_puntuaciones()
+        fecha = datetime.now().isoformat()
+        cantidad = 0
+        
+        for id_jugador, puntos in registros:
+            puntuaciones.append({
+                'id': len(puntuaciones) + 1,
+                'id_jugador': id_jugador,
+                'puntos': puntos,
+                'fecha': fecha
+            })
+            cantidad += 1
+        
+        self._guardar_puntuaciones(puntuaciones)
+        return cantidad
+    
+    def _clasificacion(self):
+        """Puntuaciones ordenadas de mayor a menor; los empates, por id."""
+        return sorted(self._cargar_puntuaciones(), key=lambda p: (-p['puntos'], p['id']))
+    
+    def obtener_puntuaciones(self, limite=10, desplazamiento=0):
+        puntuaciones = self._clasificacion()[desplazamiento:desplazamiento + limite]
         jugadores = self._cargar_jugadores()
         
         # Crear un diccionario para buscar nombres de jugadores por ID
         jugadores_dict = {j['id']: j['nombre_usuario'] for j in jugadores}
         
         # Formatear puntuaciones con nombres de jugadores
-        resultado = []
-        for p in puntuaciones:
-            nombre_usuario = jugadores_dict.get(p['id_jugador'], 'Desconocido')
-            resultado.append({
-                'nombre_usuario': nombre_usuario,
-                'puntaje': p['puntos'],
-                'fecha': p['fecha']
-            })
-        
-        # Ordenar por puntaje (de mayor a menor)
-        resultado.sort(key=lambda x: x['puntaje'], reverse=True)
-        
-        # Limitar resultados
-        return resultado[:limite]
+        return [{
+            'nombre_usuario': jugadores_dict.get(p['id_jugador'], 'Desconocido'),
+            'puntaje': p['puntos'],
+            'fecha': p['fecha']
+        } for p in puntuaciones]
+    
+    def contar_puntuaciones(self):
+        return len(self._cargar_puntuaciones())
+    
+    def indice_en_clasificacion(self, nombre_usuario):
+        ids = {j['id'] for j in self._cargar_jugadores() if j['nombre_usuario'] == nombre_usuario}
+        for indice, p in enumerate(self._clasificacion()):
+            if p['id_jugador'] in ids:
+                return indice
+        return None
+    
+    def obtener_posicion(self, puntos):
+        return sum(1 for p in self._cargar_puntuaciones() if p['puntos'] > puntos) + 1
+    
+    def iterar_jugadores(self):
+        yield from self._cargar_jugadores()
+    
+    def iterar_puntuaciones(self):
+        yield from self._cargar_puntuaciones()
@@ -1,19 +1,67 @@
+from src.model.armas import obtener_arma
 from src.model.campo import Campo
+from src.model.campo_disperso import CampoDisperso
+from src.model.historial import Captura
 
 class Juego:
-    def __init__(self, ancho, alto, num_naves):
+    def __init__(self, ancho, alto, num_naves, semilla=None, disperso=False, flota=None):
         self.ancho = ancho
         self.alto = alto
         self.num_naves = num_naves
-        self.campo = Campo(ancho, alto, num_naves)
+        self.flota = flota
+        if disperso:
+            if flota is not None:
+                raise ValueError("Los campos dispersos solo admiten naves de una celda")
+            self.campo = CampoDisperso(ancho, alto, num_naves, semilla)
+        else:
+            self.campo = Campo(ancho, alto, num_naves, semilla, flota)
+
+    @classmethod
+    def desde_campo(cls, campo):
+        juego = cls.__new__(cls)
+        juego.ancho = campo.ancho
+        juego.alto = campo.alto
+        juego.num_naves = campo.num_naves
+        juego.flota = getattr(campo, 'flota', None)
+        juego.campo = campo
+        return juego
 
     def realizar_disparo(self, fila, columna):
         return self.campo.verificar_impacto(fila, columna)
 
+    def disparar_salva(self, arma, fila, columna):
+        """Dispara un arma de área (nombre o Arma). Devuelve (impactos, naves_hundidas).
+
+        Las celdas ya disparadas dentro de la huella se ignoran y las nuevas
+        quedan en un solo nodo del historial: un deshacer revierte la salva.
+        """
+        tramos = obtener_arma(arma).tramos(self.campo.ancho, self.campo.alto, fila, columna)
+        naves_antes = self.campo.naves_restantes
+        impactos = self.campo.aplicar_tramos(tramos)
+        return impactos, naves_antes - self.campo.naves_restantes
+
+    def snapshot(self):
+        """Captura el estado actual en O(1): no copia el tablero, solo guarda el último disparo."""
+        return Captura(self.campo, self.campo.jugada)
+
+    def restaurar(self, captura):
+        if captura.campo is not self.campo:
+            raise ValueError("La captura pertenece a otro tablero")
+        self.campo.ir_a(captura.jugada)
+
+    def deshacer_disparo(self):
+        if self.campo.jugada is None:
+            return False
+        self.campo.ir_a(self.campo.jugada.padre)
+        return True
+
     def verificar_ganador(self):
         if self.campo.naves_restantes == 0:
             return True
         return None
 
-    def reiniciar_juego(self):
-        self.campo = Campo(self.ancho, self.alto, self.num_naves)
+    def reiniciar_juego(self, semilla=None):
+        if isinstance(self.campo, CampoDisperso):
+            self.campo = CampoDisperso(self.ancho, self.alto, self.num_naves, semilla)
+        else:
+            self.campo = Campo(self.ancho, self.alto, self.num_naves, semilla, self.flota)
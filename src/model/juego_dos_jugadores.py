@@ -0,0 +1,158 @@
+import random
+from abc import ABC, abstractmethod
+from collections import deque
+from src.model.campo_compacto import CampoCompacto
+
+
+class Participante(ABC):
+    """Decide los disparos de un lado de la partida.
+
+    elegir_disparo recibe la vista de niebla del tablero rival y devuelve
+    (fila, columna), o None si todavía no tiene disparo (un humano o un
+    jugador remoto que no ha contestado). resultado_disparo se llama en
+    ambos participantes después de cada disparo; `hundida` son los índices
+    de las celdas de la nave que hundió, o una tupla vacía.
+    """
+
+    @abstractmethod
+    def elegir_disparo(self, vista):
+        """Devuelve (fila, columna) o None."""
+
+    def resultado_disparo(self, propio, fila, columna, impacto, hundida):
+        pass
+
+
+class ParticipanteExterno(Participante):
+    """Humano o jugador de red: sus disparos llegan desde fuera con enviar()."""
+
+    def __init__(self):
+        self.pendientes = deque()
+
+    def enviar(self, fila, columna):
+        self.pendientes.append((fila, columna))
+
+    def elegir_disparo(self, vista):
+        return self.pendientes.popleft() if self.pendientes else None
+
+
+class ParticipanteIA(Participante):
+    """Dispara al azar y, en modo 'caza', remata las vecinas de cada impacto hasta hundir la nave."""
+
+    def __init__(self, modo='caza', semilla=None):
+        if modo not in ('aleatoria', 'caza'):
+            raise ValueError(f"Modo de IA desconocido: {modo}")
+        self.modo = modo
+        self.aleatorio = random.Random(semilla)
+        self.pendientes = None
+        self.objetivos = []
+        # Impactos en naves que todavía no se hundieron, en orden
+        self.impactos = []
+        self._ancho = self._alto = 0
+
+    def elegir_disparo(self, vista):
+        if self.pendientes is None:
+            self._ancho, self._alto = vista.ancho, vista.alto
+            self.pendientes = list(range(vista.ancho * vista.alto))
+            self.aleatorio.shuffle(self.pendientes)
+
+        datos = vista.datos
+        while self.objetivos:
+            indice = self.objetivos.pop()
+            if datos[indice] == 0:
+                return divmod(indice, self._ancho)
+        while self.pendientes:
+            indice = self.pendientes.pop()
+            if datos[indice] == 0:
+                return divmod(indice, self._ancho)
+        return None
+
+    def resultado_disparo(self, propio, fila, columna, impacto, hundida):
+        if not propio or not impacto or self.modo != 'caza':
+            return
+        if not hundida:
+            indice = fila * self._ancho + columna
+            self.impactos.append(indice)
+            self.objetivos.extend(self._vecinas(indice))
+            return
+
+        # Solo se descartan los objetivos de la nave hundida, no los de otras tocadas
+        hundidas = set(hundida)
+        self.impactos = [indice for indice in self.impactos if indice not in hundidas]
+        self.objetivos = [vecina for indice in self.impactos for vecina in self._vecinas(indice)]
+
+    def _vecinas(self, indice):
+        fila, columna = divmod(indice, self._ancho)
+        for f, c in ((fila - 1, columna), (fila + 1, columna), (fila, columna - 1), (fila, columna + 1)):
+            if 0 <= f < self._alto and 0 <= c < self._ancho:
+                yield f * self._ancho + c
+
+
+class JuegoDosJugadores:
+    """Partida por turnos entre dos lados, cada uno con su propio campo.
+
+    campos[lado] es el tablero de ese lado, al que dispara el rival. Los
+    campos son compactos (unos pocos bytes por celda) y cada disparo se
+    resuelve en O(1), así que un proceso puede alojar miles de partidas.
+    Con repetir_al_impactar=True quien impacta vuelve a disparar.
+    """
+
+    __slots__ = ('campos', 'participantes', 'turno', 'ganador', 'disparos', 'repetir_al_impactar')
+
+    def __init__(self, ancho, alto, num_naves, participantes=(None, None), semilla=None, flota=None,
+                 repetir_al_impactar=False):
+        if len(participantes) != 2:
+            raise ValueError("Una partida tiene exactamente dos participantes")
+
+        semillas = (None, None)
+        if semilla is not None:
+            aleatorio = random.Random(semilla)
+            semillas = (aleatorio.getrandbits(32), aleatorio.getrandbits(32))
+
+        self.campos = tuple(CampoCompacto(ancho, alto, num_naves, s, flota) for s in semillas)
+        self.participantes = tuple(p if p is not None else ParticipanteExterno() for p in participantes)
+        self.turno = 0
+        self.ganador = None
+        self.disparos = [0, 0]
+        self.repetir_al_impactar = repetir_al_impactar
+
+    def terminado(self):
+        return self.ganador is not None
+
+    def vista_rival(self, lado):
+        return self.campos[1 - lado].vista()
+
+    def disparar(self, lado, fila, columna):
+        if self.ganador is not None:
+            raise ValueError("La partida ya terminó")
+        if lado != self.turno:
+            raise ValueError("No es el turno de este jugador")
+
+        campo = self.campos[1 - lado]
+        naves_antes = campo.naves_restantes
+        impacto = campo.verificar_impacto(fila, columna)
+        hundida = ()
+        if campo.naves_restantes < naves_antes:
+            numero = campo.ultima_nave_hundida
+            hundida = (fila * campo.ancho + columna,) if numero is None else campo.celdas_nave(numero)
+        self.disparos[lado] += 1
+
+        if campo.naves_restantes == 0:
+            self.ganador = lado
+        elif not (impacto and self.repetir_al_impactar):
+            self.turno = 1 - lado
+
+        for otro, participante in enumerate(self.participantes):
+            participante.resultado_disparo(otro == lado, fila, columna, impacto, hundida)
+        return impacto
+
+    def avanzar(self, maximo=None):
+        """Juega turnos mientras el participante en turno tenga disparo. Devuelve cuántos se jugaron."""
+        jugados = 0
+        while self.ganador is None and (maximo is None or jugados < maximo):
+            lado = self.turno
+            disparo = self.participantes[lado].elegir_disparo(self.campos[1 - lado].vista())
+            if disparo is None:
+                break
+            self.disparar(lado, *disparo)
+            jugados += 1
+        return jugados
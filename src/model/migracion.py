@@ -0,0 +1,323 @@
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from src.model.almacenamiento import URL_POSTGRES_POR_DEFECTO
+from src.utilidades.logs import configurar_desde_entorno, obtener_logger
+
+logger = obtener_logger('migracion')
+
+TAMAÑO_LOTE = 10000
+# Nombres por consulta IN: por debajo del límite de variables de SQLite
+_NOMBRES_POR_CONSULTA = 500
+_SEPARADORES = re.compile(r'[\s,]*')
+
+
+def _trozos(iterable, tamaño):
+    trozo = []
+    for elemento in iterable:
+        trozo.append(elemento)
+        if len(trozo) == tamaño:
+            yield trozo
+            trozo = []
+    if trozo:
+        yield trozo
+
+
+def iterar_json(ruta, tamaño_bloque=1 << 16):
+    """Recorre los elementos de un arreglo JSON leyendo el archivo por bloques.
+
+    A diferencia de json.load, la memoria depende del tamaño de un elemento
+    y no del archivo entero. Un archivo inexistente se trata como vacío.
+    """
+    if not os.path.exists(ruta):
+        return
+
+    decodificador = json.JSONDecoder()
+    with open(ruta, 'r', encoding='utf-8') as f:
+        buffer = f.read(tamaño_bloque).lstrip()
+        if not buffer:
+            return
+        if buffer[0] != '[':
+            raise ValueError(f"{ruta} no contiene un arreglo JSON")
+        posicion = 1
+        fin_archivo = False
+
+        while True:
+            posicion = _SEPARADORES.match(buffer, posicion).end()
+
+            if posicion < len(buffer) and buffer[posicion] == ']':
+                return
+
+            try:
+                elemento, final = decodificador.raw_decode(buffer, posicion)
+            except json.JSONDecodeError:
+                elemento = final = None
+
+            # Sin un separador detrás, el elemento podría seguir en el próximo bloque
+            completo = final is not None and (final < len(buffer) or fin_archivo)
+            if completo:
+                yield elemento
+                posicion = final
+                continue
+
+            if fin_archivo:
+                raise ValueError(f"{ruta} está truncado o no es JSON válido")
+            bloque = f.read(tamaño_bloque)
+            fin_archivo = not bloque
+            buffer = buffer[posicion:] + bloque
+            posicion = 0
+
+
+def escribir_json(ruta, elementos):
+    """Escribe un arreglo JSON elemento por elemento, de forma atómica. Devuelve cuántos escribió."""
+    cantidad = 0
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for elemento in elementos:
+            f.write(',\n' if cantidad else '\n')
+            f.write(json.dumps(elemento, ensure_ascii=False))
+            cantidad += 1
+        f.write('\n]\n')
+    os.replace(temporal, ruta)
+    return cantidad
+
+
+def _fecha(valor):
+    return datetime.fromisoformat(valor) if valor else None
+
+
+class Migracion:
+    """Copia jugadores y puntuaciones entre los archivos JSON y PostgreSQL por lotes.
+
+    Cada lote es una sola sentencia: COPY en PostgreSQL con psycopg2 y, en
+    los demás casos, un INSERT con executemany (que SQLAlchemy convierte en
+    INSERT de varias filas donde el driver lo admite), todo dentro de una
+    transacción por migración. Los jugadores se emparejan por nombre, así que sus
+    puntuaciones quedan con el id que el jugador tiene en el destino.
+    `progreso(fase, procesados, segundos)` se llama tras cada lote.
+    Importar dos veces las mismas puntuaciones las duplicaría, así que
+    importar() se niega si el destino ya tiene puntuaciones, salvo con `forzar`.
+    """
+
+    def __init__(self, engine, json_dir='datos', tamaño_lote=TAMAÑO_LOTE, progreso=None):
+        if tamaño_lote <= 0:
+            raise ValueError("El tamaño de lote debe ser positivo")
+
+        self.engine = engine
+        self.json_dir = json_dir
+        self.tamaño_lote = tamaño_lote
+        self.progreso = progreso
+
+    @property
+    def ruta_jugadores(self):
+        return os.path.join(self.json_dir, 'jugadores.json')
+
+    @property
+    def ruta_puntuaciones(self):
+        return os.path.join(self.json_dir, 'puntuaciones.json')
+
+    def _informar(self, fase, procesados, inicio):
+        if self.progreso is not None:
+            self.progreso(fase, procesados, time.perf_counter() - inicio)
+
+    def importar(self, forzar=False):
+        """Importa los JSON a la base de datos. Devuelve un resumen con cantidades y duración."""
+        from src.model.modelos_db import Base
+
+        Base.metadata.create_all(self.engine)
+        inicio = time.perf_counter()
+
+        with self.engine.begin() as conexion:
+            if not forzar and self._destino_con_puntuaciones(conexion):
+                raise ValueError("La base ya tiene puntuaciones: importarlas de nuevo las duplicaría "
+                                 "(use forzar para agregarlas igualmente)")
+            mapa, jugadores = self._importar_jugadores(conexion, inicio)
+            puntuaciones, omitidas = self._importar_puntuaciones(conexion, mapa, inicio)
+
+        resumen = {
+            'jugadores': jugadores,
+            'puntuaciones': puntuaciones,
+            'omitidas': omitidas,
+            'segundos': time.perf_counter() - inicio
+        }
+        logger.info("Importación terminada: %s", resumen)
+        return resumen
+
+    def _destino_con_puntuaciones(self, conexion):
+        from sqlalchemy import select
+        from src.model.modelos_db import PuntuacionDB
+
+        # Sin puntuaciones en el JSON no hay nada que duplicar
+        if next(iterar_json(self.ruta_puntuaciones), None) is None:
+            return False
+        tabla = PuntuacionDB.__table__
+        return conexion.execute(select(tabla.c.id_puntuacion).limit(1)).first() is not None
+
+    def _importar_jugadores(self, conexion, inicio):
+        from sqlalchemy import insert, select
+        from src.model.modelos_db import JugadorDB
+
+        tabla = JugadorDB.__table__
+        # id en el JSON -> id en la base; solo crece con los jugadores, no con las puntuaciones
+        mapa = {}
+        nuevos = procesados = 0
+
+        for lote in _trozos(iterar_json(self.ruta_jugadores), self.tamaño_lote):
+            por_nombre = {j['nombre_usuario']: j for j in lote if j.get('nombre_usuario') and j.get('contraseña')}
+
+            existentes = {}
+            for nombres in _trozos(por_nombre, _NOMBRES_POR_CONSULTA):
+                consulta = select(tabla.c.nombre_usuario, tabla.c.id_jugador).where(tabla.c.nombre_usuario.in_(nombres))
+                existentes.update(conexion.execute(consulta).all())
+
+            faltantes = [{'nombre_usuario': nombre, 'contraseña': j['contraseña']}
+                         for nombre, j in por_nombre.items() if nombre not in existentes]
+            if faltantes:
+                conexion.execute(insert(tabla), faltantes)
+                for nombres in _trozos([f['nombre_usuario'] for f in faltantes], _NOMBRES_POR_CONSULTA):
+                    consulta = select(tabla.c.nombre_usuario, tabla.c.id_jugador).where(tabla.c.nombre_usuario.in_(nombres))
+                    existentes.update(conexion.execute(consulta).all())
+
+            for jugador in lote:
+                if jugador.get('nombre_usuario') in existentes:
+                    mapa[jugador['id']] = existentes[jugador['nombre_usuario']]
+
+            nuevos += len(faltantes)
+            procesados += len(lote)
+            self._informar('jugadores', procesados, inicio)
+
+        return mapa, nuevos
+
+    def _importar_puntuaciones(self, conexion, mapa, inicio):
+        cursor_copy = self._cursor_copy(conexion)
+        importadas = omitidas = 0
+
+        try:
+            for lote in _trozos(iterar_json(self.ruta_puntuaciones), self.tamaño_lote):
+                filas = []
+                for p in lote:
+                    id_jugador = mapa.get(p['id_jugador'])
+                    if id_jugador is None:
+                        omitidas += 1
+                        continue
+                    filas.append((id_jugador, p['puntos'], p.get('fecha')))
+
+                if filas:
+                    if cursor_copy is not None:
+                        self._copiar(cursor_copy, filas)
+                    else:
+                        self._insertar(conexion, filas)
+
+                importadas += len(filas)
+                self._informar('puntuaciones', importadas, inicio)
+        finally:
+            if cursor_copy is not None:
+                cursor_copy.close()
+
+        if omitidas:
+            logger.warning("%d puntuaciones omitidas: su jugador no existe en el JSON", omitidas)
+        return importadas, omitidas
+
+    def _cursor_copy(self, conexion):
+        """Cursor con copy_expert (psycopg2) sobre la misma transacción, o None para usar executemany."""
+        if self.engine.dialect.name != 'postgresql':
+            return None
+        cursor = conexion.connection.cursor()
+        if hasattr(cursor, 'copy_expert'):
+            return cursor
+        cursor.close()
+        return None
+
+    def _copiar(self, cursor, filas):
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer)
+        # Las fechas ya vienen en ISO 8601; una fecha vacía se carga como NULL
+        escritor.writerows((id_jugador, puntos, fecha or '') for id_jugador, puntos, fecha in filas)
+        buffer.seek(0)
+        cursor.copy_expert("COPY puntuacion (id_jugador, puntos, fecha) FROM STDIN WITH (FORMAT csv)", buffer)
+
+    def _insertar(self, conexion, filas):
+        from sqlalchemy import insert
+        from src.model.modelos_db import PuntuacionDB
+
+        conexion.execute(insert(PuntuacionDB.__table__), [
+            {'id_jugador': id_jugador, 'puntos': puntos, 'fecha': _fecha(fecha)}
+            for id_jugador, puntos, fecha in filas
+        ])
+
+    def exportar(self):
+        """Exporta la base de datos a los JSON, con los ids de la base. Devuelve un resumen."""
+        from sqlalchemy import select
+        from src.model.modelos_db import JugadorDB, PuntuacionDB
+
+        os.makedirs(self.json_dir, exist_ok=True)
+        jugadores = JugadorDB.__table__
+        puntuaciones = PuntuacionDB.__table__
+        inicio = time.perf_counter()
+
+        with self.engine.connect() as conexion:
+            consulta = select(jugadores.c.id_jugador, jugadores.c.nombre_usuario, jugadores.c.contraseña)
+            cantidad_jugadores = escribir_json(self.ruta_jugadores, self._leer(
+                conexion, consulta.order_by(jugadores.c.id_jugador), 'jugadores', inicio,
+                lambda f: {'id': f[0], 'nombre_usuario': f[1], 'contraseña': f[2]}
+            ))
+
+            consulta = select(puntuaciones.c.id_puntuacion, puntuaciones.c.id_jugador,
+                              puntuaciones.c.puntos, puntuaciones.c.fecha)
+            cantidad_puntuaciones = escribir_json(self.ruta_puntuaciones, self._leer(
+                conexion, consulta.order_by(puntuaciones.c.id_puntuacion), 'puntuaciones', inicio,
+                lambda f: {'id': f[0], 'id_jugador': f[1], 'puntos': f[2],
+                           'fecha': f[3].isoformat() if f[3] else None}
+            ))
+
+        resumen = {
+            'jugadores': cantidad_jugadores,
+            'puntuaciones': cantidad_puntuaciones,
+            'segundos': time.perf_counter() - inicio
+        }
+        logger.info("Exportación terminada: %s", resumen)
+        return resumen
+
+    def _leer(self, conexion, consulta, fase, inicio, convertir):
+        # stream_results usa un cursor del lado del servidor donde el driver lo permite
+        resultado = conexion.execution_options(stream_results=True).execute(consulta)
+        procesados = 0
+        for lote in resultado.partitions(self.tamaño_lote):
+            for fila in lote:
+                yield convertir(fila)
+            procesados += len(lote)
+            self._informar(fase, procesados, inicio)
+
+
+def _mostrar_progreso(fase, procesados, segundos):
+    velocidad = procesados / segundos if segundos > 0 else 0
+    print(f"\r{fase}: {procesados} ({velocidad:,.0f}/s)", end='', file=sys.stderr, flush=True)
+
+
+if __name__ == "__main__":
+    configurar_desde_entorno()
+    parser = argparse.ArgumentParser(description="Importa o exporta jugadores y puntuaciones entre JSON y PostgreSQL")
+    parser.add_argument("operacion", choices=("importar", "exportar"))
+    parser.add_argument("--url", default=os.environ.get('BATALLA_NAVAL_DB_URL', URL_POSTGRES_POR_DEFECTO))
+    parser.add_argument("--json-dir", default=os.environ.get('BATALLA_NAVAL_JSON_DIR', 'datos'))
+    parser.add_argument("--lote", type=int, default=TAMAÑO_LOTE)
+    parser.add_argument("--forzar", action="store_true",
+                        help="importar aunque la base ya tenga puntuaciones (se agregan, pueden quedar duplicadas)")
+    argumentos = parser.parse_args()
+
+    from sqlalchemy import create_engine
+
+    migracion = Migracion(create_engine(argumentos.url), argumentos.json_dir, argumentos.lote, _mostrar_progreso)
+    if argumentos.operacion == 'importar':
+        resumen = migracion.importar(argumentos.forzar)
+    else:
+        resumen = migracion.exportar()
+    print(file=sys.stderr)
+    print(json.dumps(resumen))
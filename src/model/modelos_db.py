@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy.orm import declarative_base, relationship
+from datetime import datetime
+
+Base = declarative_base()
+
+class JugadorDB(Base):
+    __tablename__ = 'jugador'
+
+    id_jugador = Column(Integer, primary_key=True)
+    nombre_usuario = Column(String(50), unique=True, nullable=False)
+    contraseña = Column(String, nullable=False)
+
+    puntuaciones = relationship("PuntuacionDB", back_populates="jugador", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<Jugador(id={self.id_jugador}, nombre={self.nombre_usuario})>"
+
+class PuntuacionDB(Base):
+    __tablename__ = 'puntuacion'
+
+    id_puntuacion = Column(Integer, primary_key=True)
+    id_jugador = Column(Integer, ForeignKey('jugador.id_jugador'), nullable=False)
+    puntos = Column(Integer, default=0)
+    fecha = Column(DateTime, default=datetime.now)
+
+    jugador = relationship("JugadorDB", back_populates="puntuaciones")
+
+    def __repr__(self):
+        return f"<Puntuacion(id={self.id_puntuacion}, jugador_id={self.id_jugador}, puntos={self.puntos})>"
@@ -1,6 +1,25 @@
 class Nave:
+    __slots__ = ('posicion', '_coordenadas', 'impactos_restantes')
+
     def __init__(self, posicion):
         self.posicion = posicion
+        self._coordenadas = frozenset(posicion)
+        self.impactos_restantes = len(self._coordenadas)
 
     def verificar_impacto(self, coordenada):
-        return coordenada in self.posicion
+        try:
+            return coordenada in self._coordenadas
+        except TypeError:
+            return False
+
+    def recibir_impacto(self):
+        """Descuenta un impacto (el campo garantiza que no se repitan). Devuelve True si la nave se hundió."""
+        self.impactos_restantes -= 1
+        return self.impactos_restantes == 0
+
+    @property
+    def hundida(self):
+        return self.impactos_restantes <= 0
+
+    def __len__(self):
+        return len(self._coordenadas)
@@ -0,0 +1,118 @@
+import random
+import threading
+from collections import deque
+from src.model.campo import Campo
+from src.utilidades.metricas import REGISTRO
+
+_ACIERTOS = REGISTRO.contador('batalla_naval_pool_aciertos_total', 'Tableros servidos desde el pool de pregeneración')
+_FALLOS = REGISTRO.contador('batalla_naval_pool_fallos_total', 'Tableros generados en el momento por falta de existencias')
+
+
+class PoolTableros:
+    """Mantiene tableros listos para usar por configuración (ancho, alto, num_naves).
+
+    Un hilo en segundo plano rellena una cola acotada por configuración;
+    obtener() saca un tablero en O(1) y solo genera uno en el momento si la
+    cola está vacía. Las configuraciones se registran solas al pedirlas por
+    primera vez. Cada tablero lleva una semilla, así que los juegos creados
+    desde el pool se pueden grabar en una bitácora.
+    """
+
+    def __init__(self, capacidad=4, configuraciones=(), max_configuraciones=32):
+        if capacidad <= 0:
+            raise ValueError("La capacidad debe ser positiva")
+
+        self.capacidad = capacidad
+        self.max_configuraciones = max_configuraciones
+        self.aciertos = 0
+        self.fallos = 0
+
+        self._colas = {}
+        self._condicion = threading.Condition()
+        self._activo = False
+        self._hilo = None
+
+        for configuracion in configuraciones:
+            Campo(*configuracion)
+            self._colas[tuple(configuracion)] = deque()
+
+    def _generar(self, ancho, alto, num_naves):
+        return Campo(ancho, alto, num_naves, random.getrandbits(32))
+
+    def iniciar(self):
+        with self._condicion:
+            if self._activo:
+                return self
+            self._activo = True
+        self._hilo = threading.Thread(target=self._rellenar, daemon=True, name="pool-tableros")
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        with self._condicion:
+            self._activo = False
+            self._condicion.notify_all()
+        if self._hilo is not None:
+            self._hilo.join()
+            self._hilo = None
+
+    def obtener(self, ancho, alto, num_naves):
+        clave = (ancho, alto, num_naves)
+
+        with self._condicion:
+            cola = self._colas.get(clave)
+            if cola:
+                self.aciertos += 1
+                _ACIERTOS.incrementar()
+                self._condicion.notify_all()
+                return cola.popleft()
+            self.fallos += 1
+            _FALLOS.incrementar()
+
+        # Fuera del lock: también valida los parámetros antes de registrar la configuración
+        campo = self._generar(ancho, alto, num_naves)
+
+        with self._condicion:
+            if clave not in self._colas and len(self._colas) < self.max_configuraciones:
+                self._colas[clave] = deque()
+                self._condicion.notify_all()
+        return campo
+
+    def _pendiente(self):
+        """Configuración con menos existencias, o None si todas están llenas."""
+        faltantes = [(len(cola), clave) for clave, cola in self._colas.items() if len(cola) < self.capacidad]
+        return min(faltantes)[1] if faltantes else None
+
+    def _rellenar(self):
+        while True:
+            with self._condicion:
+                clave = self._pendiente()
+                while self._activo and clave is None:
+                    self._condicion.wait()
+                    clave = self._pendiente()
+                if not self._activo:
+                    return
+
+            campo = self._generar(*clave)
+
+            with self._condicion:
+                cola = self._colas[clave]
+                if len(cola) < self.capacidad:
+                    cola.append(campo)
+                    self._condicion.notify_all()
+
+    def esperar_lleno(self, tiempo=5.0):
+        """Espera (como mucho `tiempo` segundos) a que todas las colas estén llenas."""
+        with self._condicion:
+            return self._condicion.wait_for(lambda: self._pendiente() is None, tiempo)
+
+    def estadisticas(self):
+        with self._condicion:
+            existencias = {f"{a}x{h}x{n}": len(cola) for (a, h, n), cola in self._colas.items()}
+        total = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / total if total else 0.0,
+            'existencias': existencias,
+        }
@@ -1,15 +1,17 @@
+from src.utilidades.logs import obtener_logger
+
+logger = obtener_logger('puntuaciones')
+
 class Puntuaciones:
     def __init__(self, jugador, session=None, sistema_usuario=None):
         self.jugador = jugador
         self.session = session
         self.sistema_usuario = sistema_usuario
+        self.almacenamiento = None
 
         if not self.sistema_usuario and self.session:
-            try:
-                from src.controller.controlador import Controlador
-                self.sistema_usuario = Controlador().sistema_usuario
-            except Exception as e:
-                print(f"No se pudo obtener el sistema de usuarios: {e}")
+            from src.model.almacenamiento import AlmacenamientoPostgres
+            self.almacenamiento = AlmacenamientoPostgres(session=self.session)
 
     def actualizar_puntuacion(self, puntos):
         if not self.jugador:
@@ -19,58 +21,28 @@ class Puntuaciones:
 
         if self.sistema_usuario:
             return self.sistema_usuario.actualizar_puntuacion(self.jugador, puntos)
-        elif self.session:
+        elif self.almacenamiento:
             try:
-                from src.model.sistema_usuario import JugadorDB, PuntuacionDB
-                jugador_db = self.session.query(JugadorDB).filter_by(nombre_usuario=self.jugador.nombre_usuario).first()
+                datos = self.almacenamiento.obtener_jugador(self.jugador.nombre_usuario)
 
-                if not jugador_db:
-                    print(f"No se encontró el jugador {self.jugador.nombre_usuario} en la base de datos.")
+                if not datos:
+                    logger.warning("No se encontró el jugador %s en la base de datos", self.jugador.nombre_usuario)
                     return nuevo_puntaje
 
-                puntuacion = PuntuacionDB(
-                    id_jugador=jugador_db.id_jugador,
-                    puntos=nuevo_puntaje
-                )
-                self.session.add(puntuacion)
-                self.session.commit()
-
-                print(f"Puntuación registrada: {nuevo_puntaje} puntos para {self.jugador.nombre_usuario}")
+                self.almacenamiento.actualizar_puntuacion(datos['id'], nuevo_puntaje)
+                logger.debug("Puntuación registrada: %s puntos para %s", nuevo_puntaje, self.jugador.nombre_usuario)
             except Exception as e:
-                print(f"Error al actualizar puntaje en la base de datos: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                if self.session:
-                    self.session.rollback()
+                logger.error("Error al actualizar puntaje en la base de datos: %s", e, exc_info=True)
 
         return nuevo_puntaje
 
-    def mostrar_puntuaciones(self, limite=10):
+    def mostrar_puntuaciones(self, limite=10, desplazamiento=0):
         if self.sistema_usuario:
-            return self.sistema_usuario.obtener_puntuaciones(limite)
-        elif self.session:
+            return self.sistema_usuario.obtener_puntuaciones(limite, desplazamiento)
+        elif self.almacenamiento:
             try:
-                from src.model.sistema_usuario import PuntuacionDB, JugadorDB
-
-                resultados = self.session.query(
-                    PuntuacionDB, JugadorDB
-                ).join(
-                    JugadorDB, PuntuacionDB.id_jugador == JugadorDB.id_jugador
-                ).order_by(
-                    PuntuacionDB.puntos.desc()
-                ).limit(limite).all()
-
-                puntuaciones = []
-                for puntuacion, jugador in resultados:
-                    puntuaciones.append({
-                        'nombre_usuario': jugador.nombre_usuario,
-                        'puntaje': puntuacion.puntos
-                    })
-
-                return puntuaciones
+                return self.almacenamiento.obtener_puntuaciones(limite, desplazamiento)
             except Exception as e:
-                print(f"Error al obtener puntuaciones: {str(e)}")
-                import traceback
-                traceback.print_exc()
+                logger.error("Error al obtener puntuaciones: %s", e, exc_info=True)
 
         return []
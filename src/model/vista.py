@@ -0,0 +1,48 @@
+# Estado público de celda -> símbolo; las naves sin impactar (1) nunca aparecen en el plano público
+SIMBOLOS = bytes.maketrans(bytes([0, 1, 2, 3]), b'~~OX')
+
+
+class VistaNiebla:
+    """Vista de solo lectura de un Campo tal como lo ve el rival.
+
+    Expone el plano público del campo (0 desconocida, 2 agua impactada,
+    3 nave impactada, una celda por byte en orden fila * ancho + columna)
+    como un memoryview de solo lectura, sin copiarlo. Todas las vistas de un
+    mismo campo comparten ese buffer y ven cada disparo en cuanto ocurre.
+    """
+
+    __slots__ = ('ancho', 'alto', 'datos')
+
+    def __init__(self, campo):
+        if not hasattr(campo, 'publico'):
+            raise ValueError("Solo los campos densos admiten vistas de niebla")
+
+        self.ancho = campo.ancho
+        self.alto = campo.alto
+        self.datos = memoryview(campo.publico).toreadonly()
+
+    def __len__(self):
+        return len(self.datos)
+
+    def fila(self, fila):
+        """Devuelve la fila como memoryview sobre el mismo buffer."""
+        if fila < 0 or fila >= self.alto:
+            raise ValueError("Fila fuera del tablero")
+        inicio = fila * self.ancho
+        return self.datos[inicio:inicio + self.ancho]
+
+    def estado(self, fila, columna):
+        if fila < 0 or fila >= self.alto or columna < 0 or columna >= self.ancho:
+            raise ValueError("Coordenadas fuera del tablero")
+        return self.datos[fila * self.ancho + columna]
+
+    def texto(self):
+        """Todo el tablero como una cadena de símbolos '~OX', fila tras fila."""
+        return self.datos.tobytes().translate(SIMBOLOS).decode('ascii')
+
+    def mostrar_campo(self):
+        representacion = "  " + " ".join(str(i) for i in range(self.ancho)) + "\n"
+        for i in range(self.alto):
+            simbolos = self.fila(i).tobytes().translate(SIMBOLOS).decode('ascii')
+            representacion += f"{i} " + "".join(f"{simbolo} " for simbolo in simbolos) + "\n"
+        return representacion
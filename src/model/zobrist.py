@@ -0,0 +1,103 @@
+import re
+import threading
+from collections import OrderedDict
+from functools import reduce
+from operator import xor
+from src.utilidades.metricas import REGISTRO
+
+_ACIERTOS = REGISTRO.contador('batalla_naval_transposiciones_aciertos_total', 'Cálculos servidos desde la cache de transposiciones')
+_FALLOS = REGISTRO.contador('batalla_naval_transposiciones_fallos_total', 'Cálculos hechos por no estar en la cache de transposiciones')
+
+_MASCARA = (1 << 64) - 1
+# Celdas ya disparadas de un plano público; el recorrido lo hace re en C
+_DISPARADA = re.compile(rb'[^\x00]')
+
+
+def clave_zobrist(indice, estado):
+    """Número pseudoaleatorio de 64 bits para la celda `indice` en el estado público `estado`.
+
+    Es una tabla de Zobrist implícita: en lugar de guardar 2 * ancho * alto
+    números se derivan con splitmix64, así que no ocupa memoria y es la misma
+    en todos los procesos y en todos los tableros.
+    """
+    z = (((indice << 2) | estado) * 0x9E3779B97F4A7C15 + 0x9E3779B97F4A7C15) & _MASCARA
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASCARA
+    return z ^ (z >> 31)
+
+
+def hash_publico(publico):
+    """Hash de Zobrist completo de un plano público (un estado por celda, 0 = desconocida)."""
+    valor = 0
+    for disparada in _DISPARADA.finditer(publico):
+        indice = disparada.start()
+        valor ^= clave_zobrist(indice, publico[indice])
+    return valor
+
+
+def hash_celdas(publico, indices, valor=0):
+    """Combina en `valor` las claves de las celdas `indices` en su estado de `publico`."""
+    return reduce(xor, map(clave_zobrist, indices, map(publico.__getitem__, indices)), valor)
+
+
+def clave_estado(campo):
+    """Clave de la posición pública de un campo; solo coincide entre campos de igual configuración.
+
+    Incluye la flota: con el mismo número de naves, otras longitudes dan
+    otras probabilidades y soluciones. CampoDisperso no tiene flota.
+    """
+    return (campo.ancho, campo.alto, campo.num_naves, tuple(getattr(campo, 'flota', None) or ()), campo.hash_publico)
+
+
+class CacheTransposiciones:
+    """Cache LRU acotada de cálculos por estado público del tablero.
+
+    Sirve para memoizar evaluaciones caras (mapas de probabilidad, soluciones)
+    que se repiten cuando distintas partidas llegan a la misma posición.
+    """
+
+    def __init__(self, capacidad=65536):
+        if capacidad <= 0:
+            raise ValueError("La capacidad debe ser positiva")
+
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obtener(self, clave, predeterminado=None):
+        with self._lock:
+            if clave not in self._entradas:
+                self.fallos += 1
+                _FALLOS.incrementar()
+                return predeterminado
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            _ACIERTOS.incrementar()
+            return self._entradas[clave]
+
+    def guardar(self, clave, valor):
+        with self._lock:
+            self._entradas[clave] = valor
+            self._entradas.move_to_end(clave)
+            if len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+
+    def memoizar(self, campo, calcular):
+        """Devuelve calcular(campo), reutilizando el resultado de una posición pública igual."""
+        clave = clave_estado(campo)
+        faltante = object()
+        valor = self.obtener(clave, faltante)
+        if valor is faltante:
+            # Fuera del lock: dos hilos pueden calcular la misma posición, pero nunca se bloquean entre sí
+            valor = calcular(campo)
+            self.guardar(clave, valor)
+        return valor
+
+    def limpiar(self):
+        with self._lock:
+            self._entradas.clear()
@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import json
+import resource
+import time
+
+
+def percentil(valores_ordenados, p):
+    if not valores_ordenados:
+        return 0.0
+    indice = min(len(valores_ordenados) - 1, int(round(p / 100 * (len(valores_ordenados) - 1))))
+    return valores_ordenados[indice]
+
+
+async def _cliente(host, puerto, ancho, alto, num_naves, peticiones, latencias):
+    lector, escritor = await asyncio.open_connection(host, puerto, limit=1 << 20)
+
+    async def pedir(mensaje):
+        inicio = time.perf_counter()
+        escritor.write(json.dumps(mensaje).encode() + b"\n")
+        await escritor.drain()
+        respuesta = json.loads(await lector.readline())
+        latencias.append(time.perf_counter() - inicio)
+        return respuesta
+
+    try:
+        await pedir({'op': 'iniciar_juego', 'ancho': ancho, 'alto': alto, 'num_naves': num_naves})
+        celda = 0
+        for _ in range(peticiones - 1):
+            if celda >= ancho * alto:
+                await pedir({'op': 'iniciar_juego', 'ancho': ancho, 'alto': alto, 'num_naves': num_naves})
+                celda = 0
+                continue
+            respuesta = await pedir({'op': 'disparar', 'fila': celda // ancho, 'columna': celda % ancho})
+            celda += 1
+            if respuesta.get('terminado'):
+                celda = ancho * alto
+    finally:
+        escritor.close()
+
+
+async def ejecutar_carga(host='127.0.0.1', puerto=8765, conexiones=1000, peticiones=50,
+                         ancho=10, alto=10, num_naves=5):
+    """Abre `conexiones` clientes concurrentes y devuelve throughput y latencias."""
+    latencias = []
+    inicio = time.perf_counter()
+    resultados = await asyncio.gather(*(
+        _cliente(host, puerto, ancho, alto, num_naves, peticiones, latencias)
+        for _ in range(conexiones)
+    ), return_exceptions=True)
+    duracion = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        'conexiones': conexiones,
+        'errores': sum(1 for r in resultados if isinstance(r, Exception)),
+        'peticiones': len(latencias),
+        'duracion_s': duracion,
+        'peticiones_por_s': len(latencias) / duracion if duracion else 0.0,
+        'p50_ms': percentil(latencias, 50) * 1000,
+        'p99_ms': percentil(latencias, 99) * 1000,
+    }
+
+
+def _subir_limite_descriptores(necesarios):
+    blando, duro = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if blando < necesarios:
+        nuevo = necesarios if duro == resource.RLIM_INFINITY else min(necesarios, duro)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (nuevo, duro))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generador de carga para el servidor de Batalla Naval")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--conexiones", type=int, default=1000)
+    parser.add_argument("--peticiones", type=int, default=50, help="peticiones por conexión")
+    parser.add_argument("--ancho", type=int, default=10)
+    parser.add_argument("--alto", type=int, default=10)
+    parser.add_argument("--naves", type=int, default=5)
+    argumentos = parser.parse_args()
+
+    _subir_limite_descriptores(argumentos.conexiones + 64)
+    informe = asyncio.run(ejecutar_carga(
+        argumentos.host, argumentos.puerto, argumentos.conexiones, argumentos.peticiones,
+        argumentos.ancho, argumentos.alto, argumentos.naves
+    ))
+
+    print(f"Conexiones: {informe['conexiones']} (errores: {informe['errores']})")
+    print(f"Peticiones: {informe['peticiones']} en {informe['duracion_s']:.2f} s")
+    print(f"Throughput: {informe['peticiones_por_s']:.0f} peticiones/s")
+    print(f"Latencia p50: {informe['p50_ms']:.2f} ms  p99: {informe['p99_ms']:.2f} ms")
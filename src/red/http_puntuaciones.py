@@ -0,0 +1,155 @@
+import argparse
+import gzip
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from src.model.sistema_usuario import SistemaUsuario
+from src.utilidades.logs import configurar_desde_entorno
+
+LIMITE_MAXIMO = 100
+VIGENCIA = 5.0
+
+
+class CachePuntuaciones:
+    """Guarda la clasificación serializada (plana y gzip) por versión y límite.
+
+    La versión combina un identificador de arranque (los ETag de otro proceso
+    o de un arranque anterior nunca coinciden), una época que se incrementa con
+    invalidar(), SistemaUsuario.version_puntuaciones (escrituras de este
+    proceso, visibles al instante) y la cantidad de puntuaciones guardadas,
+    que se vuelve a contar cada `vigencia` segundos como mucho para notar lo
+    que escriben otros procesos. Las puntuaciones solo se agregan, así que la
+    cantidad cambia con cada una. Mientras la versión no cambie, no se lee la
+    clasificación.
+    """
+
+    def __init__(self, sistema_usuario, vigencia=VIGENCIA, reloj=time.monotonic):
+        self.sistema_usuario = sistema_usuario
+        self.vigencia = vigencia
+        self.reloj = reloj
+        self.arranque = uuid.uuid4().hex[:8]
+        self.epoca = 0
+        self._cantidad = None
+        self._contada = None
+        self._entradas = {}
+        self._version_entradas = None
+        self._lock = threading.Lock()
+
+    def _vencida(self, ahora):
+        return self._contada is None or ahora - self._contada >= self.vigencia
+
+    def _cantidad_guardada(self):
+        ahora = self.reloj()
+        if self._vencida(ahora):
+            # Bajo el lock, como las lecturas de la clasificación: el almacenamiento no es seguro entre hilos
+            with self._lock:
+                if self._vencida(ahora):
+                    self._cantidad = self.sistema_usuario.contar_puntuaciones()
+                    self._contada = ahora
+        return self._cantidad
+
+    def version(self):
+        cantidad = self._cantidad_guardada()
+        return f"{self.arranque}.{self.epoca}.{self.sistema_usuario.version_puntuaciones}.{cantidad}"
+
+    def etag(self, limite, version=None):
+        return f'"{version or self.version()}-{limite}"'
+
+    def invalidar(self):
+        with self._lock:
+            self.epoca += 1
+            self._contada = None
+            self._entradas.clear()
+
+    def obtener(self, limite):
+        """Devuelve (etag, cuerpo, cuerpo_gzip), leyendo la clasificación solo si cambió la versión."""
+        version = self.version()
+        etag = self.etag(limite, version)
+        entrada = self._entradas.get(limite)
+        if entrada is not None and entrada[0] == etag:
+            return entrada
+
+        with self._lock:
+            if self._version_entradas != version:
+                # Las entradas de versiones anteriores ya no se van a servir
+                self._entradas.clear()
+                self._version_entradas = version
+            entrada = self._entradas.get(limite)
+            if entrada is not None and entrada[0] == etag:
+                return entrada
+
+            puntuaciones = self.sistema_usuario.obtener_puntuaciones(limite)
+            cuerpo = json.dumps(puntuaciones, ensure_ascii=False).encode('utf-8')
+            entrada = (etag, cuerpo, gzip.compress(cuerpo, mtime=0))
+            self._entradas[limite] = entrada
+            return entrada
+
+
+class _ManejadorPuntuaciones(BaseHTTPRequestHandler):
+    cache = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != '/puntuaciones':
+            self.send_error(404)
+            return
+
+        try:
+            limite = int(parse_qs(url.query).get('limite', ['10'])[0])
+        except ValueError:
+            self.send_error(400, "limite debe ser un entero")
+            return
+        limite = max(1, min(limite, LIMITE_MAXIMO))
+
+        etag = self.cache.etag(limite)
+        if etag in (e.strip() for e in self.headers.get('If-None-Match', '').split(',')):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        etag, cuerpo, cuerpo_gzip = self.cache.obtener(limite)
+        usar_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if usar_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+            cuerpo = cuerpo_gzip
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, formato, *args):
+        pass
+
+
+def crear_servidor(sistema_usuario, host='127.0.0.1', puerto=8080, vigencia=VIGENCIA):
+    """Crea un servidor HTTP de solo lectura para GET /puntuaciones?limite=N."""
+    manejador = type('ManejadorPuntuaciones', (_ManejadorPuntuaciones,), {
+        'cache': CachePuntuaciones(sistema_usuario, vigencia)
+    })
+    return ThreadingHTTPServer((host, puerto), manejador)
+
+
+if __name__ == "__main__":
+    configurar_desde_entorno()
+    parser = argparse.ArgumentParser(description="Clasificación de Batalla Naval por HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8080)
+    parser.add_argument("--vigencia", type=float, default=VIGENCIA,
+                        help="segundos entre consultas al almacenamiento para ver puntuaciones de otros procesos")
+    argumentos = parser.parse_args()
+
+    servidor = crear_servidor(SistemaUsuario(), argumentos.host, argumentos.puerto, argumentos.vigencia)
+    print(f"Clasificación disponible en http://{argumentos.host}:{servidor.server_port}/puntuaciones")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        servidor.server_close()
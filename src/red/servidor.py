@@ -0,0 +1,323 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from src.controller.gestor_sesiones import GestorSesiones
+from src.model.pregeneracion import PoolTableros
+from src.model.puntuaciones import Puntuaciones
+from src.model.sistema_usuario import SistemaUsuario
+from src.utilidades.logs import configurar_desde_entorno
+
+PUNTOS_VICTORIA = 10
+
+LIMITE_LINEA = 1 << 20
+# Cotas de lo que un cliente puede pedir: un tablero o una página enorme bloquearía al servidor
+MAX_LADO = 100
+MAX_LIMITE = 100
+
+_GUID_WEBSOCKET = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class _Conexion:
+    __slots__ = ('jugador', 'id_sesion')
+
+    def __init__(self):
+        self.jugador = None
+        self.id_sesion = None
+
+
+class ErrorProtocolo(Exception):
+    pass
+
+
+class ServidorJuego:
+    """Servidor asyncio que expone el juego con un protocolo JSON por líneas.
+
+    Cada mensaje es un objeto JSON con una clave "op" (registrar,
+    iniciar_sesion, iniciar_juego, disparar, disparar_lote, observar,
+    puntuaciones) y la respuesta lleva "ok" y, si el mensaje la tenía, la
+    misma clave "id".
+    Los clientes que abren la conexión con un handshake HTTP de WebSocket
+    usan el mismo protocolo dentro de frames de texto.
+
+    Las llamadas a SistemaUsuario se ejecutan en un hilo aparte para no
+    bloquear el event loop.
+    """
+
+    def __init__(self, sistema_usuario=None, gestor=None):
+        self.sistema_usuario = sistema_usuario or SistemaUsuario()
+        self.gestor = gestor or GestorSesiones(compacto=True)
+        # Un solo hilo: la sesión de SQLAlchemy y el JSON de SistemaUsuario no admiten escrituras concurrentes
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="almacenamiento")
+        self.servidor = None
+
+        self._operaciones = {
+            'registrar': self._registrar,
+            'iniciar_sesion': self._iniciar_sesion,
+            'iniciar_juego': self._iniciar_juego,
+            'disparar': self._disparar,
+            'disparar_lote': self._disparar_lote,
+            'observar': self._observar,
+            'puntuaciones': self._puntuaciones,
+        }
+
+    async def iniciar(self, host='127.0.0.1', puerto=8765):
+        self.servidor = await asyncio.start_server(self._atender, host, puerto, limit=LIMITE_LINEA)
+        return self.servidor.sockets[0].getsockname()[1]
+
+    async def detener(self):
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        self.executor.shutdown(wait=False)
+
+    async def _en_hilo(self, funcion, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, funcion, *args)
+
+    async def _atender(self, lector, escritor):
+        conexion = _Conexion()
+        try:
+            primera = await lector.readline()
+            if primera.startswith(b"GET "):
+                await self._atender_websocket(primera, lector, escritor, conexion)
+            else:
+                linea = primera
+                while linea:
+                    if linea.strip():
+                        respuesta = await self.procesar_linea(conexion, linea)
+                        escritor.write(respuesta + b"\n")
+                        await escritor.drain()
+                    linea = await lector.readline()
+        except (ConnectionError, asyncio.IncompleteReadError, ErrorProtocolo, ValueError):
+            pass
+        finally:
+            if conexion.id_sesion:
+                self.gestor.eliminar_sesion(conexion.id_sesion)
+            escritor.close()
+
+    async def procesar_linea(self, conexion, linea):
+        try:
+            mensaje = json.loads(linea)
+            if not isinstance(mensaje, dict):
+                raise ValueError("El mensaje debe ser un objeto JSON")
+        except ValueError as e:
+            return json.dumps({'ok': False, 'error': f"JSON inválido: {e}"}).encode()
+
+        respuesta = await self.procesar(conexion, mensaje)
+        return json.dumps(respuesta).encode()
+
+    async def procesar(self, conexion, mensaje):
+        operacion = self._operaciones.get(mensaje.get('op'))
+        if operacion is None:
+            respuesta = {'ok': False, 'error': f"Operación desconocida: {mensaje.get('op')}"}
+        else:
+            try:
+                respuesta = await operacion(conexion, mensaje)
+                respuesta['ok'] = True
+            except (KeyError, TypeError, ValueError) as e:
+                respuesta = {'ok': False, 'error': str(e)}
+
+        if 'id' in mensaje:
+            respuesta['id'] = mensaje['id']
+        return respuesta
+
+    async def _registrar(self, conexion, mensaje):
+        registrado = await self._en_hilo(
+            self.sistema_usuario.registrar_jugador, mensaje['nombre'], mensaje['contraseña']
+        )
+        return {'registrado': bool(registrado)}
+
+    async def _iniciar_sesion(self, conexion, mensaje):
+        jugador = await self._en_hilo(
+            self.sistema_usuario.iniciar_sesion, mensaje['nombre'], mensaje['contraseña']
+        )
+        if not jugador:
+            raise ValueError("Credenciales incorrectas")
+
+        conexion.jugador = jugador
+        return {'nombre': jugador.nombre_usuario, 'puntaje': jugador.puntaje}
+
+    async def _iniciar_juego(self, conexion, mensaje):
+        ancho = _entero_acotado(mensaje, 'ancho', 10, 2, MAX_LADO)
+        alto = _entero_acotado(mensaje, 'alto', 10, 2, MAX_LADO)
+        num_naves = _entero_acotado(mensaje, 'num_naves', 5, 1, ancho * alto)
+
+        if conexion.id_sesion:
+            self.gestor.eliminar_sesion(conexion.id_sesion)
+        conexion.id_sesion = self.gestor.crear_sesion(ancho, alto, num_naves)
+        return {'sesion': conexion.id_sesion}
+
+    def _juego_activo(self, conexion):
+        if not conexion.id_sesion:
+            raise ValueError("No hay un juego activo")
+        return conexion.id_sesion
+
+    async def _disparar(self, conexion, mensaje):
+        id_sesion = self._juego_activo(conexion)
+        fila, columna = int(mensaje['fila']), int(mensaje['columna'])
+
+        def disparar(juego):
+            _exigir_en_curso(juego)
+            return juego.realizar_disparo(fila, columna), juego.verificar_ganador() is not None
+
+        # Solo se llega a terminado desde un juego en curso: la victoria se registra una vez
+        impacto, terminado = self.gestor.ejecutar(id_sesion, disparar)
+        if terminado:
+            await self._registrar_victoria(conexion)
+        return {'impacto': impacto, 'terminado': terminado}
+
+    async def _disparar_lote(self, conexion, mensaje):
+        id_sesion = self._juego_activo(conexion)
+        disparos = [(int(fila), int(columna)) for fila, columna in mensaje['disparos']]
+
+        def disparar(juego):
+            _exigir_en_curso(juego)
+            resultados = []
+            for fila, columna in disparos:
+                if juego.verificar_ganador():
+                    break
+                try:
+                    resultados.append(juego.realizar_disparo(fila, columna))
+                except ValueError as e:
+                    resultados.append(str(e))
+            return resultados, juego.verificar_ganador() is not None
+
+        resultados, terminado = self.gestor.ejecutar(id_sesion, disparar)
+        if terminado:
+            await self._registrar_victoria(conexion)
+        return {'resultados': resultados, 'terminado': terminado}
+
+    async def _observar(self, conexion, mensaje):
+        # Cualquiera que conozca el id de sesión puede mirar el tablero, sin ver las naves
+        id_sesion = mensaje.get('sesion') or self._juego_activo(conexion)
+
+        def observar(juego):
+            vista = juego.campo.vista()
+            return {'ancho': vista.ancho, 'alto': vista.alto, 'tablero': vista.texto()}
+
+        return self.gestor.ejecutar(id_sesion, observar)
+
+    async def _registrar_victoria(self, conexion):
+        if conexion.jugador is None:
+            return
+
+        puntuaciones = Puntuaciones(conexion.jugador, sistema_usuario=self.sistema_usuario)
+        await self._en_hilo(puntuaciones.actualizar_puntuacion, PUNTOS_VICTORIA)
+
+    async def _puntuaciones(self, conexion, mensaje):
+        limite = _entero_acotado(mensaje, 'limite', 10, 1, MAX_LIMITE)
+        return {'puntuaciones': await self._en_hilo(self.sistema_usuario.obtener_puntuaciones, limite)}
+
+    async def _atender_websocket(self, primera, lector, escritor, conexion):
+        cabeceras = {}
+        linea = await lector.readline()
+        while linea.strip():
+            nombre, _, valor = linea.decode('latin-1').partition(':')
+            cabeceras[nombre.strip().lower()] = valor.strip()
+            linea = await lector.readline()
+
+        clave = cabeceras.get('sec-websocket-key')
+        if not clave:
+            escritor.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            await escritor.drain()
+            return
+
+        aceptar = base64.b64encode(hashlib.sha1((clave + _GUID_WEBSOCKET).encode()).digest()).decode()
+        escritor.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {aceptar}\r\n\r\n"
+        ).encode())
+        await escritor.drain()
+
+        while True:
+            opcode, datos = await leer_frame(lector)
+            if opcode == 0x8:
+                escritor.write(codificar_frame(datos[:2], opcode=0x8))
+                await escritor.drain()
+                return
+            if opcode == 0x9:
+                escritor.write(codificar_frame(datos, opcode=0xA))
+            elif opcode == 0x1:
+                escritor.write(codificar_frame(await self.procesar_linea(conexion, datos)))
+            await escritor.drain()
+
+
+def _entero_acotado(mensaje, clave, predeterminado, minimo, maximo):
+    valor = int(mensaje.get(clave, predeterminado))
+    if not minimo <= valor <= maximo:
+        raise ValueError(f"{clave} debe estar entre {minimo} y {maximo}")
+    return valor
+
+
+def _exigir_en_curso(juego):
+    if juego.verificar_ganador() is not None:
+        raise ValueError("El juego ya terminó; inicie otro con iniciar_juego")
+
+
+def codificar_frame(datos, opcode=0x1, mascara=None):
+    """Codifica un frame WebSocket final. Los clientes deben enmascarar (RFC 6455)."""
+    bit_mascara = 0x80 if mascara else 0
+    longitud = len(datos)
+
+    if longitud < 126:
+        cabecera = struct.pack('!BB', 0x80 | opcode, bit_mascara | longitud)
+    elif longitud < 1 << 16:
+        cabecera = struct.pack('!BBH', 0x80 | opcode, bit_mascara | 126, longitud)
+    else:
+        cabecera = struct.pack('!BBQ', 0x80 | opcode, bit_mascara | 127, longitud)
+
+    if mascara:
+        datos = bytes(b ^ mascara[i % 4] for i, b in enumerate(datos))
+        return cabecera + mascara + datos
+    return cabecera + datos
+
+
+async def leer_frame(lector):
+    """Lee un frame WebSocket y devuelve (opcode, datos). Los mensajes fragmentados no se admiten."""
+    b0, b1 = await lector.readexactly(2)
+    if not b0 & 0x80:
+        raise ErrorProtocolo("Frames fragmentados no soportados")
+
+    longitud = b1 & 0x7F
+    if longitud == 126:
+        (longitud,) = struct.unpack('!H', await lector.readexactly(2))
+    elif longitud == 127:
+        (longitud,) = struct.unpack('!Q', await lector.readexactly(8))
+    if longitud > LIMITE_LINEA:
+        raise ErrorProtocolo("Frame demasiado grande")
+
+    mascara = await lector.readexactly(4) if b1 & 0x80 else None
+    datos = await lector.readexactly(longitud)
+    if mascara:
+        datos = bytes(b ^ mascara[i % 4] for i, b in enumerate(datos))
+    return b0 & 0x0F, datos
+
+
+async def _principal(argumentos):
+    config = {'backend': argumentos.almacenamiento} if argumentos.almacenamiento else None
+    servidor = ServidorJuego(
+        SistemaUsuario(config),
+        GestorSesiones(max_sesiones=argumentos.max_sesiones, pool=PoolTableros().iniciar(), compacto=True)
+    )
+    puerto = await servidor.iniciar(argumentos.host, argumentos.puerto)
+    print(f"Servidor escuchando en {argumentos.host}:{puerto}")
+    async with servidor.servidor:
+        await servidor.servidor.serve_forever()
+
+
+if __name__ == "__main__":
+    configurar_desde_entorno()
+    parser = argparse.ArgumentParser(description="Servidor de red de Batalla Naval")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--max-sesiones", type=int, default=10000)
+    parser.add_argument("--almacenamiento", choices=["auto", "postgres", "json", "memoria"])
+    try:
+        asyncio.run(_principal(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
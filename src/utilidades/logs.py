@@ -0,0 +1,111 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+RAIZ = "batalla_naval"
+
+# Atributos estándar de LogRecord; todo lo demás viene de `extra` y se
+# incluye como campo estructurado.
+_ATRIBUTOS_ESTANDAR = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_logger_raiz = logging.getLogger(RAIZ)
+_logger_raiz.addHandler(logging.NullHandler())
+_logger_raiz.propagate = False
+
+_listener = None
+_handler_cola = None
+
+
+def obtener_logger(nombre):
+    """Devuelve el logger `batalla_naval.<nombre>`. Sin configurar_logs() no emite nada."""
+    return logging.getLogger(f"{RAIZ}.{nombre}")
+
+
+class FormatoJSON(logging.Formatter):
+    """Una línea JSON por registro, con los campos pasados en `extra`."""
+
+    def format(self, record):
+        datos = {
+            'fecha': self.formatTime(record),
+            'nivel': record.levelname,
+            'logger': record.name,
+            'mensaje': record.getMessage(),
+        }
+        for clave, valor in vars(record).items():
+            if clave not in _ATRIBUTOS_ESTANDAR:
+                datos[clave] = valor
+        if record.exc_info:
+            datos['excepcion'] = self.formatException(record.exc_info)
+        return json.dumps(datos, ensure_ascii=False, default=str)
+
+
+class _HandlerColaPerezoso(logging.handlers.QueueHandler):
+    # QueueHandler.prepare() formatea el mensaje en el hilo que emite; aquí se
+    # encola el registro tal cual y el formateo ocurre en el hilo del listener.
+    def prepare(self, record):
+        return record
+
+
+def configurar_logs(nivel=logging.INFO, destino=None, formato='json'):
+    """Activa los logs de la aplicación a través de una cola.
+
+    Emitir un registro solo lo encola; un QueueListener en segundo plano lo
+    formatea y lo escribe en `destino` (una ruta o un stream, stderr por defecto).
+    """
+    global _listener, _handler_cola
+
+    detener_logs()
+
+    if destino is None:
+        handler = logging.StreamHandler(sys.stderr)
+    elif isinstance(destino, str):
+        handler = logging.FileHandler(destino, encoding='utf-8')
+    else:
+        handler = logging.StreamHandler(destino)
+
+    if formato == 'json':
+        handler.setFormatter(FormatoJSON())
+    else:
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+
+    cola = queue.SimpleQueue()
+    _handler_cola = _HandlerColaPerezoso(cola)
+    _listener = logging.handlers.QueueListener(cola, handler, respect_handler_level=True)
+
+    _logger_raiz.setLevel(nivel)
+    _logger_raiz.addHandler(_handler_cola)
+    _listener.start()
+    return _listener
+
+
+def detener_logs():
+    """Vacía la cola pendiente y desactiva los logs."""
+    global _listener, _handler_cola
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _handler_cola is not None:
+        _logger_raiz.removeHandler(_handler_cola)
+        _handler_cola = None
+
+
+def configurar_desde_entorno():
+    """Activa los logs si BATALLA_NAVAL_LOG define un nivel (DEBUG, INFO...).
+
+    BATALLA_NAVAL_LOG_ARCHIVO redirige la salida a un archivo. Sin estas
+    variables los front ends no escriben nada.
+    """
+    nivel = os.environ.get('BATALLA_NAVAL_LOG')
+    if not nivel:
+        return None
+    return configurar_logs(nivel.upper(), os.environ.get('BATALLA_NAVAL_LOG_ARCHIVO'))
+
+
+atexit.register(detener_logs)
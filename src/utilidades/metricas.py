@@ -0,0 +1,174 @@
+import bisect
+import functools
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Límites (en segundos) de los histogramas de latencia
+LIMITES_LATENCIA = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Contador:
+    tipo = 'counter'
+
+    def __init__(self, registro, nombre, ayuda):
+        self.registro = registro
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.valor = 0
+        self._lock = threading.Lock()
+
+    def incrementar(self, cantidad=1):
+        if not self.registro.habilitado:
+            return
+        with self._lock:
+            self.valor += cantidad
+
+    def _exportar(self):
+        return [f"{self.nombre} {self.valor}"]
+
+
+class Medidor:
+    tipo = 'gauge'
+
+    def __init__(self, registro, nombre, ayuda):
+        self.registro = registro
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.valor = 0
+
+    def establecer(self, valor):
+        if self.registro.habilitado:
+            self.valor = valor
+
+    def _exportar(self):
+        return [f"{self.nombre} {self.valor}"]
+
+
+class Histograma:
+    tipo = 'histogram'
+
+    def __init__(self, registro, nombre, ayuda, limites=LIMITES_LATENCIA):
+        self.registro = registro
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.limites = tuple(sorted(limites))
+        # Un cubo por límite más el de +Inf; no acumulados hasta exportar
+        self.cubos = [0] * (len(self.limites) + 1)
+        self.suma = 0.0
+        self.cuenta = 0
+        self._lock = threading.Lock()
+
+    def observar(self, valor):
+        if not self.registro.habilitado:
+            return
+        indice = bisect.bisect_left(self.limites, valor)
+        with self._lock:
+            self.cubos[indice] += 1
+            self.suma += valor
+            self.cuenta += 1
+
+    def _exportar(self):
+        with self._lock:
+            cubos = list(self.cubos)
+            suma, cuenta = self.suma, self.cuenta
+
+        lineas = []
+        acumulado = 0
+        for limite, cantidad in zip(self.limites, cubos):
+            acumulado += cantidad
+            lineas.append(f'{self.nombre}_bucket{{le="{limite}"}} {acumulado}')
+        lineas.append(f'{self.nombre}_bucket{{le="+Inf"}} {cuenta}')
+        lineas.append(f"{self.nombre}_sum {suma}")
+        lineas.append(f"{self.nombre}_count {cuenta}")
+        return lineas
+
+
+class RegistroMetricas:
+    """Conjunto de métricas con nombre. Deshabilitado, cada operación es una sola comprobación."""
+
+    def __init__(self, habilitado=False):
+        self.habilitado = habilitado
+        self._metricas = {}
+        self._lock = threading.Lock()
+
+    def _obtener(self, clase, nombre, ayuda, *args):
+        with self._lock:
+            metrica = self._metricas.get(nombre)
+            if metrica is None:
+                metrica = clase(self, nombre, ayuda, *args)
+                self._metricas[nombre] = metrica
+            elif not isinstance(metrica, clase):
+                raise ValueError(f"La métrica {nombre} ya existe con otro tipo")
+            return metrica
+
+    def contador(self, nombre, ayuda=""):
+        return self._obtener(Contador, nombre, ayuda)
+
+    def medidor(self, nombre, ayuda=""):
+        return self._obtener(Medidor, nombre, ayuda)
+
+    def histograma(self, nombre, ayuda="", limites=LIMITES_LATENCIA):
+        return self._obtener(Histograma, nombre, ayuda, limites)
+
+    def __getitem__(self, nombre):
+        return self._metricas[nombre]
+
+    def exportar_prometheus(self):
+        """Devuelve todas las métricas en el formato de texto de Prometheus."""
+        lineas = []
+        for metrica in sorted(self._metricas.values(), key=lambda m: m.nombre):
+            lineas.append(f"# HELP {metrica.nombre} {metrica.ayuda}")
+            lineas.append(f"# TYPE {metrica.nombre} {metrica.tipo}")
+            lineas.extend(metrica._exportar())
+        return "\n".join(lineas) + "\n"
+
+    def volcar(self, ruta):
+        with open(ruta, 'w', encoding='utf-8') as f:
+            f.write(self.exportar_prometheus())
+
+
+REGISTRO = RegistroMetricas(habilitado=bool(os.environ.get('BATALLA_NAVAL_METRICAS')))
+
+
+def habilitar_metricas(habilitado=True):
+    REGISTRO.habilitado = habilitado
+
+
+def cronometrar(histograma):
+    """Decorador que observa en `histograma` la duración de cada llamada."""
+    def decorador(funcion):
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not histograma.registro.habilitado:
+                return funcion(*args, **kwargs)
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                histograma.observar(time.perf_counter() - inicio)
+        return envoltura
+    return decorador
+
+
+def iniciar_servidor_metricas(puerto=9100, host='127.0.0.1', registro=REGISTRO):
+    """Sirve GET /metrics en un hilo en segundo plano y devuelve el servidor."""
+    class ManejadorMetricas(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/metrics':
+                self.send_error(404)
+                return
+            cuerpo = registro.exportar_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, formato, *args):
+            pass
+
+    servidor = ThreadingHTTPServer((host, puerto), ManejadorMetricas)
+    threading.Thread(target=servidor.serve_forever, daemon=True, name="metricas").start()
+    return servidor
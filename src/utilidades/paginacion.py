@@ -0,0 +1,84 @@
+from collections import deque
+
+
+class VentanaPaginada:
+    """Ventana deslizante de páginas contiguas de una lista que se lee por trozos.
+
+    Solo guarda `max_paginas` páginas: al agregar una por un extremo se
+    descarta la del extremo opuesto, así que la memoria no depende del total
+    de filas. Cada fila recibe su 'posicion' global (desde 1).
+    """
+
+    def __init__(self, tamaño_pagina=50, max_paginas=5):
+        if tamaño_pagina <= 0 or max_paginas < 2:
+            raise ValueError("Se necesitan páginas no vacías y al menos dos en la ventana")
+
+        self.tamaño_pagina = tamaño_pagina
+        self.max_paginas = max_paginas
+        self.total = 0
+        self.primera = 0
+        self.paginas = deque()
+
+    @property
+    def num_paginas(self):
+        return -(-self.total // self.tamaño_pagina)
+
+    @property
+    def desplazamiento(self):
+        """Índice global de la primera fila de la ventana."""
+        return self.primera * self.tamaño_pagina
+
+    def pagina_de(self, indice):
+        return indice // self.tamaño_pagina
+
+    def reiniciar(self, total, pagina=0):
+        self.total = total
+        self.primera = max(0, min(pagina, self.num_paginas - 1))
+        self.paginas.clear()
+
+    def siguiente(self):
+        """Página a pedir para extender la ventana hacia abajo, o None."""
+        pagina = self.primera + len(self.paginas)
+        return pagina if pagina < self.num_paginas else None
+
+    def anterior(self):
+        """Página a pedir para extender la ventana hacia arriba, o None."""
+        return self.primera - 1 if self.paginas and self.primera > 0 else None
+
+    def agregar(self, pagina, filas):
+        """Incorpora una página y devuelve cuántas filas se corrió el contenido ya visible.
+
+        El valor es positivo si se agregaron filas por arriba y negativo si se
+        descartaron; las páginas que no son contiguas a la ventana se ignoran.
+        """
+        filas = [dict(fila, posicion=pagina * self.tamaño_pagina + i + 1) for i, fila in enumerate(filas)]
+
+        if not self.paginas and pagina == self.primera:
+            self.paginas.append(filas)
+            return 0
+
+        if self.paginas and pagina == self.primera + len(self.paginas):
+            self.paginas.append(filas)
+            if len(self.paginas) > self.max_paginas:
+                self.primera += 1
+                return -len(self.paginas.popleft())
+            return 0
+
+        if self.paginas and pagina == self.primera - 1:
+            self.paginas.appendleft(filas)
+            self.primera -= 1
+            if len(self.paginas) > self.max_paginas:
+                self.paginas.pop()
+            return len(filas)
+
+        return 0
+
+    def filas(self):
+        return [fila for pagina in self.paginas for fila in pagina]
+
+    def indice_local(self, indice):
+        """Convierte un índice global en uno dentro de la ventana, o None si no está cargado."""
+        local = indice - self.desplazamiento
+        if 0 <= local < sum(len(pagina) for pagina in self.paginas):
+            return local
+        return None
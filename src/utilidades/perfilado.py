@@ -0,0 +1,99 @@
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+
+def leer_guion(ruta, eco=True):
+    """Devuelve una función compatible con input() que responde con las líneas de `ruta`.
+
+    Las líneas que empiezan con '#' son comentarios; una línea vacía es una
+    respuesta vacía (acepta el valor predeterminado). Al agotarse el guion
+    lanza EOFError, igual que input() al cerrarse la entrada.
+    """
+    with open(ruta, 'r', encoding='utf-8') as f:
+        respuestas = [linea.rstrip('\n') for linea in f if not linea.startswith('#')]
+    pendientes = iter(respuestas)
+
+    def entrada(mensaje=""):
+        try:
+            respuesta = next(pendientes)
+        except StopIteration:
+            raise EOFError("Fin del guion") from None
+        if eco:
+            print(f"{mensaje}{respuesta}")
+        return respuesta
+
+    return entrada
+
+
+class PerfiladorMuestreo:
+    """Muestrea periódicamente la pila de un hilo y cuenta las pilas colapsadas.
+
+    El resultado se guarda en el formato 'a;b;c N' que consumen flamegraph.pl
+    y speedscope.
+    """
+
+    def __init__(self, intervalo=0.001, id_hilo=None):
+        self.intervalo = intervalo
+        self.id_hilo = id_hilo if id_hilo is not None else threading.get_ident()
+        self.pilas = Counter()
+        self._detener = threading.Event()
+        self._hilo = None
+
+    def _muestrear(self):
+        propio = threading.get_ident()
+        while not self._detener.wait(self.intervalo):
+            marco = sys._current_frames().get(self.id_hilo)
+            if marco is None or self.id_hilo == propio:
+                continue
+
+            pila = []
+            while marco is not None:
+                codigo = marco.f_code
+                pila.append(f"{os.path.basename(codigo.co_filename)}:{codigo.co_name}")
+                marco = marco.f_back
+            self.pilas[';'.join(reversed(pila))] += 1
+
+    def iniciar(self):
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._muestrear, daemon=True, name="perfilador")
+        self._hilo.start()
+
+    def detener(self):
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join()
+            self._hilo = None
+
+    def guardar_colapsado(self, ruta):
+        with open(ruta, 'w', encoding='utf-8') as f:
+            for pila, cantidad in self.pilas.most_common():
+                f.write(f"{pila} {cantidad}\n")
+
+
+def perfilar(funcion, ruta_base, intervalo=0.001):
+    """Ejecuta funcion() bajo cProfile y el perfilador de muestreo.
+
+    Escribe `ruta_base`.pstats (cargable con pstats o snakeviz) y
+    `ruta_base`.folded (pilas colapsadas para flame graphs). Devuelve el
+    resultado de la función; las salidas se escriben aunque termine con
+    excepción o sys.exit().
+    """
+    perfil = cProfile.Profile()
+    muestreo = PerfiladorMuestreo(intervalo)
+    inicio = time.perf_counter()
+
+    muestreo.iniciar()
+    perfil.enable()
+    try:
+        return funcion()
+    finally:
+        perfil.disable()
+        muestreo.detener()
+        perfil.dump_stats(f"{ruta_base}.pstats")
+        muestreo.guardar_colapsado(f"{ruta_base}.folded")
+        print(f"Perfil ({time.perf_counter() - inicio:.2f} s): {ruta_base}.pstats, {ruta_base}.folded",
+              file=sys.stderr)
@@ -0,0 +1,78 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.utilidades.logs import obtener_logger
+
+logger = obtener_logger('tareas')
+
+
+def _llamar_directo(funcion):
+    funcion()
+
+
+class Tarea:
+    """Trabajo enviado a un EjecutorTareas. cancelar() evita que se entreguen sus resultados."""
+
+    def __init__(self):
+        self.futuro = None
+        self.cancelada = False
+        self.terminada = False
+
+    def cancelar(self):
+        self.cancelada = True
+        if self.futuro is not None:
+            # Si aún no empezó, ni siquiera se ejecuta; si está en curso, su resultado se descarta
+            self.futuro.cancel()
+
+
+class EjecutorTareas:
+    """Ejecuta funciones bloqueantes (almacenamiento, red) en un pool de hilos.
+
+    Los callbacks al_terminar(resultado) y al_fallar(excepcion) se entregan
+    con `programar`, que recibe una función sin argumentos; la interfaz de
+    Kivy la pasa a Clock.schedule_once para que corran en el hilo principal.
+    Una tarea cancelada antes de entregarse no llama a ningún callback.
+    """
+
+    def __init__(self, max_hilos=1, programar=None, nombre="tareas"):
+        self.programar = programar or _llamar_directo
+        self._executor = ThreadPoolExecutor(max_workers=max_hilos, thread_name_prefix=nombre)
+        self._lock = threading.Lock()
+        self._pendientes = 0
+
+    @property
+    def pendientes(self):
+        return self._pendientes
+
+    def enviar(self, funcion, *args, al_terminar=None, al_fallar=None):
+        tarea = Tarea()
+        with self._lock:
+            self._pendientes += 1
+
+        def entregar(futuro):
+            with self._lock:
+                self._pendientes -= 1
+            if futuro.cancelled():
+                return
+
+            excepcion = futuro.exception()
+            if excepcion is not None and al_fallar is None:
+                logger.error("Error en tarea en segundo plano: %s", excepcion, exc_info=excepcion)
+
+            def en_destino():
+                tarea.terminada = True
+                if tarea.cancelada:
+                    return
+                if excepcion is not None:
+                    if al_fallar is not None:
+                        al_fallar(excepcion)
+                elif al_terminar is not None:
+                    al_terminar(futuro.result())
+
+            self.programar(en_destino)
+
+        tarea.futuro = self._executor.submit(funcion, *args)
+        tarea.futuro.add_done_callback(entregar)
+        return tarea
+
+    def cerrar(self, esperar=True):
+        self._executor.shutdown(wait=esperar)
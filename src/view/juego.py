@@ -1,22 +1,66 @@
+from kivy.clock import Clock
 from kivy.uix.screenmanager import Screen
 from kivy.properties import StringProperty
 from kivy.lang import Builder
 from src.controller.controlador import Controlador
+from src.controller.eventos import (DisparoDeshecho, DisparoResuelto, JuegoGanado, JuegoIniciado, NaveHundida,
+                                    PuntuacionRegistrada, RespaldoActivado)
+from src.view.tablero import TableroWidget
 import os
 
 kv_path = os.path.join(os.path.dirname(__file__), 'kv', 'juego.kv')
 Builder.load_file(os.path.abspath(kv_path))
 
 class JuegoScreen(Screen):
-    tablero_texto = StringProperty("")
     mensaje = StringProperty("")
     estado_juego = StringProperty("")
 
     def __init__(self, **kwargs):
         super(JuegoScreen, self).__init__(**kwargs)
         self.controlador = Controlador()
+        self._controlador_observado = None
+
+    def _observar_controlador(self):
+        # main.py reemplaza el controlador después de crear la pantalla
+        if self._controlador_observado is not self.controlador:
+            if self._controlador_observado is not None:
+                self._controlador_observado.eventos.desuscribir(self._evento)
+            # El tablero se actualiza por celdas y el estado solo se recalcula cuando un evento lo cambia
+            self.controlador.eventos.suscribir(self._evento, (
+                JuegoIniciado, DisparoResuelto, DisparoDeshecho, NaveHundida, JuegoGanado, PuntuacionRegistrada,
+                RespaldoActivado
+            ))
+            self._controlador_observado = self.controlador
+
+    def _evento(self, evento):
+        if isinstance(evento, RespaldoActivado):
+            # Puede llegar desde el hilo del almacenamiento
+            Clock.schedule_once(lambda dt: self._respaldo_activado(evento))
+            return
+        if isinstance(evento, DisparoResuelto):
+            for fila, columna, impacto in evento.celdas:
+                self.ids.tablero.actualizar_celda(fila, columna, 3 if impacto else 2)
+            return
+        if isinstance(evento, DisparoDeshecho):
+            for fila, columna in evento.celdas:
+                self.ids.tablero.actualizar_celda(fila, columna, 0)
+        if isinstance(evento, NaveHundida):
+            self.mensaje = f"¡Nave de {len(evento.celdas)} celda(s) hundida!"
+        self.actualizar_estado_juego()
+
+    def _respaldo_activado(self, evento):
+        self.mensaje = f"Base de datos no disponible ({evento.backend}); se usa el respaldo JSON."
+
+    def cargar_tablero(self):
+        juego = self.controlador.juego
+        if not juego:
+            self.ids.tablero.limpiar()
+            return
+        campo = juego.campo
+        self.ids.tablero.cargar(campo.ancho, campo.alto, campo.vista().datos)
 
     def on_enter(self):
+        self._observar_controlador()
         if hasattr(self.ids, 'ancho_input'):
             self.ids.ancho_input.text = "10"
         if hasattr(self.ids, 'alto_input'):
@@ -28,6 +72,7 @@ class JuegoScreen(Screen):
         if hasattr(self.ids, 'columna_input'):
             self.ids.columna_input.text = ""
 
+        self.cargar_tablero()
         self.actualizar_estado_juego()
 
     def iniciar_juego(self):
@@ -40,9 +85,9 @@ class JuegoScreen(Screen):
             alto = int(alto_texto) if alto_texto else 10
             num_naves = int(naves_texto) if naves_texto else 5
 
-            if ancho < 2 or ancho > 20:
+            if ancho < 2 or ancho > 100:
                 ancho = 10
-            if alto < 2 or alto > 20:
+            if alto < 2 or alto > 100:
                 alto = 10
             if num_naves < 1 or num_naves > ancho * alto:
                 num_naves = min(5, ancho * alto // 2)
@@ -50,7 +95,7 @@ class JuegoScreen(Screen):
             self.controlador.iniciar_juego(ancho, alto, num_naves)
             self.mensaje = "Juego iniciado. ¡Buena suerte!"
 
-            self.actualizar_estado_juego()
+            self.cargar_tablero()
 
         except Exception as e:
             self.mensaje = f"Error: {str(e)}"
@@ -68,25 +113,31 @@ class JuegoScreen(Screen):
                 self.mensaje = "Debes especificar fila y columna."
                 return
 
-            fila = int(fila_texto)
-            columna = int(columna_texto)
+            self.disparar_en(int(fila_texto), int(columna_texto))
+            self.ids.fila_input.text = ""
+            self.ids.columna_input.text = ""
+
+        except ValueError:
+            self.mensaje = "Entrada inválida. Usa números enteros."
+
+    def disparar_en(self, fila, columna):
+        try:
+            if not self.controlador.juego:
+                self.mensaje = "Debes iniciar un juego primero."
+                return
+            if self.controlador.juego_terminado():
+                self.mensaje = "El juego ya terminó."
+                return
 
             if (fila < 0 or fila >= self.controlador.juego.alto or
                 columna < 0 or columna >= self.controlador.juego.ancho):
                 self.mensaje = f"Coordenadas fuera de rango. Rango válido: filas (0-{self.controlador.juego.alto-1}), columnas (0-{self.controlador.juego.ancho-1})"
                 return
 
-            impacto = self.controlador.realizar_disparo(fila, columna)
-
-            if impacto:
-                self.mensaje = "¡Impacto en una nave!"
-            else:
-                self.mensaje = "Disparo al agua."
-
-            self.ids.fila_input.text = ""
-            self.ids.columna_input.text = ""
-
-            self.actualizar_estado_juego()
+            # El mensaje va antes: el evento de nave hundida lo reemplaza
+            impacto = self.controlador.juego.campo.estado(fila, columna) == 1
+            self.mensaje = "¡Impacto en una nave!" if impacto else "Disparo al agua."
+            self.controlador.realizar_disparo(fila, columna)
 
         except ValueError as e:
             if "ya ha sido impactada" in str(e):
@@ -96,17 +147,41 @@ class JuegoScreen(Screen):
         except Exception as e:
             self.mensaje = f"Error: {str(e)}"
 
+    def deshacer_disparo(self):
+        if self.controlador.deshacer_disparo():
+            self.mensaje = "Disparo deshecho."
+        else:
+            self.mensaje = "No hay disparos para deshacer."
+
     def reiniciar_juego(self):
         if self.controlador.reiniciar_juego():
             self.mensaje = "Juego reiniciado."
-            self.actualizar_estado_juego()
+            self.cargar_tablero()
         else:
             self.mensaje = "No hay un juego activo para reiniciar."
 
-    def actualizar_estado_juego(self):
+    def guardar_partida(self):
         try:
-            self.tablero_texto = self.controlador.obtener_representacion_tablero()
+            if self.controlador.guardar_partida():
+                self.mensaje = "Partida guardada."
+            else:
+                self.mensaje = "No hay un juego activo para guardar."
+        except OSError as e:
+            self.mensaje = f"Error al guardar la partida: {str(e)}"
+
+    def reanudar_partida(self):
+        try:
+            if self.controlador.reanudar_partida():
+                self.mensaje = "Partida reanudada."
+                self.cargar_tablero()
+            else:
+                self.mensaje = "No hay una partida guardada."
+        except (OSError, ValueError) as e:
+            self.mensaje = f"Error al cargar la partida: {str(e)}"
 
+    def actualizar_estado_juego(self):
+        # El tablero se redibuja por celdas desde el controlador; aquí solo el estado
+        try:
             if self.controlador.juego:
                 if self.controlador.juego_terminado():
                     self.estado_juego = "¡JUEGO TERMINADO!"
@@ -118,7 +193,6 @@ class JuegoScreen(Screen):
             else:
                 self.estado_juego = "Configura el tablero y presiona 'Iniciar Juego'"
         except Exception as e:
-            self.tablero_texto = "Error al actualizar el tablero"
             self.estado_juego = f"Error: {str(e)}"
 
     def volver(self):
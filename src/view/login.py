@@ -1,13 +1,13 @@
-from kivy.uix.screenmanager import Screen
 from kivy.properties import StringProperty
 from kivy.lang import Builder
 from src.controller.controlador import Controlador
+from src.view.segundo_plano import PantallaAsincrona
 import os
 
 kv_path = os.path.join(os.path.dirname(__file__), 'kv', 'login.kv')
 Builder.load_file(os.path.abspath(kv_path))
 
-class LoginScreen(Screen):
+class LoginScreen(PantallaAsincrona):
     mensaje = StringProperty("")
     
     def __init__(self, **kwargs):
@@ -30,7 +30,17 @@ class LoginScreen(Screen):
             self.mensaje = "❌ Todos los campos son obligatorios."
             return
         
-        if self.controlador.iniciar_sesion(usuario, contraseña):
+        if self.cargando:
+            return
+
+        self.mensaje = "⏳ Iniciando sesión..."
+        self.en_segundo_plano(
+            self.controlador.sistema_usuario.iniciar_sesion, usuario, contraseña,
+            al_terminar=self._sesion_iniciada, al_fallar=self._error
+        )
+    
+    def _sesion_iniciada(self, jugador):
+        if self.controlador.establecer_jugador_activo(jugador):
             self.mensaje = "✅ Inicio de sesión exitoso."
             juego_screen = self.manager.get_screen("juego")
             juego_screen.controlador = self.controlador
@@ -38,5 +48,8 @@ class LoginScreen(Screen):
         else:
             self.mensaje = "❌ Credenciales incorrectas."
     
+    def _error(self, excepcion):
+        self.mensaje = f"❌ Error al iniciar sesión: {excepcion}"
+    
     def volver(self):
         self.manager.current = "menu"
@@ -1,38 +1,150 @@
-from kivy.uix.screenmanager import Screen
-from kivy.properties import StringProperty
+from kivy.metrics import dp
+from kivy.properties import BooleanProperty, NumericProperty, StringProperty
 from kivy.lang import Builder
+from kivy.uix.boxlayout import BoxLayout
 from src.controller.controlador import Controlador
+from src.utilidades.paginacion import VentanaPaginada
+from src.view.segundo_plano import PantallaAsincrona
 import os
 
+ALTO_FILA = dp(32)
+TAMAÑO_PAGINA = 50
+# Margen (en fracción de scroll_y) a partir del cual se pide la página vecina
+MARGEN_CARGA = 0.1
+
+# Después de las constantes: el kv importa ALTO_FILA de este módulo
 kv_path = os.path.join(os.path.dirname(__file__), 'kv', 'puntuaciones.kv')
 Builder.load_file(os.path.abspath(kv_path))
 
-class PuntuacionesScreen(Screen):
-    puntuaciones_texto = StringProperty("")
-    
+
+class FilaPuntuacion(BoxLayout):
+    posicion = NumericProperty(0)
+    nombre_usuario = StringProperty("")
+    puntaje = NumericProperty(0)
+    fecha = StringProperty("", allownone=True)
+    resaltada = BooleanProperty(False)
+
+
+class PuntuacionesScreen(PantallaAsincrona):
+    """Clasificación completa en un RecycleView que pide páginas al almacenamiento a medida que se recorre.
+
+    El RecycleView solo crea widgets para las filas visibles y la ventana
+    guarda unas pocas páginas, así que la memoria no crece con el total.
+    """
+
+    mensaje = StringProperty("")
+
     def __init__(self, **kwargs):
         super(PuntuacionesScreen, self).__init__(**kwargs)
         self.controlador = Controlador()
-    
+        self.ventana = VentanaPaginada(TAMAÑO_PAGINA)
+        self._pedidas = set()
+        self._resaltado = None
+
     def on_enter(self):
         self.actualizar_puntuaciones()
-    
+
+    def on_leave(self, *args):
+        super(PuntuacionesScreen, self).on_leave(*args)
+        self._pedidas.clear()
+
+    def _cargar_desde(self, indice):
+        """En segundo plano: total y página que contiene `indice`."""
+        total = self.controlador.contar_puntuaciones()
+        pagina = self.ventana.pagina_de(min(indice, max(total - 1, 0)))
+        return total, pagina, self.controlador.obtener_puntuaciones(TAMAÑO_PAGINA, pagina * TAMAÑO_PAGINA)
+
     def actualizar_puntuaciones(self):
-        puntuaciones = self.controlador.obtener_puntuaciones()
-        
-        if not puntuaciones:
-            self.puntuaciones_texto = "No hay puntuaciones registradas."
+        self._ir_a(0, None)
+
+    def buscar_jugador(self, nombre_usuario):
+        nombre_usuario = nombre_usuario.strip()
+        if not nombre_usuario:
+            self.actualizar_puntuaciones()
             return
-        
-        texto = "MEJORES PUNTUACIONES\n"
-        texto += "=" * 40 + "\n"
-        texto += "Posición  |  Jugador  |  Puntos\n"
-        texto += "-" * 40 + "\n"
-        
-        for i, p in enumerate(puntuaciones, 1):
-            texto += f"{i:^9} | {p['nombre_usuario']:<10} | {p['puntaje']:>6}\n"
-        
-        self.puntuaciones_texto = texto
-    
+
+        self.mensaje = f"Buscando a {nombre_usuario}..."
+        self.en_segundo_plano(
+            self.controlador.buscar_en_clasificacion, nombre_usuario,
+            al_terminar=lambda indice: self._jugador_encontrado(nombre_usuario, indice), al_fallar=self._error
+        )
+
+    def _jugador_encontrado(self, nombre_usuario, indice):
+        if indice is None:
+            self.mensaje = f"{nombre_usuario} no tiene puntuaciones registradas."
+            return
+        self._ir_a(indice, indice)
+
+    def _ir_a(self, indice, resaltado):
+        self.cancelar_tareas()
+        self._pedidas.clear()
+        self.mensaje = "Cargando puntuaciones..."
+        self.en_segundo_plano(
+            self._cargar_desde, indice,
+            al_terminar=lambda resultado: self._mostrar_desde(resultado, resaltado), al_fallar=self._error
+        )
+
+    def _error(self, excepcion):
+        self.mensaje = f"Error al cargar las puntuaciones: {excepcion}"
+
+    def _mostrar_desde(self, resultado, resaltado):
+        total, pagina, filas = resultado
+        self._resaltado = resaltado
+        self.ventana.reiniciar(total, pagina)
+        self.ventana.agregar(pagina, filas)
+        self.mensaje = f"{total} puntuaciones" if total else "No hay puntuaciones registradas."
+        self._refrescar()
+
+        local = self.ventana.indice_local(resaltado) if resaltado is not None else 0
+        self._desplazar_a_fila(local or 0)
+
+    def al_desplazar(self, scroll_y):
+        if scroll_y <= MARGEN_CARGA:
+            self._pedir(self.ventana.siguiente())
+        elif scroll_y >= 1 - MARGEN_CARGA:
+            self._pedir(self.ventana.anterior())
+
+    def _pedir(self, pagina):
+        if pagina is None or pagina in self._pedidas:
+            return
+
+        self._pedidas.add(pagina)
+        self.en_segundo_plano(
+            self.controlador.obtener_puntuaciones, TAMAÑO_PAGINA, pagina * TAMAÑO_PAGINA,
+            al_terminar=lambda filas: self._pagina_recibida(pagina, filas),
+            al_fallar=lambda excepcion: self._pagina_fallida(pagina, excepcion)
+        )
+
+    def _pagina_fallida(self, pagina, excepcion):
+        # Se puede volver a pedir al desplazarse de nuevo
+        self._pedidas.discard(pagina)
+        self._error(excepcion)
+
+    def _pagina_recibida(self, pagina, filas):
+        self._pedidas.discard(pagina)
+        lista = self.ids.lista
+        desplazamiento = (1 - lista.scroll_y) * self._recorrido()
+
+        corrimiento = self.ventana.agregar(pagina, filas)
+        self._refrescar()
+
+        # Mantiene en pantalla las mismas filas aunque se hayan agregado o quitado por arriba
+        recorrido = self._recorrido()
+        if recorrido > 0:
+            lista.scroll_y = min(1, max(0, 1 - (desplazamiento + corrimiento * ALTO_FILA) / recorrido))
+
+    def _refrescar(self):
+        filas = self.ventana.filas()
+        for fila in filas:
+            fila['resaltada'] = fila['posicion'] - 1 == self._resaltado
+        self.ids.lista.data = filas
+
+    def _recorrido(self):
+        return len(self.ids.lista.data) * ALTO_FILA - self.ids.lista.height
+
+    def _desplazar_a_fila(self, local):
+        recorrido = self._recorrido()
+        self.ids.lista.scroll_y = min(1, max(0, 1 - local * ALTO_FILA / recorrido)) if recorrido > 0 else 1
+
     def volver(self):
         self.manager.current = "menu"
@@ -1,13 +1,13 @@
-from kivy.uix.screenmanager import Screen
 from kivy.properties import StringProperty
 from kivy.lang import Builder
 from src.controller.controlador import Controlador
+from src.view.segundo_plano import PantallaAsincrona
 import os
 
 kv_path = os.path.join(os.path.dirname(__file__), 'kv', 'registro.kv')
 Builder.load_file(os.path.abspath(kv_path))
 
-class RegistroScreen(Screen):
+class RegistroScreen(PantallaAsincrona):
     mensaje = StringProperty("")
     
     def __init__(self, **kwargs):
@@ -30,12 +30,25 @@ class RegistroScreen(Screen):
             self.mensaje = "❌ Todos los campos son obligatorios."
             return
         
-        if self.controlador.registrar_jugador(usuario, contraseña):
+        if self.cargando:
+            return
+
+        self.mensaje = "⏳ Registrando usuario..."
+        self.en_segundo_plano(
+            self.controlador.registrar_jugador, usuario, contraseña,
+            al_terminar=self._registro_terminado, al_fallar=self._error
+        )
+    
+    def _registro_terminado(self, registrado):
+        if registrado:
             self.mensaje = "✅ Usuario registrado correctamente."
             self.ids.usuario_input.text = ""
             self.ids.contraseña_input.text = ""
         else:
             self.mensaje = "❌ Error al registrar usuario. El nombre de usuario ya existe o es inválido."
     
+    def _error(self, excepcion):
+        self.mensaje = f"❌ Error al registrar usuario: {excepcion}"
+    
     def volver(self):
         self.manager.current = "menu"
@@ -0,0 +1,56 @@
+from kivy.clock import Clock
+from kivy.properties import BooleanProperty
+from kivy.uix.screenmanager import Screen
+from src.utilidades.tareas import EjecutorTareas
+
+
+def _en_hilo_ui(funcion):
+    Clock.schedule_once(lambda dt: funcion())
+
+
+# Un solo hilo: las sesiones de SQLAlchemy no son seguras entre hilos y así las operaciones quedan en orden
+EJECUTOR_UI = EjecutorTareas(max_hilos=1, programar=_en_hilo_ui, nombre="almacenamiento-ui")
+
+
+class PantallaAsincrona(Screen):
+    """Pantalla que ejecuta el almacenamiento fuera del hilo de la interfaz.
+
+    `cargando` es True mientras haya tareas en curso; al salir de la
+    pantalla se cancelan, así que sus resultados ya no la modifican.
+    """
+
+    cargando = BooleanProperty(False)
+
+    def __init__(self, **kwargs):
+        super(PantallaAsincrona, self).__init__(**kwargs)
+        self._tareas = []
+
+    def en_segundo_plano(self, funcion, *args, al_terminar=None, al_fallar=None):
+        def terminar(resultado):
+            self._quitar(tarea)
+            if al_terminar is not None:
+                al_terminar(resultado)
+
+        def fallar(excepcion):
+            self._quitar(tarea)
+            if al_fallar is not None:
+                al_fallar(excepcion)
+
+        tarea = EJECUTOR_UI.enviar(funcion, *args, al_terminar=terminar, al_fallar=fallar)
+        self._tareas.append(tarea)
+        self.cargando = True
+        return tarea
+
+    def _quitar(self, tarea):
+        if tarea in self._tareas:
+            self._tareas.remove(tarea)
+        self.cargando = bool(self._tareas)
+
+    def cancelar_tareas(self):
+        for tarea in self._tareas:
+            tarea.cancelar()
+        self._tareas = []
+        self.cargando = False
+
+    def on_leave(self, *args):
+        self.cancelar_tareas()
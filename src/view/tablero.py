@@ -0,0 +1,82 @@
+from kivy.graphics import Color, Rectangle
+from kivy.graphics.texture import Texture
+from kivy.properties import NumericProperty
+from kivy.uix.widget import Widget
+
+# Estado público de celda -> color RGB: desconocida, (nave oculta), agua impactada, nave impactada
+COLORES = (bytes((30, 80, 160)), bytes((30, 80, 160)), bytes((170, 205, 235)), bytes((200, 40, 40)))
+
+
+class TableroWidget(Widget):
+    """Dibuja el tablero como una textura de un píxel por celda escalada al widget.
+
+    Todo el tablero es un único Rectangle, así que redibujar cuesta lo mismo
+    con 10x10 que con 100x100 celdas. Los disparos actualizan solo el píxel
+    de la celda afectada con actualizar_celda(); cargar() se usa únicamente
+    cuando cambia el tablero entero. Al pulsar una celda se emite
+    on_celda_pulsada(fila, columna).
+    """
+
+    ancho = NumericProperty(0)
+    alto = NumericProperty(0)
+
+    def __init__(self, **kwargs):
+        self.register_event_type('on_celda_pulsada')
+        super(TableroWidget, self).__init__(**kwargs)
+        self._textura = None
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self._rectangulo = Rectangle(pos=self.pos, size=self.size)
+        self.bind(pos=self._reubicar, size=self._reubicar)
+
+    def _reubicar(self, *args):
+        self._rectangulo.pos = self.pos
+        self._rectangulo.size = self.size
+
+    def cargar(self, ancho, alto, estados):
+        """Redibuja todo el tablero; `estados` tiene un estado público por celda, fila tras fila."""
+        if ancho <= 0 or alto <= 0:
+            self.limpiar()
+            return
+
+        if self._textura is None or (self.ancho, self.alto) != (ancho, alto):
+            self.ancho, self.alto = ancho, alto
+            self._textura = Texture.create(size=(ancho, alto), colorfmt='rgb')
+            self._textura.mag_filter = 'nearest'
+            self._textura.min_filter = 'nearest'
+            # La fila 0 arriba, como en mostrar_campo
+            self._textura.flip_vertical()
+            self._rectangulo.texture = self._textura
+
+        self._textura.blit_buffer(b''.join(COLORES[estado] for estado in estados), colorfmt='rgb', bufferfmt='ubyte')
+        self.canvas.ask_update()
+
+    def limpiar(self):
+        self.ancho = self.alto = 0
+        self._textura = None
+        self._rectangulo.texture = None
+
+    def actualizar_celda(self, fila, columna, estado):
+        if self._textura is None:
+            return
+        self._textura.blit_buffer(COLORES[estado], size=(1, 1), pos=(columna, fila), colorfmt='rgb',
+                                  bufferfmt='ubyte')
+        self.canvas.ask_update()
+
+    def celda_en(self, x, y):
+        """Celda (fila, columna) bajo el punto de la ventana, o None fuera del tablero."""
+        if self._textura is None or not self.collide_point(x, y):
+            return None
+        columna = min(int((x - self.x) * self.ancho / self.width), self.ancho - 1)
+        fila = min(int((self.top - y) * self.alto / self.height), self.alto - 1)
+        return fila, columna
+
+    def on_touch_down(self, touch):
+        celda = self.celda_en(*touch.pos)
+        if celda is None:
+            return super(TableroWidget, self).on_touch_down(touch)
+        self.dispatch('on_celda_pulsada', *celda)
+        return True
+
+    def on_celda_pulsada(self, fila, columna):
+        pass
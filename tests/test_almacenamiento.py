@@ -0,0 +1,149 @@
+import pytest
+from src.model.almacenamiento import Almacenamiento, AlmacenamientoMemoria, crear_almacenamiento, leer_configuracion
+from src.model.json_storage import JSONStorage
+from src.model.sistema_usuario import SistemaUsuario
+
+@pytest.fixture
+def memoria():
+    return AlmacenamientoMemoria()
+
+# Pruebas normales
+def test_registrar_e_iniciar_sesion(memoria):
+    assert memoria.registrar_jugador("ana", "clave") == True
+    jugador = memoria.iniciar_sesion("ana", "clave")
+    assert jugador['nombre_usuario'] == "ana"
+    assert jugador['id'] == 1
+
+def test_top_k_ordenado(memoria):
+    memoria.registrar_jugador("ana", "clave")
+    for puntos in [10, 50, 30]:
+        memoria.actualizar_puntuacion(1, puntos)
+    resultado = memoria.obtener_puntuaciones(2)
+    assert [p['puntaje'] for p in resultado] == [50, 30]
+    assert resultado[0]['nombre_usuario'] == "ana"
+
+def test_obtener_posicion(memoria):
+    for puntos in [10, 50, 30, 30]:
+        memoria.actualizar_puntuacion(1, puntos)
+    assert memoria.obtener_posicion(60) == 1
+    assert memoria.obtener_posicion(30) == 2
+    assert memoria.obtener_posicion(5) == 5
+
+def test_json_mismo_contrato(tmp_path):
+    json_storage = JSONStorage(str(tmp_path))
+    json_storage.registrar_jugador("ana", "clave")
+    json_storage.actualizar_puntuacion(1, 20)
+    json_storage.actualizar_puntuacion(1, 40)
+    assert json_storage.obtener_posicion(30) == 2
+    assert len(list(json_storage.iterar_puntuaciones())) == 2
+    assert [j['nombre_usuario'] for j in json_storage.iterar_jugadores()] == ["ana"]
+
+def test_puntuaciones_en_lote(memoria, tmp_path):
+    json_storage = JSONStorage(str(tmp_path))
+    for almacenamiento in (memoria, json_storage):
+        assert almacenamiento.actualizar_puntuaciones([(1, 10), (2, 30), (1, 20)]) == 3
+        assert almacenamiento.obtener_posicion(25) == 2
+        assert len(list(almacenamiento.iterar_puntuaciones())) == 3
+
+def test_sistema_usuario_puntuaciones_en_lote():
+    sistema = SistemaUsuario({'backend': 'memoria'})
+    sistema.registrar_jugador("ana", "clave")
+    sistema.registrar_jugador("luis", "clave")
+    ana = sistema.iniciar_sesion("ana", "clave")
+    luis = sistema.iniciar_sesion("luis", "clave")
+    version = sistema.version_puntuaciones
+    assert sistema.actualizar_puntuaciones([(ana, 10), (luis, 40), (None, 5)]) == 2
+    assert sistema.version_puntuaciones == version + 1
+    assert luis.puntaje == 40
+    assert sistema.obtener_puntuaciones()[0]['nombre_usuario'] == "luis"
+
+def test_paginas_de_clasificacion(memoria, tmp_path):
+    json_storage = JSONStorage(str(tmp_path))
+    for almacenamiento in (memoria, json_storage):
+        almacenamiento.registrar_jugador("ana", "clave")
+        almacenamiento.registrar_jugador("luis", "clave")
+        almacenamiento.actualizar_puntuaciones([(1, 10), (2, 30), (1, 20), (2, 20), (1, 5)])
+        assert almacenamiento.contar_puntuaciones() == 5
+        pagina = almacenamiento.obtener_puntuaciones(2, 1)
+        # Empate a 20: primero la puntuación registrada antes
+        assert [(p['nombre_usuario'], p['puntaje']) for p in pagina] == [("ana", 20), ("luis", 20)]
+        assert [p['puntaje'] for p in almacenamiento.obtener_puntuaciones(10, 3)] == [10, 5]
+        assert almacenamiento.indice_en_clasificacion("luis") == 0
+        assert almacenamiento.indice_en_clasificacion("ana") == 1
+
+def test_sistema_usuario_busca_en_clasificacion():
+    sistema = SistemaUsuario({'backend': 'memoria'})
+    for nombre in ("ana", "luis", "eva"):
+        sistema.registrar_jugador(nombre, "clave")
+    ana, luis, eva = (sistema.iniciar_sesion(n, "clave") for n in ("ana", "luis", "eva"))
+    sistema.actualizar_puntuaciones([(ana, 10), (luis, 40), (eva, 25), (ana, 30)])
+    assert sistema.contar_puntuaciones() == 4
+    assert sistema.indice_en_clasificacion("ana") == 1
+    assert sistema.obtener_puntuaciones(1, 2)[0]['nombre_usuario'] == "eva"
+
+# Pruebas extremas
+def test_instantanea_ida_y_vuelta(tmp_path):
+    ruta = str(tmp_path / "instantanea.json")
+    memoria = AlmacenamientoMemoria(ruta)
+    memoria.registrar_jugador("ana", "clave")
+    memoria.actualizar_puntuacion(1, 70)
+    memoria.guardar_instantanea()
+
+    recargada = AlmacenamientoMemoria(ruta)
+    assert recargada.iniciar_sesion("ana", "clave") is not None
+    assert recargada.obtener_puntuaciones()[0]['puntaje'] == 70
+
+def test_sistema_usuario_con_backend_memoria():
+    sistema = SistemaUsuario({'backend': 'memoria'})
+    assert sistema.registrar_jugador("ana", "clave") == True
+    jugador = sistema.iniciar_sesion("ana", "clave")
+    assert sistema.actualizar_puntuacion(jugador, 30) == 30
+    assert sistema.obtener_puntuaciones()[0]['puntaje'] == 30
+    assert sistema.obtener_posicion(10) == 2
+
+def test_leer_configuracion():
+    config = leer_configuracion({'BATALLA_NAVAL_ALMACENAMIENTO': 'MEMORIA'})
+    assert config['backend'] == 'memoria'
+
+def test_mejor_puntuacion_tras_instantanea(tmp_path):
+    ruta = str(tmp_path / "memoria.json")
+    memoria = AlmacenamientoMemoria(ruta)
+    memoria.registrar_jugador("ana", "clave")
+    memoria.registrar_jugador("luis", "clave")
+    memoria.actualizar_puntuaciones([(2, 50), (1, 5), (1, 60)])
+    memoria.guardar_instantanea()
+    recargada = AlmacenamientoMemoria(ruta)
+    assert recargada.indice_en_clasificacion("ana") == 0
+    assert recargada.indice_en_clasificacion("luis") == 1
+
+# Pruebas de error
+def test_registro_duplicado(memoria):
+    memoria.registrar_jugador("ana", "clave")
+    assert memoria.registrar_jugador("ana", "otra") == False
+
+def test_credenciales_incorrectas(memoria):
+    memoria.registrar_jugador("ana", "clave")
+    assert memoria.iniciar_sesion("ana", "mala") is None
+
+def test_backend_desconocido():
+    with pytest.raises(ValueError):
+        crear_almacenamiento({'backend': 'cinta'})
+
+def test_buscar_jugador_sin_puntuaciones(memoria):
+    memoria.registrar_jugador("ana", "clave")
+    assert memoria.indice_en_clasificacion("ana") is None
+    assert memoria.indice_en_clasificacion("nadie") is None
+    assert memoria.obtener_puntuaciones(10, 100) == []
+
+def test_backend_incompleto_falla_al_crearse():
+    class SinPuntuaciones(Almacenamiento):
+        def registrar_jugador(self, nombre_usuario, contraseña):
+            return True
+
+    with pytest.raises(TypeError):
+        SinPuntuaciones()
+
+def test_registro_sin_contraseña_rechazado():
+    sistema = SistemaUsuario({'backend': 'memoria'})
+    assert sistema.registrar_jugador("ana", "") == False
+    assert sistema.almacenamiento.obtener_jugador("ana") is None
@@ -0,0 +1,100 @@
+import pytest
+from src.controller.controlador import Controlador, PUNTOS_IMPACTO_SALVA, PUNTOS_VICTORIA
+from src.model.armas import ARMAS, Arma, obtener_arma
+from src.model.juego import Juego
+from src.model.sistema_usuario import SistemaUsuario
+
+def _juego(naves):
+    juego = Juego(5, 5, len(naves), semilla=1)
+    juego.campo.celdas = [[0] * 5 for _ in range(5)]
+    for fila, columna in naves:
+        juego.campo.celdas[fila][columna] = 1
+    return juego
+
+# Pruebas normales
+def test_mascaras_en_el_centro():
+    assert sorted(ARMAS['cruz'].mascara(5, 5, 2, 2)) == [7, 11, 12, 13, 17]
+    assert len(ARMAS['explosion'].mascara(5, 5, 2, 2)) == 9
+    assert list(ARMAS['sonar'].mascara(5, 5, 3, 0)) == [15, 16, 17, 18, 19]
+
+def test_salva_cuenta_impactos_y_hundidas():
+    juego = _juego([(1, 1), (2, 2), (4, 4)])
+    assert juego.disparar_salva('explosion', 1, 1) == (2, 2)
+    assert juego.campo.naves_restantes == 1
+    assert juego.campo.celdas[0][0] == 2
+
+def test_salva_ignora_celdas_ya_disparadas():
+    juego = _juego([(2, 2), (2, 3)])
+    juego.realizar_disparo(2, 2)
+    assert juego.disparar_salva('cruz', 2, 2) == (1, 1)
+    assert juego.verificar_ganador()
+
+def test_controlador_premia_salvas_multiples():
+    controlador = Controlador()
+    controlador.sistema_usuario = SistemaUsuario({'backend': 'memoria'})
+    controlador.sistema_usuario.registrar_jugador("salvas", "clave")
+    controlador.iniciar_sesion("salvas", "clave")
+    controlador.juego = _juego([(0, 0), (0, 1), (2, 2), (4, 4)])
+    assert controlador.realizar_salva('sonar', 0, 3) == (2, 2)
+    controlador.realizar_salva('cruz', 3, 2)
+    controlador.realizar_salva('simple', 4, 4)
+    puntos = [p['puntos'] for p in controlador.sistema_usuario.almacenamiento.iterar_puntuaciones()]
+    assert puntos == [2 * PUNTOS_IMPACTO_SALVA, PUNTOS_VICTORIA]
+
+def test_tramos_cubren_la_mascara():
+    for arma in ARMAS.values():
+        for fila, columna in [(0, 0), (2, 2), (4, 3), (0, 4)]:
+            tramos = arma.tramos(5, 5, fila, columna)
+            celdas = [f * 5 + c for f, inicio, fin in tramos for c in range(inicio, fin)]
+            assert sorted(celdas) == sorted(arma.mascara(5, 5, fila, columna))
+    assert ARMAS['explosion'].tramos(5, 5, 2, 2) == [(1, 1, 4), (2, 1, 4), (3, 1, 4)]
+
+def test_salva_se_deshace_en_un_paso():
+    juego = _juego([(1, 1), (2, 2), (4, 4)])
+    juego.realizar_disparo(4, 0)
+    juego.disparar_salva('explosion', 1, 1)
+    assert juego.campo.jugada.indices == (0, 1, 2, 5, 6, 7, 10, 11, 12)
+    assert juego.deshacer_disparo()
+    assert juego.campo.naves_restantes == 3
+    assert juego.campo.celdas[4][0] == 2
+    assert sum(fila.count(2) + fila.count(3) for fila in juego.campo.celdas) == 1
+
+def test_salva_puntuada_no_se_deshace():
+    controlador = Controlador()
+    controlador.sistema_usuario = SistemaUsuario({'backend': 'memoria'})
+    controlador.sistema_usuario.registrar_jugador("deshacer", "clave")
+    controlador.iniciar_sesion("deshacer", "clave")
+    controlador.juego = _juego([(0, 0), (0, 1), (4, 4)])
+    controlador.realizar_salva('cruz', 4, 0)
+    assert controlador.deshacer_disparo() == True
+    controlador.realizar_salva('sonar', 0, 3)
+    assert controlador.deshacer_disparo() == False
+    assert controlador.realizar_salva('sonar', 0, 3) == (0, 0)
+    puntos = [p['puntos'] for p in controlador.sistema_usuario.almacenamiento.iterar_puntuaciones()]
+    assert puntos == [2 * PUNTOS_IMPACTO_SALVA]
+
+# Pruebas extremas
+def test_recorte_en_esquinas_y_mascaras_cacheadas():
+    arma = Arma('prueba', ((0, 0), (-1, -1), (1, 1)))
+    assert arma.mascara(5, 5, 0, 0) == [0, 6]
+    assert arma.mascara(5, 5, 4, 4) == [24, 18]
+    arma.mascara(5, 5, 2, 2)
+    arma.mascara(5, 5, 3, 2)
+    assert len(arma._mascaras) == 3
+
+def test_salva_en_campo_disperso():
+    juego = Juego(1000, 1000, 3, semilla=2, disperso=True)
+    fila, columna = juego.campo.posiciones_naves[0]
+    impactos, _ = juego.disparar_salva('sonar', fila, columna)
+    assert impactos >= 1
+    assert len(juego.campo.fallos) + len(juego.campo.impactos) == 1000
+
+# Pruebas de error
+def test_arma_desconocida():
+    with pytest.raises(ValueError):
+        obtener_arma('laser')
+
+def test_salva_fuera_del_tablero():
+    juego = Juego(5, 5, 2)
+    with pytest.raises(ValueError):
+        juego.disparar_salva('cruz', 5, 0)
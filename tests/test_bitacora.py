@@ -0,0 +1,66 @@
+import io
+import pytest
+from src.controller.controlador import Controlador
+from src.model.bitacora import BitacoraDisparos, codificar_varint, leer_varints, reproducir, cargar_bitacora
+from src.model.campo import Campo
+
+# Pruebas normales
+def test_varint_ida_y_vuelta():
+    valores = [0, 1, 127, 128, 300, 2 ** 32]
+    datos = b"".join(codificar_varint(v) for v in valores)
+    assert leer_varints(datos) == valores
+
+def test_semilla_hace_la_colocacion_reproducible():
+    assert Campo(10, 10, 8, semilla=42).celdas == Campo(10, 10, 8, semilla=42).celdas
+
+def test_reproducir_partida_del_controlador(tmp_path):
+    ruta = str(tmp_path / "partida.log")
+    controlador = Controlador()
+    controlador.activar_bitacora(BitacoraDisparos(ruta))
+    controlador.iniciar_juego(6, 5, 4)
+    for fila, columna in [(0, 0), (2, 3), (4, 5)]:
+        controlador.realizar_disparo(fila, columna)
+    controlador.bitacora.cerrar()
+
+    juegos = cargar_bitacora(ruta)
+    assert len(juegos) == 1
+    assert juegos[0].campo.celdas == controlador.juego.campo.celdas
+    assert juegos[0].campo.naves_restantes == controlador.juego.campo.naves_restantes
+
+# Pruebas extremas
+def test_reinicio_genera_un_segundo_juego():
+    salida = io.BytesIO()
+    controlador = Controlador()
+    controlador.activar_bitacora(BitacoraDisparos(salida))
+    controlador.iniciar_juego(4, 4, 2)
+    controlador.realizar_disparo(1, 1)
+    controlador.reiniciar_juego()
+    controlador.realizar_disparo(3, 3)
+
+    juegos = reproducir(salida.getvalue())
+    assert len(juegos) == 2
+    assert juegos[1].campo.celdas == controlador.juego.campo.celdas
+
+def test_cola_truncada_se_ignora():
+    salida = io.BytesIO()
+    bitacora = BitacoraDisparos(salida)
+    bitacora.iniciar_juego(7, 300, 300, 3)
+    bitacora.registrar_disparo(299, 299)
+    datos = salida.getvalue()
+    juegos = reproducir(datos[:-1])
+    assert len(juegos) == 1
+    assert juegos[0].campo.celdas[299][299] < 2
+
+# Pruebas de error
+def test_disparo_sin_juego():
+    bitacora = BitacoraDisparos(io.BytesIO())
+    with pytest.raises(ValueError):
+        bitacora.registrar_disparo(0, 0)
+
+def test_bitacora_corrupta():
+    with pytest.raises(ValueError):
+        reproducir(codificar_varint(5))
+
+def test_varint_negativo():
+    with pytest.raises(ValueError):
+        codificar_varint(-1)
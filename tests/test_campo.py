@@ -81,3 +81,38 @@ def test_colocar_naves():
     # Contar naves
     naves = sum(1 for fila in campo.celdas for celda in fila if celda == 1)
     assert naves == 3
+
+def test_flota_de_naves_largas():
+    campo = Campo(10, 10, 3, semilla=7, flota=[4, 3, 2])
+    celdas_nave = sum(1 for fila in campo.celdas for celda in fila if celda == 1)
+    assert celdas_nave == 9
+    assert [len(nave) for nave in campo.naves] == [4, 3, 2]
+    assert len(campo.indice_naves) == 9
+
+def test_nave_se_hunde_con_todos_sus_impactos():
+    campo = Campo(10, 10, 2, semilla=3, flota=[3, 1])
+    nave = campo.naves[0]
+    *primeras, ultima = sorted(nave.posicion)
+    for fila, columna in primeras:
+        assert campo.verificar_impacto(fila, columna) == True
+        assert campo.ultima_nave_hundida is None
+    assert campo.naves_restantes == 2
+    campo.verificar_impacto(*ultima)
+    assert campo.ultima_nave_hundida is nave
+    assert campo.naves_restantes == 1
+
+def test_aplicar_disparos_hunde_naves_largas():
+    campo = Campo(10, 10, 1, semilla=5, flota=[3])
+    indices = [fila * campo.ancho + columna for fila, columna in campo.naves[0].posicion]
+    assert campo.aplicar_disparos(indices[:2]) == 2
+    assert campo.naves_restantes == 1
+    campo.aplicar_disparos(indices[2:])
+    assert campo.naves_restantes == 0
+
+def test_flota_que_no_cabe():
+    with pytest.raises(ValueError):
+        Campo(3, 3, 2, flota=[5, 5])
+
+def test_flota_con_cantidad_incorrecta():
+    with pytest.raises(ValueError):
+        Campo(5, 5, 3, flota=[2, 2])
@@ -0,0 +1,47 @@
+import pytest
+from src.model.campo import Campo
+from src.model.campo_compacto import CampoCompacto
+
+# Pruebas normales
+def test_misma_colocacion_que_campo():
+    compacto = CampoCompacto(8, 8, 3, semilla=9, flota=[3, 2, 2])
+    campo = Campo(8, 8, 3, semilla=9, flota=[3, 2, 2])
+    assert sorted(compacto.posiciones_naves) == sorted(campo.posiciones_naves)
+
+def test_hundir_nave_larga():
+    campo = Campo(8, 8, 2, semilla=1, flota=[3, 1])
+    compacto = CampoCompacto.desde_campo(campo)
+    posiciones = campo.naves[0].posicion
+    for fila, columna in posiciones[:-1]:
+        assert compacto.verificar_impacto(fila, columna) == True
+        assert compacto.ultima_nave_hundida is None
+    compacto.verificar_impacto(*posiciones[-1])
+    assert compacto.ultima_nave_hundida == 0
+    assert compacto.naves_restantes == 1
+
+def test_vista_y_hash_como_campo():
+    campo = Campo(6, 6, 2, semilla=2)
+    compacto = CampoCompacto(6, 6, 2, semilla=2)
+    agua = [(i, j) for i in range(6) for j in range(6) if campo.celdas[i][j] == 0][:2]
+    for fila, columna in agua + campo.posiciones_naves[:1]:
+        campo.verificar_impacto(fila, columna)
+        compacto.verificar_impacto(fila, columna)
+    assert compacto.hash_publico == campo.hash_publico
+    assert compacto.vista().texto() == campo.vista().texto()
+    assert compacto.mostrar_campo() == campo.mostrar_campo()
+
+# Pruebas extremas
+def test_mas_de_255_naves():
+    compacto = CampoCompacto(20, 20, 300, semilla=3)
+    fila, columna = compacto.posiciones_naves[-1]
+    assert compacto.verificar_impacto(fila, columna) == True
+    assert compacto.naves_restantes == 299
+
+# Pruebas de error
+def test_disparo_repetido_y_fuera_de_rango():
+    compacto = CampoCompacto(5, 5, 2)
+    compacto.verificar_impacto(1, 1)
+    with pytest.raises(ValueError):
+        compacto.verificar_impacto(1, 1)
+    with pytest.raises(ValueError):
+        compacto.verificar_impacto(5, 0)
@@ -0,0 +1,55 @@
+import pytest
+from src.model.campo_disperso import CampoDisperso
+from src.model.juego import Juego
+
+# Pruebas normales
+def test_creacion_campo_disperso():
+    campo = CampoDisperso(5, 5, 3)
+    assert campo.naves_restantes == 3
+    assert len(campo.naves) == 3
+    assert len(campo.posiciones_naves) == 3
+
+def test_verificar_impacto():
+    campo = CampoDisperso(5, 5, 3)
+    fila, columna = campo.posiciones_naves[0]
+    assert campo.verificar_impacto(fila, columna) == True
+    assert campo.naves_restantes == 2
+    assert campo.estado(fila, columna) == 3
+
+def test_juego_disperso_hasta_ganar():
+    juego = Juego(4, 4, 2, disperso=True)
+    for fila, columna in juego.campo.posiciones_naves:
+        juego.realizar_disparo(fila, columna)
+    assert juego.verificar_ganador() is True
+
+# Pruebas extremas
+def test_tablero_oceanico():
+    campo = CampoDisperso(1000000, 1000000, 50, semilla=3)
+    assert campo.verificar_impacto(999999, 999999) in (True, False)
+    assert len(campo.naves) + len(campo.impactos) + len(campo.fallos) <= 51
+    ventana = campo.mostrar_campo(999995, 999995, 5, 5)
+    assert ventana.splitlines()[-1].startswith("999999 ")
+
+def test_semilla_reproducible_y_aplicar_disparos():
+    original = CampoDisperso(100, 100, 30, semilla=9)
+    copia = CampoDisperso(100, 100, 30, semilla=9)
+    assert original.naves == copia.naves
+    indice = next(iter(original.naves))
+    assert copia.aplicar_disparos([indice, 0 if indice else 1]) == 1
+    assert copia.naves_restantes == 29
+
+# Pruebas de error
+def test_disparo_repetido():
+    campo = CampoDisperso(5, 5, 3)
+    campo.verificar_impacto(2, 2)
+    with pytest.raises(ValueError):
+        campo.verificar_impacto(2, 2)
+
+def test_fuera_de_rango():
+    campo = CampoDisperso(5, 5, 3)
+    with pytest.raises(ValueError):
+        campo.verificar_impacto(5, 0)
+
+def test_mas_naves_que_celdas():
+    with pytest.raises(ValueError):
+        CampoDisperso(2, 2, 5)
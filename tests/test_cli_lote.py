@@ -0,0 +1,58 @@
+import io
+import json
+from cli import BatallaNavalCLI
+
+def _ejecutar(comandos):
+    entrada = io.StringIO("".join(
+        (c if isinstance(c, str) else json.dumps(c)) + "\n" for c in comandos
+    ))
+    salida = io.StringIO()
+    cli = BatallaNavalCLI(interactivo=False)
+    procesados = cli.ejecutar_lote(entrada, salida)
+    return cli, procesados, [json.loads(l) for l in salida.getvalue().splitlines()]
+
+# Pruebas normales
+def test_juego_completo_en_lote():
+    disparos = [[f, c] for f in range(2) for c in range(2)]
+    _, procesados, respuestas = _ejecutar([
+        {'op': 'iniciar_juego', 'ancho': 2, 'alto': 2, 'num_naves': 1},
+        {'op': 'disparar_lote', 'disparos': disparos, 'id': 'a'},
+        {'op': 'tablero'},
+    ])
+    assert procesados == 3
+    assert all(r['ok'] for r in respuestas)
+    assert respuestas[1]['terminado'] == True
+    assert respuestas[1]['id'] == 'a'
+    assert "X" in respuestas[2]['tablero']
+
+def test_salva_en_lote():
+    _, _, respuestas = _ejecutar([
+        {'op': 'iniciar_juego', 'ancho': 3, 'alto': 3, 'num_naves': 2},
+        {'op': 'salva', 'arma': 'explosion', 'fila': 1, 'columna': 1},
+    ])
+    assert respuestas[1]['ok'] == True
+    assert respuestas[1]['impactos'] == 2
+    assert respuestas[1]['terminado'] == True
+
+def test_puntuaciones_en_lote():
+    _, _, respuestas = _ejecutar([{'op': 'puntuaciones', 'limite': 1}])
+    assert respuestas[0]['ok'] == True
+    assert len(respuestas[0]['puntuaciones']) <= 1
+
+# Pruebas extremas
+def test_lineas_vacias_se_ignoran():
+    _, procesados, _ = _ejecutar(["", {'op': 'tablero'}, "   "])
+    assert procesados == 1
+
+# Pruebas de error
+def test_errores_no_detienen_el_lote():
+    _, _, respuestas = _ejecutar([
+        "no es json",
+        {'op': 'disparar', 'fila': 0, 'columna': 0, 'id': 2},
+        {'op': 'volar'},
+        [1, 2],
+        {'op': 'iniciar_juego', 'ancho': 3, 'alto': 3, 'num_naves': 1},
+    ])
+    assert [r['ok'] for r in respuestas] == [False, False, False, False, True]
+    assert 'id' not in respuestas[0]
+    assert respuestas[1]['id'] == 2
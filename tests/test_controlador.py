@@ -1,5 +1,7 @@
 import pytest
-from src.controller.controlador import Controlador
+from src.controller.controlador import Controlador, PUNTOS_VICTORIA
+from src.controller.eventos import DisparoDeshecho, DisparoResuelto
+from src.model.sistema_usuario import SistemaUsuario
 
 # Pruebas normales
 def test_creacion_controlador():
@@ -75,3 +77,50 @@ def test_juego_terminado_sin_juego():
     controlador = Controlador()
     resultado = controlador.juego_terminado()
     assert resultado == False
+
+def test_disparo_tras_ganar_no_suma_otra_victoria():
+    controlador = Controlador()
+    controlador.sistema_usuario = SistemaUsuario({'backend': 'memoria'})
+    controlador.sistema_usuario.registrar_jugador("ganador", "clave")
+    controlador.iniciar_sesion("ganador", "clave")
+    controlador.iniciar_juego(3, 3, 1)
+    fila, columna = controlador.juego.campo.posiciones_naves[0]
+    controlador.realizar_disparo(fila, columna)
+    with pytest.raises(ValueError, match="terminó"):
+        controlador.realizar_disparo((fila + 1) % 3, columna)
+    puntos = [p['puntos'] for p in controlador.sistema_usuario.almacenamiento.iterar_puntuaciones()]
+    assert puntos == [PUNTOS_VICTORIA]
+
+def test_guardar_y_reanudar_partida(tmp_path):
+    ruta = str(tmp_path / "partida.bnav")
+    controlador = Controlador()
+    assert controlador.guardar_partida(ruta) == False
+    controlador.iniciar_juego(6, 6, 4)
+    controlador.realizar_disparo(3, 3)
+    celdas = [fila[:] for fila in controlador.juego.campo.celdas]
+    assert controlador.guardar_partida(ruta) == True
+
+    otro = Controlador()
+    assert otro.reanudar_partida(ruta) == True
+    assert otro.juego.campo.celdas == celdas
+
+def test_deshacer_disparo():
+    controlador = Controlador()
+    assert controlador.deshacer_disparo() == False
+    controlador.iniciar_juego(6, 6, 4)
+    controlador.realizar_disparo(3, 3)
+    assert controlador.deshacer_disparo() == True
+    assert controlador.juego.campo.celdas[3][3] in (0, 1)
+    assert controlador.deshacer_disparo() == False
+
+def test_cambios_de_celdas_por_eventos():
+    controlador = Controlador()
+    cambios = []
+    controlador.eventos.suscribir(cambios.append, (DisparoResuelto, DisparoDeshecho))
+    controlador.iniciar_juego(5, 5, 2)
+    impacto = controlador.realizar_disparo(1, 2)
+    assert cambios == [DisparoResuelto(((1, 2, impacto),))]
+    controlador.deshacer_disparo()
+    assert cambios[-1] == DisparoDeshecho(((1, 2),))
+    controlador.realizar_salva('cruz', 0, 0)
+    assert sorted((f, c) for f, c, _ in cambios[-1].celdas) == [(0, 0), (0, 1), (1, 0)]
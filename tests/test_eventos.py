@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import pytest
+from src.controller.controlador import Controlador
+from src.controller.eventos import (BusEventos, DisparoDeshecho, DisparoResuelto, JuegoGanado, JuegoIniciado,
+                                    NaveHundida, PuntuacionRegistrada, RespaldoActivado)
+from src.model.almacenamiento import AlmacenamientoMemoria
+from src.model.campo import Campo
+from src.model.juego import Juego
+from src.model.sistema_usuario import SistemaUsuario
+
+def _controlador_con_jugador():
+    controlador = Controlador()
+    controlador.sistema_usuario = SistemaUsuario({'backend': 'memoria'})
+    controlador.sistema_usuario.registrar_jugador("eventos", "clave")
+    controlador.iniciar_sesion("eventos", "clave")
+    return controlador
+
+# Pruebas normales
+def test_disparos_hundida_victoria_y_puntuacion():
+    controlador = _controlador_con_jugador()
+    eventos = []
+    controlador.eventos.suscribir(eventos.append)
+    controlador.iniciar_juego(2, 2, 4)
+    for fila in range(2):
+        for columna in range(2):
+            controlador.realizar_disparo(fila, columna)
+
+    assert eventos[0] == JuegoIniciado(2, 2, 4)
+    assert eventos[1:3] == [DisparoResuelto(((0, 0, True),)), NaveHundida(((0, 0),))]
+    assert eventos[-2:] == [JuegoGanado(4), PuntuacionRegistrada("eventos", 10)]
+
+def test_nave_larga_se_hunde_una_vez():
+    controlador = Controlador()
+    controlador.juego = Juego.desde_campo(Campo(6, 6, 1, semilla=3, flota=[3]))
+    hundidas = []
+    controlador.eventos.suscribir(hundidas.append, (NaveHundida,))
+    celdas = controlador.juego.campo.naves[0].posicion
+    for fila, columna in celdas:
+        controlador.realizar_disparo(fila, columna)
+    assert hundidas == [NaveHundida(tuple(sorted(celdas)))]
+
+def test_salva_solo_publica_celdas_nuevas():
+    controlador = Controlador()
+    controlador.iniciar_juego(5, 5, 2)
+    controlador.realizar_disparo(0, 0)
+    disparos = []
+    controlador.eventos.suscribir(disparos.append, (DisparoResuelto,))
+    controlador.realizar_salva('cruz', 0, 0)
+    assert len(disparos) == 1
+    assert sorted((fila, columna) for fila, columna, _ in disparos[0].celdas) == [(0, 1), (1, 0)]
+
+def test_deshacer_salva_publica_todas_sus_celdas():
+    controlador = Controlador()
+    controlador.iniciar_juego(5, 5, 2)
+    controlador.realizar_salva('explosion', 1, 1)
+    eventos = []
+    controlador.eventos.suscribir(eventos.append, (DisparoDeshecho,))
+    assert controlador.deshacer_disparo() == True
+    assert len(eventos) == 1
+    assert sorted(eventos[0].celdas) == [(f, c) for f in range(3) for c in range(3)]
+
+def test_deshacer_publica_evento():
+    controlador = Controlador()
+    controlador.iniciar_juego(5, 5, 2)
+    controlador.realizar_disparo(2, 3)
+    eventos = []
+    controlador.eventos.suscribir(eventos.append)
+    controlador.deshacer_disparo()
+    assert eventos == [DisparoDeshecho(((2, 3),))]
+
+def test_flujo_asincrono_desde_otro_hilo():
+    async def consumir():
+        controlador = Controlador()
+        recibidos = []
+        async with controlador.eventos.flujo((DisparoResuelto,)) as flujo:
+            hilo = threading.Thread(target=lambda: (controlador.iniciar_juego(4, 4, 2),
+                                                    controlador.realizar_disparo(1, 1)))
+            hilo.start()
+            async for evento in flujo:
+                recibidos.append(evento)
+                break
+            hilo.join()
+        assert recibidos[0].celdas[0][:2] == (1, 1)
+        assert not controlador.eventos.activo
+
+    asyncio.run(consumir())
+
+def test_a_dict_serializable():
+    assert NaveHundida(((0, 1),)).a_dict() == {'tipo': 'hundida', 'celdas': ((0, 1),)}
+
+# Pruebas extremas
+def test_respaldo_publica_evento(tmp_path):
+    class AlmacenamientoRoto(AlmacenamientoMemoria):
+        nombre = "roto"
+
+        def obtener_puntuaciones(self, limite=10, desplazamiento=0):
+            raise ConnectionError("sin conexión")
+
+    sistema = SistemaUsuario({'backend': 'auto', 'json_dir': str(tmp_path)}, AlmacenamientoRoto())
+    sistema.db_ok = True
+    controlador = Controlador()
+    controlador.sistema_usuario = sistema
+    eventos = []
+    controlador.eventos.suscribir(eventos.append, (RespaldoActivado,))
+    assert controlador.obtener_puntuaciones() == []
+    assert eventos == [RespaldoActivado('obtener_puntuaciones', 'roto', 'sin conexión')]
+
+def test_flujo_descarta_los_mas_viejos():
+    async def llenar():
+        bus = BusEventos()
+        flujo = bus.flujo(capacidad=2)
+        for i in range(5):
+            bus.publicar(DisparoDeshecho(((i, i),)))
+        await asyncio.sleep(0)
+        flujo.cerrar()
+        return [e.celdas[0][0] async for e in flujo], flujo.perdidos
+
+    assert asyncio.run(llenar()) == ([3, 4], 3)
+
+# Pruebas de error
+def test_suscriptor_que_falla_no_interrumpe():
+    bus = BusEventos()
+    recibidos = []
+    bus.suscribir(lambda evento: 1 / 0)
+    bus.suscribir(recibidos.append)
+    bus.publicar(JuegoGanado(3))
+    assert recibidos == [JuegoGanado(3)]
+
+def test_observador_de_respaldo_que_falla_no_anula_el_respaldo(tmp_path):
+    class AlmacenamientoRoto(AlmacenamientoMemoria):
+        nombre = "roto"
+
+        def registrar_jugador(self, nombre_usuario, contraseña):
+            raise ConnectionError("sin conexión")
+
+    sistema = SistemaUsuario({'backend': 'auto', 'json_dir': str(tmp_path)}, AlmacenamientoRoto())
+    sistema.db_ok = True
+    sistema.agregar_observador_respaldo(lambda operacion, backend, error: 1 / 0)
+    assert sistema.registrar_jugador("respaldo", "clave")
+    assert sistema.json_storage.obtener_jugador("respaldo") is not None
+
+def test_evento_con_campos_incorrectos():
+    with pytest.raises(ValueError):
+        DisparoResuelto(((1, 2, True),), True)
@@ -0,0 +1,180 @@
+import shutil
+import threading
+import pytest
+from src.controller.gestor_sesiones import GestorSesiones, serializar_juego, deserializar_juego
+from src.model.juego import Juego
+
+class RelojFalso:
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+# Pruebas normales
+def test_crear_y_disparar():
+    gestor = GestorSesiones()
+    id_sesion = gestor.crear_sesion(5, 5, 3)
+    juego = gestor.obtener_juego(id_sesion)
+    juego.campo.celdas[1][1] = 1
+    assert gestor.realizar_disparo(id_sesion, 1, 1) == True
+    assert len(gestor) == 1
+
+def test_sesiones_independientes():
+    gestor = GestorSesiones()
+    a = gestor.crear_sesion(5, 5, 3)
+    b = gestor.crear_sesion(5, 5, 3)
+    gestor.realizar_disparo(a, 0, 0)
+    assert gestor.obtener_juego(b).campo.celdas[0][0] < 2
+
+def test_serializacion_ida_y_vuelta():
+    juego = Juego(7, 4, 5)
+    juego.realizar_disparo(2, 3)
+    copia = deserializar_juego(serializar_juego(juego))
+    assert copia.campo.celdas == juego.campo.celdas
+    assert copia.campo.naves_restantes == juego.campo.naves_restantes
+    assert (copia.ancho, copia.alto, copia.num_naves) == (7, 4, 5)
+
+def test_sesiones_compactas_se_derraman_y_recuperan(tmp_path):
+    reloj = RelojFalso()
+    gestor = GestorSesiones(ttl=10, directorio_derrame=str(tmp_path), reloj=reloj, compacto=True)
+    id_sesion = gestor.agregar_sesion(Juego(8, 8, 3, semilla=4, flota=[4, 3, 2]))
+    juego = gestor.obtener_juego(id_sesion)
+    assert not hasattr(juego.campo, 'celdas')
+    gestor.realizar_disparo(id_sesion, 0, 0)
+    estados = bytes(juego.campo.estados)
+
+    reloj.ahora = 100
+    gestor.expulsar_inactivas()
+    recuperado = gestor.obtener_juego(id_sesion).campo
+    assert bytes(recuperado.estados) == estados
+    assert recuperado.naves_restantes == juego.campo.naves_restantes
+
+def test_ttl_se_aplica_al_crear_y_pedir_sesiones(tmp_path):
+    reloj = RelojFalso()
+    gestor = GestorSesiones(ttl=10, directorio_derrame=str(tmp_path), reloj=reloj)
+    vieja = gestor.crear_sesion(4, 4, 2)
+    activa = gestor.crear_sesion(4, 4, 2)
+
+    reloj.ahora = 8
+    gestor.obtener_juego(activa)
+    reloj.ahora = 15
+    gestor.crear_sesion(4, 4, 2)
+    assert len(gestor) == 2
+    assert (tmp_path / f"{vieja}.juego").exists()
+
+    reloj.ahora = 30
+    gestor.obtener_juego(activa)
+    assert len(gestor) == 1
+    assert vieja in gestor
+
+# Pruebas extremas
+def test_expulsion_lru():
+    gestor = GestorSesiones(max_sesiones=2)
+    a = gestor.crear_sesion(3, 3, 1)
+    b = gestor.crear_sesion(3, 3, 1)
+    gestor.obtener_juego(a)
+    gestor.crear_sesion(3, 3, 1)
+    assert a in gestor
+    assert b not in gestor
+
+def test_expulsion_por_ttl_y_derrame(tmp_path):
+    reloj = RelojFalso()
+    gestor = GestorSesiones(ttl=10, directorio_derrame=str(tmp_path), reloj=reloj)
+    id_sesion = gestor.crear_sesion(4, 4, 2)
+    gestor.realizar_disparo(id_sesion, 0, 0)
+    celdas = [fila[:] for fila in gestor.obtener_juego(id_sesion).campo.celdas]
+
+    reloj.ahora = 100
+    assert gestor.expulsar_inactivas() == 1
+    assert len(gestor) == 0
+    assert gestor.obtener_juego(id_sesion).campo.celdas == celdas
+
+def test_disparos_concurrentes_con_expulsiones(tmp_path):
+    # Con TTL 0 y el reloj quieto, cada expulsión derrama todas las sesiones
+    gestor = GestorSesiones(ttl=0, directorio_derrame=str(tmp_path), reloj=lambda: 0.0)
+    id_sesion = gestor.crear_sesion(10, 10, 5)
+    terminados = threading.Event()
+    errores = []
+
+    def disparar(filas):
+        try:
+            for fila in filas:
+                for columna in range(10):
+                    gestor.realizar_disparo(id_sesion, fila, columna)
+        except Exception as e:
+            errores.append(e)
+
+    def expulsar():
+        while not terminados.is_set():
+            gestor.expulsar_inactivas()
+
+    tiradores = [threading.Thread(target=disparar, args=(range(i, 10, 4),)) for i in range(4)]
+    expulsor = threading.Thread(target=expulsar)
+    expulsor.start()
+    for hilo in tiradores:
+        hilo.start()
+    for hilo in tiradores:
+        hilo.join()
+    terminados.set()
+    expulsor.join()
+
+    assert errores == []
+    # Ningún disparo se perdió en una copia ya derramada
+    assert all(estado >= 2 for fila in gestor.obtener_juego(id_sesion).campo.celdas for estado in fila)
+
+def test_recuperacion_concurrente_de_la_misma_sesion(tmp_path):
+    reloj = RelojFalso()
+    gestor = GestorSesiones(ttl=10, directorio_derrame=str(tmp_path), reloj=reloj)
+    id_sesion = gestor.crear_sesion(5, 5, 3)
+    reloj.ahora = 100
+    gestor.expulsar_inactivas()
+
+    barrera = threading.Barrier(8)
+    juegos, errores = [], []
+
+    def obtener():
+        barrera.wait()
+        try:
+            juegos.append(gestor.obtener_juego(id_sesion))
+        except KeyError as e:
+            errores.append(e)
+
+    hilos = [threading.Thread(target=obtener) for _ in range(8)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert errores == []
+    assert len({id(juego) for juego in juegos}) == 1
+
+# Pruebas de error
+def test_sesion_desconocida():
+    gestor = GestorSesiones()
+    with pytest.raises(KeyError):
+        gestor.realizar_disparo("no-existe", 0, 0)
+
+def test_id_invalido():
+    gestor = GestorSesiones()
+    with pytest.raises(ValueError):
+        gestor.agregar_sesion(Juego(3, 3, 1), "../fuera")
+
+def test_derrame_fallido_deja_la_sesion_en_memoria(tmp_path):
+    directorio = tmp_path / "derrame"
+    gestor = GestorSesiones(max_sesiones=1, directorio_derrame=str(directorio))
+    primera = gestor.crear_sesion(5, 5, 3)
+    shutil.rmtree(directorio)
+    gestor.crear_sesion(5, 5, 3)
+
+    assert len(gestor) == 2
+    gestor.realizar_disparo(primera, 0, 0)
+    assert gestor.obtener_juego(primera).campo.celdas[0][0] >= 2
+
+def test_disparo_en_sesion_eliminada(tmp_path):
+    gestor = GestorSesiones(directorio_derrame=str(tmp_path))
+    id_sesion = gestor.crear_sesion(5, 5, 3)
+    gestor.eliminar_sesion(id_sesion)
+    with pytest.raises(KeyError):
+        gestor.realizar_disparo(id_sesion, 0, 0)
+    assert id_sesion not in gestor
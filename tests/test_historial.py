@@ -0,0 +1,79 @@
+import copy
+import pytest
+from src.model.juego import Juego
+
+def _estado(juego):
+    campo = juego.campo
+    return (copy.deepcopy(campo.celdas), bytes(campo.publico), campo.hash_publico, campo.naves_restantes,
+            [nave.impactos_restantes for nave in campo.naves])
+
+# Pruebas normales
+def test_restaurar_deshace_los_disparos():
+    juego = Juego(6, 6, 3, semilla=2)
+    antes = _estado(juego)
+    captura = juego.snapshot()
+    for indice in range(10):
+        juego.realizar_disparo(*divmod(indice, 6))
+    juego.restaurar(captura)
+    assert _estado(juego) == antes
+
+def test_ramas_comparten_prefijo_y_se_restauran():
+    juego = Juego(6, 6, 3, semilla=2)
+    juego.realizar_disparo(0, 0)
+    base = juego.snapshot()
+    juego.realizar_disparo(1, 1)
+    rama_a = juego.snapshot()
+    estado_a = _estado(juego)
+    juego.restaurar(base)
+    juego.realizar_disparo(2, 2)
+    estado_b = _estado(juego)
+    rama_b = juego.snapshot()
+    assert rama_b.jugada.padre is rama_a.jugada.padre
+    juego.restaurar(rama_a)
+    assert _estado(juego) == estado_a
+    juego.restaurar(rama_b)
+    assert _estado(juego) == estado_b
+
+def test_deshacer_reflota_naves_largas():
+    juego = Juego(8, 8, 1, semilla=4, flota=[2])
+    nave = juego.campo.naves[0]
+    for fila, columna in nave.posicion:
+        juego.realizar_disparo(fila, columna)
+    assert juego.verificar_ganador()
+    assert juego.deshacer_disparo()
+    assert juego.campo.naves_restantes == 1
+    assert nave.impactos_restantes == 1
+    assert not juego.verificar_ganador()
+
+def test_captura_de_campo_disperso():
+    juego = Juego(1000, 1000, 2, semilla=1, disperso=True)
+    captura = juego.snapshot()
+    fila, columna = juego.campo.posiciones_naves[0]
+    juego.realizar_disparo(fila, columna)
+    juego.realizar_disparo(fila, (columna + 1) % 1000)
+    juego.restaurar(captura)
+    assert juego.campo.impactos == set() and juego.campo.fallos == set()
+    assert juego.campo.naves_restantes == 2
+    assert juego.campo.hash_publico == 0
+
+# Pruebas extremas
+def test_deshacer_sin_disparos():
+    juego = Juego(5, 5, 2)
+    assert juego.deshacer_disparo() == False
+
+def test_deshacer_disparos_en_lote():
+    juego = Juego(5, 5, 2, semilla=3)
+    captura = juego.snapshot()
+    juego.campo.aplicar_disparos(range(25))
+    assert juego.verificar_ganador()
+    juego.restaurar(captura)
+    assert juego.campo.naves_restantes == 2
+    assert sum(fila.count(1) for fila in juego.campo.celdas) == 2
+
+# Pruebas de error
+def test_restaurar_captura_de_otro_tablero():
+    juego = Juego(5, 5, 2)
+    captura = juego.snapshot()
+    juego.reiniciar_juego()
+    with pytest.raises(ValueError):
+        juego.restaurar(captura)
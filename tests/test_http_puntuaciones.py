@@ -0,0 +1,102 @@
+import gzip
+import http.client
+import json
+import threading
+import pytest
+from src.model.sistema_usuario import SistemaUsuario
+from src.red.http_puntuaciones import CachePuntuaciones, crear_servidor
+
+class SistemaContado(SistemaUsuario):
+    def __init__(self):
+        super().__init__({'backend': 'memoria'})
+        self.consultas = 0
+
+    def obtener_puntuaciones(self, limite=10):
+        self.consultas += 1
+        return super().obtener_puntuaciones(limite)
+
+@pytest.fixture
+def entorno():
+    sistema = SistemaContado()
+    sistema.registrar_jugador("ana", "clave")
+    jugador = sistema.iniciar_sesion("ana", "clave")
+    sistema.actualizar_puntuacion(jugador, 40)
+
+    servidor = crear_servidor(sistema, puerto=0)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    yield sistema, jugador, servidor.server_port
+    servidor.shutdown()
+    servidor.server_close()
+
+def _get(puerto, ruta, cabeceras=None):
+    conexion = http.client.HTTPConnection('127.0.0.1', puerto)
+    conexion.request('GET', ruta, headers=cabeceras or {})
+    respuesta = conexion.getresponse()
+    cuerpo = respuesta.read()
+    conexion.close()
+    return respuesta, cuerpo
+
+# Pruebas normales
+def test_devuelve_json_con_etag(entorno):
+    _, _, puerto = entorno
+    respuesta, cuerpo = _get(puerto, '/puntuaciones')
+    assert respuesta.status == 200
+    assert respuesta.getheader('ETag')
+    assert json.loads(cuerpo)[0]['puntaje'] == 40
+
+def test_304_sin_consultar_almacenamiento(entorno):
+    sistema, _, puerto = entorno
+    respuesta, _ = _get(puerto, '/puntuaciones')
+    consultas = sistema.consultas
+    respuesta, cuerpo = _get(puerto, '/puntuaciones', {'If-None-Match': respuesta.getheader('ETag')})
+    assert respuesta.status == 304
+    assert cuerpo == b""
+    assert sistema.consultas == consultas
+
+def test_gzip(entorno):
+    _, _, puerto = entorno
+    respuesta, cuerpo = _get(puerto, '/puntuaciones', {'Accept-Encoding': 'gzip'})
+    assert respuesta.getheader('Content-Encoding') == 'gzip'
+    assert json.loads(gzip.decompress(cuerpo))[0]['nombre_usuario'] == "ana"
+
+# Pruebas extremas
+def test_nueva_puntuacion_cambia_etag(entorno):
+    sistema, jugador, puerto = entorno
+    respuesta, _ = _get(puerto, '/puntuaciones')
+    sistema.actualizar_puntuacion(jugador, 90)
+    respuesta_nueva, cuerpo = _get(puerto, '/puntuaciones', {'If-None-Match': respuesta.getheader('ETag')})
+    assert respuesta_nueva.status == 200
+    assert json.loads(cuerpo)[0]['puntaje'] == 90
+
+def test_puntuacion_de_otro_proceso_vence_la_cache():
+    sistema = SistemaContado()
+    sistema.registrar_jugador("ana", "clave")
+    jugador = sistema.iniciar_sesion("ana", "clave")
+    sistema.actualizar_puntuacion(jugador, 40)
+    ahora = [0.0]
+    cache = CachePuntuaciones(sistema, vigencia=5, reloj=lambda: ahora[0])
+    etag, _, _ = cache.obtener(10)
+
+    # Escritura directa en el almacenamiento, como la haría otro proceso
+    sistema.almacenamiento.actualizar_puntuacion(jugador.id, 90)
+    assert cache.obtener(10)[0] == etag
+    ahora[0] = 6
+    etag_nuevo, cuerpo, _ = cache.obtener(10)
+    assert etag_nuevo != etag
+    assert json.loads(cuerpo)[0]['puntaje'] == 90
+
+def test_etag_cambia_entre_arranques():
+    sistema = SistemaContado()
+    assert CachePuntuaciones(sistema).etag(10) != CachePuntuaciones(sistema).etag(10)
+
+# Pruebas de error
+def test_ruta_desconocida(entorno):
+    _, _, puerto = entorno
+    respuesta, _ = _get(puerto, '/otra')
+    assert respuesta.status == 404
+
+def test_limite_invalido(entorno):
+    _, _, puerto = entorno
+    respuesta, _ = _get(puerto, '/puntuaciones?limite=abc')
+    assert respuesta.status == 400
@@ -0,0 +1,66 @@
+import pytest
+from src.model.campo import Campo
+from src.model.instantanea import (
+    codificar_campo, decodificar_campo, guardar_campo, cargar_campo, tamaño_instantanea
+)
+
+# Pruebas normales
+def test_ida_y_vuelta_en_memoria():
+    campo = Campo(5, 5, 3)
+    campo.verificar_impacto(0, 0)
+    campo.verificar_impacto(4, 4)
+    copia = decodificar_campo(codificar_campo(campo))
+    assert copia.celdas == campo.celdas
+    assert copia.naves_restantes == campo.naves_restantes
+    assert sorted(copia.posiciones_naves) == sorted(campo.posiciones_naves)
+
+def test_ida_y_vuelta_en_archivo(tmp_path):
+    ruta = str(tmp_path / "partida.bnav")
+    campo = Campo(9, 3, 4)
+    campo.verificar_impacto(1, 8)
+    guardar_campo(campo, ruta)
+    assert cargar_campo(ruta).celdas == campo.celdas
+
+def test_flota_larga_conserva_sus_naves():
+    campo = Campo(8, 8, 3, semilla=5, flota=[4, 3, 2])
+    fila, columna = campo.naves[0].posicion[0]
+    campo.verificar_impacto(fila, columna)
+    copia = decodificar_campo(codificar_campo(campo))
+    assert copia.naves_restantes == 3
+    assert sorted(len(nave) for nave in copia.naves) == [2, 3, 4]
+    assert sorted(copia.flota) == [2, 3, 4]
+
+def test_nave_recargada_se_hunde_entera():
+    campo = Campo(8, 8, 2, semilla=1, flota=[3, 2])
+    posicion = campo.naves[0].posicion
+    campo.verificar_impacto(*posicion[0])
+    copia = decodificar_campo(codificar_campo(campo))
+    copia.verificar_impacto(*posicion[1])
+    assert copia.ultima_nave_hundida is None
+    copia.verificar_impacto(*posicion[2])
+    assert sorted(copia.ultima_nave_hundida.posicion) == sorted(posicion)
+    assert copia.naves_restantes == 1
+
+# Pruebas extremas
+def test_tamaño_tablero_grande():
+    assert tamaño_instantanea(1000, 1000) < 376 * 1000
+
+def test_tablero_sin_disparos_ancho_no_multiplo_de_ocho():
+    campo = Campo(13, 2, 26)
+    assert decodificar_campo(codificar_campo(campo)).naves_restantes == 26
+
+# Pruebas de error
+def test_magia_incorrecta():
+    with pytest.raises(ValueError):
+        decodificar_campo(b"XXXX" + bytes(40))
+
+def test_tabla_de_naves_corrupta():
+    datos = bytearray(codificar_campo(Campo(6, 6, 1, semilla=2, flota=[3])))
+    datos[-16:-12] = (9).to_bytes(4, 'little')
+    with pytest.raises(ValueError):
+        decodificar_campo(bytes(datos))
+
+def test_instantanea_truncada():
+    datos = codificar_campo(Campo(5, 5, 3))
+    with pytest.raises(ValueError):
+        decodificar_campo(datos[:-1])
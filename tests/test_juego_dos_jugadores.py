@@ -0,0 +1,86 @@
+import pytest
+from src.model.campo_compacto import CampoCompacto
+from src.model.juego_dos_jugadores import JuegoDosJugadores, Participante, ParticipanteExterno, ParticipanteIA
+
+# Pruebas normales
+def test_turnos_alternados():
+    juego = JuegoDosJugadores(5, 5, 2, semilla=1)
+    juego.disparar(0, 0, 0)
+    assert juego.turno == 1 or juego.campos[1].estado(0, 0) == 3
+    assert juego.disparos == [1, 0]
+
+def test_ia_contra_ia_termina():
+    juego = JuegoDosJugadores(8, 8, 3, (ParticipanteIA(semilla=1), ParticipanteIA('aleatoria', semilla=2)),
+                              semilla=4, flota=[3, 2, 2])
+    juego.avanzar()
+    assert juego.terminado()
+    perdedor = 1 - juego.ganador
+    assert juego.campos[perdedor].naves_restantes == 0
+    assert abs(juego.disparos[0] - juego.disparos[1]) <= 1
+
+def test_humano_contra_ia():
+    humano = ParticipanteExterno()
+    juego = JuegoDosJugadores(5, 5, 2, (humano, ParticipanteIA(semilla=3)), semilla=2)
+    assert juego.avanzar() == 0
+    agua = next(i for i, estado in enumerate(juego.campos[1].estados) if estado == 0)
+    humano.enviar(*divmod(agua, 5))
+    assert juego.avanzar() == 2
+    assert juego.turno == 0
+
+def test_repetir_al_impactar():
+    juego = JuegoDosJugadores(5, 5, 2, semilla=5, repetir_al_impactar=True)
+    fila, columna = juego.campos[1].posiciones_naves[0]
+    assert juego.disparar(0, fila, columna) == True
+    assert juego.turno == 0
+
+def test_ia_conserva_objetivos_de_otra_nave_tocada():
+    ia = ParticipanteIA(semilla=1)
+    ia.elegir_disparo(CampoCompacto(5, 5, 1, semilla=1).vista())
+    ia.objetivos.clear()
+
+    ia.resultado_disparo(True, 2, 2, True, ())
+    ia.resultado_disparo(True, 0, 0, True, (0,))
+    assert sorted(ia.objetivos) == [7, 11, 13, 17]
+
+    ia.resultado_disparo(True, 2, 3, True, (12, 13))
+    assert ia.objetivos == []
+
+def test_hundida_informa_las_celdas_de_la_nave():
+    avisos = []
+    class Observador(ParticipanteExterno):
+        def resultado_disparo(self, propio, fila, columna, impacto, hundida):
+            avisos.append(hundida)
+
+    juego = JuegoDosJugadores(6, 6, 1, (Observador(), None), semilla=3, flota=[2], repetir_al_impactar=True)
+    celdas = [f * 6 + c for f, c in sorted(juego.campos[1].posiciones_naves)]
+    juego.disparar(0, *divmod(celdas[0], 6))
+    juego.disparar(0, *divmod(celdas[1], 6))
+    assert avisos == [(), tuple(celdas)]
+
+# Pruebas extremas
+def test_muchas_partidas_simultaneas():
+    partidas = [JuegoDosJugadores(10, 10, 5, (ParticipanteIA(semilla=i), ParticipanteIA(semilla=-i)))
+                for i in range(200)]
+    for partida in partidas:
+        partida.avanzar(maximo=10)
+    assert all(sum(partida.disparos) == 10 for partida in partidas)
+
+# Pruebas de error
+def test_disparo_fuera_de_turno():
+    juego = JuegoDosJugadores(5, 5, 2)
+    with pytest.raises(ValueError):
+        juego.disparar(1, 0, 0)
+
+def test_disparo_tras_terminar():
+    juego = JuegoDosJugadores(4, 4, 1, (ParticipanteIA(semilla=1), ParticipanteIA(semilla=2)), semilla=1)
+    juego.avanzar()
+    with pytest.raises(ValueError):
+        juego.disparar(juego.turno, 0, 0)
+
+def test_participante_es_abstracto():
+    with pytest.raises(TypeError):
+        Participante()
+
+def test_modo_ia_desconocido():
+    with pytest.raises(ValueError):
+        ParticipanteIA('telepatia')
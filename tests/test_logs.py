@@ -0,0 +1,49 @@
+import io
+import json
+import logging
+from src.utilidades.logs import obtener_logger, configurar_logs, detener_logs, RAIZ
+
+# Pruebas normales
+def test_registro_estructurado_en_json():
+    salida = io.StringIO()
+    configurar_logs(logging.INFO, salida)
+    obtener_logger('prueba').info("Jugador %s registrado", "ana", extra={'backend': 'memoria'})
+    detener_logs()
+
+    registro = json.loads(salida.getvalue().splitlines()[-1])
+    assert registro['mensaje'] == "Jugador ana registrado"
+    assert registro['nivel'] == "INFO"
+    assert registro['backend'] == "memoria"
+
+def test_formato_texto():
+    salida = io.StringIO()
+    configurar_logs(logging.DEBUG, salida, formato='texto')
+    obtener_logger('prueba').debug("hola")
+    detener_logs()
+    assert "DEBUG batalla_naval.prueba: hola" in salida.getvalue()
+
+# Pruebas extremas
+def test_nivel_filtra_registros():
+    salida = io.StringIO()
+    configurar_logs(logging.WARNING, salida)
+    obtener_logger('prueba').info("no debe salir")
+    detener_logs()
+    assert salida.getvalue() == ""
+
+def test_excepcion_incluida():
+    salida = io.StringIO()
+    configurar_logs(logging.INFO, salida)
+    try:
+        raise RuntimeError("fallo")
+    except RuntimeError:
+        obtener_logger('prueba').warning("Error", exc_info=True)
+    detener_logs()
+    assert "RuntimeError" in json.loads(salida.getvalue())['excepcion']
+
+# Pruebas de error
+def test_silencioso_por_defecto(capsys):
+    detener_logs()
+    obtener_logger('prueba').error("no debe imprimirse")
+    capturado = capsys.readouterr()
+    assert capturado.out == "" and capturado.err == ""
+    assert logging.getLogger(RAIZ).propagate == False
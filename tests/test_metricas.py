@@ -0,0 +1,72 @@
+import urllib.request
+import pytest
+from src.controller.controlador import Controlador
+from src.utilidades.metricas import RegistroMetricas, REGISTRO, cronometrar, habilitar_metricas, iniciar_servidor_metricas
+
+# Pruebas normales
+def test_contador_y_medidor():
+    registro = RegistroMetricas(habilitado=True)
+    contador = registro.contador('eventos_total', 'Eventos')
+    contador.incrementar()
+    contador.incrementar(2)
+    registro.medidor('sesiones').establecer(7)
+    texto = registro.exportar_prometheus()
+    assert "# TYPE eventos_total counter" in texto
+    assert "eventos_total 3" in texto
+    assert "sesiones 7" in texto
+
+def test_histograma_acumulado():
+    registro = RegistroMetricas(habilitado=True)
+    histograma = registro.histograma('latencia_segundos', limites=(0.1, 1.0))
+    for valor in (0.05, 0.5, 5.0):
+        histograma.observar(valor)
+    texto = registro.exportar_prometheus()
+    assert 'latencia_segundos_bucket{le="0.1"} 1' in texto
+    assert 'latencia_segundos_bucket{le="1.0"} 2' in texto
+    assert 'latencia_segundos_bucket{le="+Inf"} 3' in texto
+    assert "latencia_segundos_count 3" in texto
+
+def test_controlador_instrumentado():
+    habilitar_metricas()
+    try:
+        antes = REGISTRO['batalla_naval_disparo_segundos'].cuenta
+        controlador = Controlador()
+        controlador.iniciar_juego(5, 5, 3)
+        controlador.realizar_disparo(0, 0)
+        assert REGISTRO['batalla_naval_disparo_segundos'].cuenta == antes + 1
+    finally:
+        habilitar_metricas(False)
+
+# Pruebas extremas
+def test_deshabilitado_no_registra():
+    registro = RegistroMetricas(habilitado=False)
+    histograma = registro.histograma('h')
+
+    @cronometrar(histograma)
+    def funcion():
+        return 42
+
+    assert funcion() == 42
+    assert histograma.cuenta == 0
+
+def test_servidor_prometheus_y_volcado(tmp_path):
+    registro = RegistroMetricas(habilitado=True)
+    registro.contador('pedidos_total').incrementar()
+    servidor = iniciar_servidor_metricas(0, registro=registro)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{servidor.server_port}/metrics") as respuesta:
+            assert b"pedidos_total 1" in respuesta.read()
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+
+    ruta = tmp_path / "metricas.prom"
+    registro.volcar(str(ruta))
+    assert "pedidos_total 1" in ruta.read_text()
+
+# Pruebas de error
+def test_nombre_repetido_con_otro_tipo():
+    registro = RegistroMetricas()
+    registro.contador('x')
+    with pytest.raises(ValueError):
+        registro.histograma('x')
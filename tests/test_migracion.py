@@ -0,0 +1,95 @@
+import json
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from src.model.almacenamiento import AlmacenamientoPostgres
+from src.model.json_storage import JSONStorage
+from src.model.modelos_db import Base
+from src.model.migracion import Migracion, escribir_json, iterar_json
+
+@pytest.fixture
+def engine():
+    return create_engine('sqlite://')
+
+def _json_de_ejemplo(directorio):
+    almacenamiento = JSONStorage(str(directorio))
+    for nombre in ("ana", "luis", "eva"):
+        almacenamiento.registrar_jugador(nombre, "clave")
+    almacenamiento.actualizar_puntuaciones([(1, 10), (2, 30), (3, 20), (1, 40)])
+    return almacenamiento
+
+# Pruebas normales
+def test_importar_json_a_base(engine, tmp_path):
+    _json_de_ejemplo(tmp_path)
+    avances = []
+    resumen = Migracion(engine, str(tmp_path), tamaño_lote=2, progreso=lambda *a: avances.append(a[:2])).importar()
+    assert (resumen['jugadores'], resumen['puntuaciones'], resumen['omitidas']) == (3, 4, 0)
+    assert ('puntuaciones', 4) in avances
+
+    with engine.connect() as conexion:
+        almacenamiento = AlmacenamientoPostgres(session=Session(bind=conexion))
+        assert [(p['nombre_usuario'], p['puntaje']) for p in almacenamiento.obtener_puntuaciones(2)] == [("ana", 40), ("luis", 30)]
+
+def test_ida_y_vuelta(engine, tmp_path):
+    _json_de_ejemplo(tmp_path / "origen")
+    Migracion(engine, str(tmp_path / "origen")).importar()
+    resumen = Migracion(engine, str(tmp_path / "destino"), tamaño_lote=3).exportar()
+    assert (resumen['jugadores'], resumen['puntuaciones']) == (3, 4)
+
+    destino = JSONStorage(str(tmp_path / "destino"))
+    origen = JSONStorage(str(tmp_path / "origen"))
+    assert destino.obtener_puntuaciones(10) == origen.obtener_puntuaciones(10)
+    assert destino.iniciar_sesion("eva", "clave")['id'] == 3
+
+def test_iterar_json_por_bloques(tmp_path):
+    ruta = str(tmp_path / "datos.json")
+    elementos = [{'id': i, 'texto': "x" * (i % 7)} for i in range(500)]
+    assert escribir_json(ruta, iter(elementos)) == 500
+    assert list(iterar_json(ruta, tamaño_bloque=16)) == elementos
+
+# Pruebas extremas
+def test_mapea_jugadores_existentes(engine, tmp_path):
+    Base.metadata.create_all(engine)
+    almacenamiento = AlmacenamientoPostgres(session=Session(bind=engine))
+    almacenamiento.registrar_jugador("otro", "clave")
+    almacenamiento.registrar_jugador("luis", "clave")
+    _json_de_ejemplo(tmp_path)
+
+    resumen = Migracion(engine, str(tmp_path)).importar()
+    assert resumen['jugadores'] == 2
+    # luis tiene id 2 en el JSON y 2 en la base; ana (1 en el JSON) pasa a ser 3
+    assert almacenamiento.indice_en_clasificacion("ana") == 0
+    assert [p['nombre_usuario'] for p in almacenamiento.obtener_puntuaciones(10)] == ["ana", "luis", "eva", "ana"]
+
+def test_json_con_formato_de_json_storage(tmp_path):
+    ruta = tmp_path / "jugadores.json"
+    ruta.write_text(json.dumps([{'id': 1, 'nombre_usuario': "ana"}], indent=4))
+    assert list(iterar_json(str(ruta), tamaño_bloque=3)) == [{'id': 1, 'nombre_usuario': "ana"}]
+    assert list(iterar_json(str(tmp_path / "no_existe.json"))) == []
+
+# Pruebas de error
+def test_puntuaciones_sin_jugador_se_omiten(engine, tmp_path):
+    _json_de_ejemplo(tmp_path)
+    escribir_json(str(tmp_path / "puntuaciones.json"), [{'id': 1, 'id_jugador': 99, 'puntos': 5, 'fecha': None}])
+    resumen = Migracion(engine, str(tmp_path)).importar()
+    assert (resumen['puntuaciones'], resumen['omitidas']) == (0, 1)
+
+def test_importar_dos_veces_no_duplica(engine, tmp_path):
+    _json_de_ejemplo(tmp_path)
+    Migracion(engine, str(tmp_path)).importar()
+    with pytest.raises(ValueError):
+        Migracion(engine, str(tmp_path)).importar()
+
+    with engine.connect() as conexion:
+        assert AlmacenamientoPostgres(session=Session(bind=conexion)).contar_puntuaciones() == 4
+    assert Migracion(engine, str(tmp_path)).importar(forzar=True)['puntuaciones'] == 4
+
+def test_json_truncado(tmp_path):
+    ruta = tmp_path / "roto.json"
+    ruta.write_text('[{"id": 1}, {"id": ')
+    with pytest.raises(ValueError):
+        list(iterar_json(str(ruta)))
+
+def test_lote_invalido(engine):
+    with pytest.raises(ValueError):
+        Migracion(engine, tamaño_lote=0)
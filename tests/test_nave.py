@@ -51,3 +51,14 @@ def test_verificar_impacto_con_coordenada_incompleta():
     posicion = [(1, 1), (1, 2)]
     nave = Nave(posicion)
     assert nave.verificar_impacto((1,)) == False
+
+def test_recibir_impactos_hasta_hundir():
+    nave = Nave([(1, 1), (1, 2)])
+    assert nave.recibir_impacto() == False
+    assert not nave.hundida
+    assert nave.recibir_impacto() == True
+    assert nave.hundida
+
+def test_verificar_impacto_con_coordenada_no_hashable():
+    nave = Nave([(1, 1)])
+    assert nave.verificar_impacto([1, 1]) == False
@@ -0,0 +1,70 @@
+import pytest
+from src.utilidades.paginacion import VentanaPaginada
+
+def _pagina(ventana, pagina):
+    inicio = pagina * ventana.tamaño_pagina
+    return [{'puntaje': -i} for i in range(inicio, min(inicio + ventana.tamaño_pagina, ventana.total))]
+
+# Pruebas normales
+def test_extiende_hacia_abajo_y_numera():
+    ventana = VentanaPaginada(10, 3)
+    ventana.reiniciar(35)
+    assert ventana.agregar(0, _pagina(ventana, 0)) == 0
+    assert ventana.siguiente() == 1
+    assert ventana.anterior() is None
+    ventana.agregar(1, _pagina(ventana, 1))
+    filas = ventana.filas()
+    assert len(filas) == 20
+    assert [filas[0]['posicion'], filas[-1]['posicion']] == [1, 20]
+
+def test_descarta_el_extremo_opuesto():
+    ventana = VentanaPaginada(10, 2)
+    ventana.reiniciar(100)
+    for pagina in range(3):
+        corrimiento = ventana.agregar(pagina, _pagina(ventana, pagina))
+    assert corrimiento == -10
+    assert ventana.primera == 1
+    assert ventana.anterior() == 0
+    assert ventana.agregar(0, _pagina(ventana, 0)) == 10
+    assert [f['posicion'] for f in ventana.filas()][::10] == [1, 11]
+
+def test_reiniciar_en_pagina_e_indice_local():
+    ventana = VentanaPaginada(10, 3)
+    ventana.reiniciar(1000, ventana.pagina_de(537))
+    ventana.agregar(53, _pagina(ventana, 53))
+    assert ventana.indice_local(537) == 7
+    assert ventana.filas()[7]['posicion'] == 538
+    assert ventana.indice_local(10) is None
+
+# Pruebas extremas
+def test_ultima_pagina_incompleta():
+    ventana = VentanaPaginada(10, 3)
+    ventana.reiniciar(25, 99)
+    assert ventana.primera == 2
+    ventana.agregar(2, _pagina(ventana, 2))
+    assert ventana.siguiente() is None
+    assert len(ventana.filas()) == 5
+
+def test_memoria_acotada_al_recorrer_todo():
+    ventana = VentanaPaginada(50, 4)
+    ventana.reiniciar(100000)
+    pagina = 0
+    while pagina is not None:
+        ventana.agregar(pagina, _pagina(ventana, pagina))
+        pagina = ventana.siguiente()
+    assert len(ventana.paginas) == 4
+    assert ventana.filas()[-1]['posicion'] == 100000
+
+def test_pagina_no_contigua_se_ignora():
+    ventana = VentanaPaginada(10, 3)
+    ventana.reiniciar(100)
+    ventana.agregar(0, _pagina(ventana, 0))
+    assert ventana.agregar(5, _pagina(ventana, 5)) == 0
+    assert len(ventana.filas()) == 10
+
+# Pruebas de error
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        VentanaPaginada(0)
+    with pytest.raises(ValueError):
+        VentanaPaginada(10, 1)
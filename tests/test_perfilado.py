@@ -0,0 +1,86 @@
+import os
+import pstats
+import pytest
+from src.utilidades.perfilado import leer_guion, perfilar, PerfiladorMuestreo
+from cli import BatallaNavalCLI
+
+@pytest.fixture
+def guion(tmp_path):
+    ruta = tmp_path / "sesion.txt"
+    ruta.write_text("# jugar sin registro\n1\n0\n0\n1\n1\n")
+    return str(ruta)
+
+# Pruebas normales
+def test_leer_guion_salta_comentarios(guion):
+    entrada = leer_guion(guion, eco=False)
+    assert [entrada(), entrada(), entrada()] == ["1", "0", "0"]
+
+def test_sesion_guionada_dispara(guion, monkeypatch):
+    monkeypatch.setattr(os, 'system', lambda comando: pytest.fail("no debe limpiar la pantalla"))
+    cli = BatallaNavalCLI(leer_guion(guion, eco=False), interactivo=False)
+    cli.ejecutar()
+    celdas = cli.controlador.juego.campo.celdas
+    assert celdas[0][0] >= 2
+    assert celdas[1][1] >= 2
+
+def test_tablero_se_redibuja_solo_tras_eventos(tmp_path):
+    ruta = tmp_path / "redibujo.txt"
+    ruta.write_text("1\nx\nx\n0\n0\n")
+    cli = BatallaNavalCLI(leer_guion(str(ruta), eco=False), interactivo=False)
+    representar = cli.controlador.obtener_representacion_tablero
+    llamadas = []
+    cli.controlador.obtener_representacion_tablero = lambda: llamadas.append(1) or representar()
+    cli.ejecutar()
+    # Una vez al empezar y otra tras el disparo; las entradas inválidas no redibujan
+    assert len(llamadas) == 2
+
+def test_perfilar_escribe_pstats_y_pilas(tmp_path):
+    ruta_base = str(tmp_path / "perfil")
+
+    def trabajo():
+        return sum(i * i for i in range(200000))
+
+    assert perfilar(trabajo, ruta_base, intervalo=0.0005) > 0
+    estadisticas = pstats.Stats(ruta_base + ".pstats")
+    assert estadisticas.total_calls > 0
+    assert os.path.exists(ruta_base + ".folded")
+
+# Pruebas extremas
+def test_perfilar_escribe_aunque_falle(tmp_path):
+    ruta_base = str(tmp_path / "perfil")
+
+    def falla():
+        raise SystemExit(0)
+
+    with pytest.raises(SystemExit):
+        perfilar(falla, ruta_base)
+    assert os.path.exists(ruta_base + ".pstats")
+
+def test_formato_colapsado(tmp_path):
+    perfilador = PerfiladorMuestreo()
+    perfilador.pilas["a;b"] = 3
+    ruta = tmp_path / "pilas.folded"
+    perfilador.guardar_colapsado(str(ruta))
+    assert ruta.read_text() == "a;b 3\n"
+
+# Pruebas de error
+def test_error_al_guardar_muestra_el_motivo(tmp_path, capsys):
+    ruta = tmp_path / "guardar.txt"
+    ruta.write_text("1\ng\n")
+    cli = BatallaNavalCLI(leer_guion(str(ruta), eco=False), interactivo=False)
+
+    def guardar_partida():
+        raise ValueError("Solo los campos densos admiten instantáneas binarias")
+
+    cli.controlador.guardar_partida = guardar_partida
+    cli.ejecutar()
+    salida = capsys.readouterr().out
+    assert "No se pudo guardar la partida: Solo los campos densos" in salida
+    assert "Use números enteros" not in salida
+
+def test_guion_agotado(guion):
+    entrada = leer_guion(guion, eco=False)
+    for _ in range(5):
+        entrada()
+    with pytest.raises(EOFError):
+        entrada()
@@ -0,0 +1,57 @@
+import pytest
+from src.controller.controlador import Controlador
+from src.model.pregeneracion import PoolTableros
+
+@pytest.fixture
+def pool():
+    pool = PoolTableros(capacidad=3, configuraciones=[(10, 10, 5)]).iniciar()
+    yield pool
+    pool.detener()
+
+# Pruebas normales
+def test_acierto_tras_rellenar(pool):
+    assert pool.esperar_lleno()
+    campo = pool.obtener(10, 10, 5)
+    assert (campo.ancho, campo.alto, campo.naves_restantes) == (10, 10, 5)
+    assert pool.estadisticas()['aciertos'] == 1
+
+def test_fallo_registra_configuracion(pool):
+    campo = pool.obtener(6, 4, 2)
+    assert (campo.ancho, campo.alto) == (6, 4)
+    assert pool.estadisticas()['fallos'] == 1
+    assert pool.esperar_lleno()
+    assert pool.estadisticas()['existencias']['6x4x2'] == 3
+
+def test_controlador_con_pool(pool):
+    pool.esperar_lleno()
+    controlador = Controlador()
+    controlador.usar_pool_tableros(pool)
+    controlador.iniciar_juego(10, 10, 5)
+    controlador.reiniciar_juego()
+    assert controlador.juego.campo.naves_restantes == 5
+    assert pool.estadisticas()['aciertos'] == 2
+
+# Pruebas extremas
+def test_tableros_distintos(pool):
+    pool.esperar_lleno()
+    primero = pool.obtener(10, 10, 5)
+    segundo = pool.obtener(10, 10, 5)
+    assert primero is not segundo
+    assert primero.semilla is not None
+
+def test_sin_hilo_siempre_genera():
+    pool = PoolTableros()
+    pool.obtener(5, 5, 1)
+    pool.obtener(5, 5, 1)
+    assert pool.estadisticas()['fallos'] == 2
+
+# Pruebas de error
+def test_configuracion_invalida_no_se_registra():
+    pool = PoolTableros()
+    with pytest.raises(ValueError):
+        pool.obtener(1, 1, 1)
+    assert pool.estadisticas()['existencias'] == {}
+
+def test_capacidad_invalida():
+    with pytest.raises(ValueError):
+        PoolTableros(capacidad=0)
@@ -37,6 +37,19 @@ def test_mostrar_puntuaciones_sin_jugadores(sistema_usuario):
     except Exception as e:
         pytest.fail(f"La función mostrar_puntuaciones() lanzó un error con lista vacía: {e}")
 
+def test_sesion_busca_al_jugador_por_nombre():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from src.model.modelos_db import Base
+
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = Session(bind=engine)
+    puntuaciones = Puntuaciones(Jugador("PorNombre", "otra_clave"), session)
+    puntuaciones.almacenamiento.registrar_jugador("PorNombre", "clave_guardada")
+    puntuaciones.actualizar_puntuacion(7)
+    assert puntuaciones.mostrar_puntuaciones()[0]['puntaje'] == 7
+
 #  PRUEBAS EXTREMAS
 def test_actualizar_puntuacion_cero(puntuaciones, jugador):
     nuevo_puntaje = puntuaciones.actualizar_puntuacion(0)
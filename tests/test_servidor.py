@@ -0,0 +1,139 @@
+import asyncio
+import base64
+import json
+import os
+import pytest
+from src.controller.gestor_sesiones import GestorSesiones
+from src.model.sistema_usuario import SistemaUsuario
+from src.red.servidor import ServidorJuego, codificar_frame, leer_frame
+from src.red.cliente_carga import ejecutar_carga
+
+def _servidor():
+    return ServidorJuego(SistemaUsuario({'backend': 'memoria'}), GestorSesiones())
+
+async def _con_servidor(prueba):
+    servidor = _servidor()
+    puerto = await servidor.iniciar(puerto=0)
+    try:
+        return await prueba(puerto)
+    finally:
+        await servidor.detener()
+
+async def _pedir(lector, escritor, mensaje):
+    escritor.write(json.dumps(mensaje).encode() + b"\n")
+    await escritor.drain()
+    return json.loads(await lector.readline())
+
+# Pruebas normales
+def test_registro_inicio_sesion_y_victoria():
+    async def prueba(puerto):
+        lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+        assert (await _pedir(lector, escritor, {'op': 'registrar', 'nombre': 'ana', 'contraseña': 'x'}))['registrado']
+        assert (await _pedir(lector, escritor, {'op': 'iniciar_sesion', 'nombre': 'ana', 'contraseña': 'x'}))['ok']
+        assert (await _pedir(lector, escritor, {'op': 'iniciar_juego', 'ancho': 2, 'alto': 2, 'num_naves': 1}))['ok']
+        disparos = [[0, 0], [0, 1], [1, 0], [1, 1]]
+        respuesta = await _pedir(lector, escritor, {'op': 'disparar_lote', 'disparos': disparos, 'id': 7})
+        assert respuesta['terminado'] == True
+        assert respuesta['id'] == 7
+        ranking = await _pedir(lector, escritor, {'op': 'puntuaciones'})
+        assert ranking['puntuaciones'][0]['nombre_usuario'] == 'ana'
+        escritor.close()
+
+    asyncio.run(_con_servidor(prueba))
+
+def test_observar_oculta_las_naves():
+    servidor = _servidor()
+    jugador = type('Conexion', (), {'jugador': None, 'id_sesion': None})()
+    espectador = type('Conexion', (), {'jugador': None, 'id_sesion': None})()
+
+    async def prueba():
+        sesion = (await servidor.procesar(jugador, {'op': 'iniciar_juego', 'ancho': 4, 'alto': 3, 'num_naves': 2}))['sesion']
+        await servidor.procesar(jugador, {'op': 'disparar', 'fila': 0, 'columna': 0})
+        return await servidor.procesar(espectador, {'op': 'observar', 'sesion': sesion})
+
+    respuesta = asyncio.run(prueba())
+    assert respuesta['ok'] == True
+    assert (respuesta['ancho'], respuesta['alto']) == (4, 3)
+    assert respuesta['tablero'][0] in "OX"
+    assert set(respuesta['tablero'][1:]) == {"~"}
+
+def test_websocket():
+    async def prueba(puerto):
+        lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+        clave = base64.b64encode(os.urandom(16)).decode()
+        escritor.write((
+            "GET / HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {clave}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        ).encode())
+        assert b"101" in await lector.readline()
+        while (await lector.readline()).strip():
+            pass
+        mensaje = json.dumps({'op': 'iniciar_juego'}).encode()
+        escritor.write(codificar_frame(mensaje, mascara=b"abcd"))
+        opcode, datos = await leer_frame(lector)
+        assert opcode == 0x1
+        assert json.loads(datos)['ok'] == True
+        escritor.close()
+
+    asyncio.run(_con_servidor(prueba))
+
+# Pruebas extremas
+def test_cliente_de_carga():
+    async def prueba(puerto):
+        return await ejecutar_carga(puerto=puerto, conexiones=50, peticiones=10)
+
+    informe = asyncio.run(_con_servidor(prueba))
+    assert informe['errores'] == 0
+    assert informe['peticiones'] == 500
+    assert informe['p99_ms'] >= informe['p50_ms']
+
+# Pruebas de error
+def test_operacion_desconocida_y_sin_juego():
+    servidor = _servidor()
+    conexion = type('Conexion', (), {'jugador': None, 'id_sesion': None})()
+    respuesta = asyncio.run(servidor.procesar(conexion, {'op': 'volar'}))
+    assert respuesta['ok'] == False
+    respuesta = asyncio.run(servidor.procesar(conexion, {'op': 'disparar', 'fila': 0, 'columna': 0}))
+    assert respuesta['ok'] == False
+
+def test_victoria_se_registra_una_sola_vez():
+    servidor = _servidor()
+    conexion = type('Conexion', (), {'jugador': None, 'id_sesion': None})()
+
+    async def prueba():
+        await servidor.procesar(conexion, {'op': 'registrar', 'nombre': 'eva', 'contraseña': 'x'})
+        await servidor.procesar(conexion, {'op': 'iniciar_sesion', 'nombre': 'eva', 'contraseña': 'x'})
+        await servidor.procesar(conexion, {'op': 'iniciar_juego', 'ancho': 2, 'alto': 2, 'num_naves': 1})
+        disparos = [[0, 0], [0, 1], [1, 0], [1, 1]]
+        victoria = await servidor.procesar(conexion, {'op': 'disparar_lote', 'disparos': disparos})
+        otra_vez = await servidor.procesar(conexion, {'op': 'disparar_lote', 'disparos': []})
+        disparo = await servidor.procesar(conexion, {'op': 'disparar', 'fila': 0, 'columna': 0})
+        return victoria, otra_vez, disparo
+
+    victoria, otra_vez, disparo = asyncio.run(prueba())
+    assert victoria['terminado'] == True
+    assert otra_vez['ok'] == False
+    assert disparo['ok'] == False
+    assert servidor.sistema_usuario.contar_puntuaciones() == 1
+
+def test_tablero_y_limite_fuera_de_rango():
+    servidor = _servidor()
+    conexion = type('Conexion', (), {'jugador': None, 'id_sesion': None})()
+
+    async def prueba():
+        return [
+            await servidor.procesar(conexion, {'op': 'iniciar_juego', 'ancho': 100000, 'alto': 100000}),
+            await servidor.procesar(conexion, {'op': 'iniciar_juego', 'ancho': 3, 'alto': 3, 'num_naves': 10}),
+            await servidor.procesar(conexion, {'op': 'puntuaciones', 'limite': 10 ** 9}),
+            await servidor.procesar(conexion, {'op': 'puntuaciones', 'limite': 0}),
+        ]
+
+    respuestas = asyncio.run(prueba())
+    assert all(respuesta['ok'] == False for respuesta in respuestas)
+    assert "ancho" in respuestas[0]['error']
+    assert conexion.id_sesion is None
+
+def test_json_invalido():
+    servidor = _servidor()
+    respuesta = json.loads(asyncio.run(servidor.procesar_linea(None, b"{no es json")))
+    assert respuesta['ok'] == False
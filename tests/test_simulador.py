@@ -0,0 +1,52 @@
+import os
+import pytest
+from src.analisis.simulador import Distribucion, estimar_disparos, simular_lote
+
+# Pruebas normales
+def test_media_aleatoria_coincide_con_la_teoria(tmp_path):
+    # Con k naves de una celda en n celdas, E[disparos] = k * (n + 1) / (k + 1)
+    resultado = estimar_disparos(4, 4, 3, precision=0.01, procesos=1, semilla=1, directorio_cache=str(tmp_path))
+    assert resultado['intervalo_95'][0] - 0.5 <= 3 * 17 / 4 <= resultado['intervalo_95'][1] + 0.5
+    assert resultado['precision'] == 0.01
+    assert sum(resultado['distribucion'].values()) == resultado['partidas']
+
+def test_barrido_y_caza_ganan_siempre():
+    for estrategia in ('barrido', 'caza'):
+        frecuencias = simular_lote(5, 5, 2, estrategia, 50, semilla=3, flota=[3, 2])
+        assert sum(frecuencias.values()) == 50
+        assert all(5 <= disparos <= 25 for disparos in frecuencias)
+
+def test_resultado_en_cache(tmp_path):
+    primero = estimar_disparos(3, 3, 2, procesos=1, semilla=1, directorio_cache=str(tmp_path))
+    assert os.listdir(tmp_path) == ["3x3x2-aleatoria.json"]
+    segundo = estimar_disparos(3, 3, 2, procesos=1, semilla=2, directorio_cache=str(tmp_path))
+    assert segundo == primero
+
+def test_procesos_en_paralelo():
+    resultado = estimar_disparos(3, 3, 1, precision=0.05, minimo=200, lote=100, procesos=2,
+                                 semilla=5, directorio_cache=None)
+    assert resultado['partidas'] >= 200
+    assert 4 <= resultado['media'] <= 6
+
+# Pruebas extremas
+def test_se_detiene_en_el_maximo():
+    resultado = estimar_disparos(4, 4, 3, precision=1e-9, minimo=100, maximo=300, lote=100,
+                                 procesos=1, directorio_cache=None)
+    assert resultado['partidas'] == 300
+    assert resultado['precision'] is None
+
+def test_distribucion_percentiles():
+    distribucion = Distribucion()
+    distribucion.agregar({1: 1, 2: 2, 10: 1})
+    assert distribucion.percentil(50) == 2
+    assert distribucion.percentil(100) == 10
+    assert distribucion.media == 15 / 4
+
+# Pruebas de error
+def test_estrategia_desconocida():
+    with pytest.raises(ValueError):
+        estimar_disparos(5, 5, 2, estrategia='adivinar', directorio_cache=None)
+
+def test_configuracion_invalida():
+    with pytest.raises(ValueError):
+        estimar_disparos(3, 3, 20, directorio_cache=None)
@@ -0,0 +1,73 @@
+import queue
+import threading
+import pytest
+from src.controller.controlador import Controlador
+from src.model.sistema_usuario import SistemaUsuario
+from src.utilidades.tareas import EjecutorTareas
+
+def _ejecutor():
+    # Simula Clock.schedule_once: los callbacks se encolan y los corre el hilo de la prueba
+    cola = queue.Queue()
+    return EjecutorTareas(programar=cola.put), cola
+
+def _entregar(cola):
+    cola.get(timeout=5)()
+
+# Pruebas normales
+def test_resultado_en_el_hilo_que_programa():
+    ejecutor, cola = _ejecutor()
+    hilos = []
+    resultados = []
+    ejecutor.enviar(lambda: hilos.append(threading.get_ident()) or 42, al_terminar=resultados.append)
+    _entregar(cola)
+    assert resultados == [42]
+    assert hilos[0] != threading.get_ident()
+    ejecutor.cerrar()
+
+def test_error_va_a_al_fallar():
+    ejecutor, cola = _ejecutor()
+    errores = []
+    ejecutor.enviar(lambda: 1 / 0, al_terminar=lambda r: pytest.fail("no debía terminar"), al_fallar=errores.append)
+    _entregar(cola)
+    assert isinstance(errores[0], ZeroDivisionError)
+    ejecutor.cerrar()
+
+def test_controlador_registra_puntos_en_segundo_plano():
+    ejecutor, cola = _ejecutor()
+    registrados = []
+    controlador = Controlador()
+    controlador.sistema_usuario = SistemaUsuario({'backend': 'memoria'})
+    controlador.sistema_usuario.registrar_jugador("fondo", "clave")
+    controlador.iniciar_sesion("fondo", "clave")
+    controlador.usar_ejecutor_puntuaciones(ejecutor, al_registrar=registrados.append)
+    controlador.iniciar_juego(2, 2, 4)
+    for fila in range(2):
+        for columna in range(2):
+            controlador.realizar_disparo(fila, columna)
+    _entregar(cola)
+    assert registrados == [10]
+    ejecutor.cerrar()
+
+# Pruebas extremas
+def test_cancelar_descarta_el_resultado():
+    ejecutor, cola = _ejecutor()
+    liberar = threading.Event()
+    resultados = []
+    tarea = ejecutor.enviar(liberar.wait, al_terminar=resultados.append)
+    pendiente = ejecutor.enviar(lambda: "no corre", al_terminar=resultados.append)
+    tarea.cancelar()
+    pendiente.cancelar()
+    liberar.set()
+    _entregar(cola)
+    ejecutor.cerrar()
+    assert resultados == []
+    assert pendiente.futuro.cancelled()
+    assert cola.empty()
+
+# Pruebas de error
+def test_error_sin_al_fallar_no_rompe():
+    ejecutor, cola = _ejecutor()
+    ejecutor.enviar(lambda: 1 / 0)
+    _entregar(cola)
+    ejecutor.cerrar()
+    assert ejecutor.pendientes == 0
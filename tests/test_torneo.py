@@ -0,0 +1,100 @@
+import json
+import pytest
+from src.analisis.torneo import Torneo, actualizar_elo, emparejar_suizo, emparejar_todos
+from src.model.sistema_usuario import SistemaUsuario
+
+def _torneo(ruta, rondas, **kwargs):
+    parametros = dict(rondas=rondas, partidas_por_pareja=5, ancho=4, alto=4, num_naves=2,
+                      semilla=7, ruta_checkpoint=str(ruta))
+    parametros.update(kwargs)
+    return Torneo(SistemaUsuario({'backend': 'memoria'}), **parametros)
+
+# Pruebas normales
+def test_torneo_registra_bots_y_victorias(tmp_path):
+    torneo = _torneo(tmp_path / "torneo.json", 2)
+    clasificacion = torneo.ejecutar()
+    assert len(clasificacion) == 3
+    assert sum(elo for _, elo in clasificacion) == pytest.approx(1500 * 3)
+    ganadas = sum(e['ganadas'] for e in torneo.estadisticas.values())
+    puntuaciones = list(torneo.sistema_usuario.almacenamiento.iterar_puntuaciones())
+    assert len(puntuaciones) == ganadas
+    assert {j.nombre_usuario for j in torneo.sistema_usuario.jugadores_registrados} == set(torneo.bots)
+
+def test_reanudar_desde_checkpoint_da_el_mismo_resultado(tmp_path):
+    completo = _torneo(tmp_path / "completo.json", 4).ejecutar()
+
+    ruta = tmp_path / "interrumpido.json"
+    _torneo(ruta, 2).ejecutar()
+    assert json.loads(ruta.read_text())['ronda'] == 2
+    reanudado = _torneo(ruta, 4)
+    assert reanudado.ronda == 2
+    assert reanudado.ejecutar() == completo
+
+def test_procesos_en_paralelo(tmp_path):
+    en_serie = _torneo(tmp_path / "serie.json", 1).ejecutar()
+    en_paralelo = _torneo(tmp_path / "paralelo.json", 1, procesos=2).ejecutar()
+    assert en_paralelo == en_serie
+
+# Pruebas extremas
+def test_emparejamientos():
+    assert len(emparejar_todos(["a", "b", "c", "d"], 0)) == 6
+    assert emparejar_todos(["a", "b"], 1) == [("b", "a")]
+    elo = {"a": 1400, "b": 1600, "c": 1500}
+    assert emparejar_suizo(["a", "b", "c"], elo) == [("b", "c")]
+
+def test_suizo_evita_repetir_rivales_y_rota_el_descanso():
+    elo = {"a": 1600, "b": 1500, "c": 1400}
+    descansos = {"a": 0, "b": 0, "c": 1}
+    assert emparejar_suizo(["a", "b", "c"], elo, {"a": ["b"], "b": ["a"]}, descansos) == [("a", "c")]
+
+    elo = {"a": 1600, "b": 1550, "c": 1500, "d": 1450}
+    rivales = {"a": ["b"], "b": ["a"], "c": ["d"], "d": ["c"]}
+    assert emparejar_suizo(["a", "b", "c", "d"], elo, rivales) == [("a", "c"), ("b", "d")]
+
+def test_torneo_suizo_impar_descansa_cada_uno(tmp_path):
+    torneo = _torneo(tmp_path / "suizo.json", 3, formato='suizo')
+    torneo.ejecutar()
+    assert sorted(torneo.descansos.values()) == [1, 1, 1]
+
+def test_elo_conserva_la_suma():
+    elo = {"a": 1500.0, "b": 1500.0}
+    actualizar_elo(elo, "a", "b", 1.0)
+    assert elo["a"] == 1508 and elo["b"] == 1492
+
+# Pruebas de error
+def test_checkpoint_de_otra_configuracion(tmp_path):
+    ruta = tmp_path / "torneo.json"
+    _torneo(ruta, 1).ejecutar()
+    with pytest.raises(ValueError):
+        _torneo(ruta, 2, semilla=8)
+
+class SistemaQueCae(SistemaUsuario):
+    """Escribe el lote de la segunda ronda y cae antes de volver al torneo."""
+
+    def __init__(self):
+        super().__init__({'backend': 'memoria'})
+        self.lotes = 0
+
+    def actualizar_puntuaciones(self, resultados):
+        resultado = super().actualizar_puntuaciones(resultados)
+        self.lotes += 1
+        if self.lotes == 2:
+            raise KeyboardInterrupt
+        return resultado
+
+def test_caida_al_registrar_no_duplica_victorias(tmp_path):
+    ruta = tmp_path / "torneo.json"
+    sistema = SistemaQueCae()
+    parametros = dict(partidas_por_pareja=5, ancho=4, alto=4, num_naves=2, semilla=7, ruta_checkpoint=str(ruta))
+    with pytest.raises(KeyboardInterrupt):
+        Torneo(sistema, rondas=3, **parametros).ejecutar()
+
+    reanudado = Torneo(sistema, rondas=3, **parametros)
+    assert reanudado.ronda == 2
+    reanudado.ejecutar()
+    ganadas = sum(e['ganadas'] for e in reanudado.estadisticas.values())
+    assert len(list(sistema.almacenamiento.iterar_puntuaciones())) == ganadas
+
+def test_estrategia_desconocida(tmp_path):
+    with pytest.raises(ValueError):
+        _torneo(tmp_path / "t.json", 1, bots={"a": "aleatoria", "b": "adivinar"})
@@ -0,0 +1,67 @@
+import pytest
+from src.model.campo import Campo
+from src.model.campo_disperso import CampoDisperso
+from src.model.instantanea import codificar_campo, decodificar_campo
+from src.model.vista import VistaNiebla
+
+def _campo():
+    campo = Campo(4, 3, 2, semilla=1)
+    campo.celdas = [[0] * 4 for _ in range(3)]
+    campo.celdas[1][2] = 1
+    campo.celdas[2][3] = 1
+    return campo
+
+# Pruebas normales
+def test_vista_oculta_naves_sin_impactar():
+    campo = _campo()
+    vista = campo.vista()
+    assert bytes(vista.datos) == bytes(12)
+    assert vista.texto() == "~" * 12
+
+def test_vista_refleja_disparos_sin_copiar():
+    campo = _campo()
+    vista = campo.vista()
+    campo.verificar_impacto(1, 2)
+    campo.verificar_impacto(0, 0)
+    assert vista.estado(1, 2) == 3
+    assert vista.estado(0, 0) == 2
+    assert vista.fila(2).tobytes() == bytes(4)
+    assert vista.datos.obj is campo.publico
+
+def test_vistas_compartidas():
+    campo = _campo()
+    assert campo.vista() is campo.vista()
+    otra = VistaNiebla(campo)
+    campo.aplicar_disparos([2 * 4 + 3])
+    assert otra.estado(2, 3) == 3
+
+def test_mostrar_campo_igual_que_el_campo():
+    campo = _campo()
+    campo.verificar_impacto(1, 2)
+    campo.verificar_impacto(0, 1)
+    assert campo.vista().mostrar_campo() == campo.mostrar_campo()
+
+# Pruebas extremas
+def test_vista_tras_instantanea():
+    campo = _campo()
+    campo.verificar_impacto(2, 3)
+    campo.verificar_impacto(0, 0)
+    restaurado = decodificar_campo(codificar_campo(campo))
+    assert restaurado.vista().texto() == campo.vista().texto()
+
+# Pruebas de error
+def test_vista_de_solo_lectura():
+    vista = _campo().vista()
+    with pytest.raises(TypeError):
+        vista.datos[0] = 3
+
+def test_vista_fuera_del_tablero():
+    vista = _campo().vista()
+    with pytest.raises(ValueError):
+        vista.estado(3, 0)
+    with pytest.raises(ValueError):
+        vista.fila(-1)
+
+def test_vista_de_campo_disperso():
+    with pytest.raises(ValueError):
+        VistaNiebla(CampoDisperso(10, 10, 2))
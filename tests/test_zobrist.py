@@ -0,0 +1,100 @@
+import pytest
+from src.model.campo import Campo
+from src.model.campo_disperso import CampoDisperso
+from src.model.instantanea import codificar_campo, decodificar_campo
+from src.model.zobrist import CacheTransposiciones, clave_estado, clave_zobrist, hash_publico
+
+def _campo(naves):
+    campo = Campo(5, 5, len(naves), semilla=1)
+    campo.celdas = [[0] * 5 for _ in range(5)]
+    for fila, columna in naves:
+        campo.celdas[fila][columna] = 1
+    return campo
+
+# Pruebas normales
+def test_hash_independiente_del_orden_de_disparo():
+    a = _campo([(1, 1), (3, 3)])
+    b = _campo([(1, 1), (4, 4)])
+    for fila, columna in [(0, 0), (1, 1), (2, 2)]:
+        a.verificar_impacto(fila, columna)
+    for fila, columna in [(2, 2), (1, 1), (0, 0)]:
+        b.verificar_impacto(fila, columna)
+    assert a.hash_publico == b.hash_publico
+    assert a.hash_publico == hash_publico(a.publico)
+
+def test_hash_distingue_resultado_del_disparo():
+    a = _campo([(1, 1)])
+    b = _campo([(2, 2)])
+    a.verificar_impacto(1, 1)
+    b.verificar_impacto(1, 1)
+    assert a.hash_publico != b.hash_publico
+
+def test_aplicar_disparos_mantiene_el_hash():
+    a = _campo([(1, 1), (3, 3)])
+    b = _campo([(1, 1), (3, 3)])
+    a.aplicar_disparos([0, 6, 18])
+    for indice in [0, 6, 18]:
+        b.verificar_impacto(*divmod(indice, 5))
+    assert a.hash_publico == b.hash_publico
+
+def test_campo_disperso_usa_el_mismo_hash():
+    disperso = CampoDisperso(5, 5, 1, semilla=4)
+    denso = _campo([disperso.posiciones_naves[0]])
+    for indice in range(3):
+        disperso.verificar_impacto(*divmod(indice, 5))
+        denso.verificar_impacto(*divmod(indice, 5))
+    disperso.aplicar_disparos([10, 11])
+    denso.aplicar_disparos([10, 11])
+    assert disperso.hash_publico == denso.hash_publico
+
+def test_cache_memoiza_por_estado():
+    cache = CacheTransposiciones()
+    llamadas = []
+    def calcular(campo):
+        llamadas.append(1)
+        return campo.naves_restantes
+
+    a = _campo([(1, 1)])
+    b = _campo([(1, 1)])
+    a.verificar_impacto(0, 0)
+    b.verificar_impacto(0, 0)
+    assert cache.memoizar(a, calcular) == 1
+    assert cache.memoizar(b, calcular) == 1
+    assert len(llamadas) == 1
+    assert (cache.aciertos, cache.fallos) == (1, 1)
+
+# Pruebas extremas
+def test_hash_tras_instantanea():
+    campo = _campo([(1, 1), (3, 3)])
+    campo.verificar_impacto(1, 1)
+    campo.verificar_impacto(0, 4)
+    assert decodificar_campo(codificar_campo(campo)).hash_publico == campo.hash_publico
+
+def test_cache_expulsa_la_menos_usada():
+    cache = CacheTransposiciones(capacidad=2)
+    cache.guardar('a', 1)
+    cache.guardar('b', 2)
+    cache.obtener('a')
+    cache.guardar('c', 3)
+    assert len(cache) == 2
+    assert cache.obtener('b') is None
+    assert cache.obtener('a') == 1
+
+def test_clave_estado_separa_configuraciones():
+    assert clave_estado(Campo(5, 5, 1, semilla=1)) != clave_estado(Campo(5, 6, 1, semilla=1))
+    assert clave_zobrist(0, 2) != clave_zobrist(0, 3)
+
+def test_clave_estado_separa_flotas():
+    corta = Campo(6, 6, 2, semilla=1, flota=[1, 3])
+    larga = Campo(6, 6, 2, semilla=1, flota=[2, 2])
+    assert corta.hash_publico == larga.hash_publico
+    assert clave_estado(corta) != clave_estado(larga)
+
+    cache = CacheTransposiciones()
+    cache.memoizar(corta, lambda campo: 'corta')
+    assert cache.memoizar(larga, lambda campo: 'larga') == 'larga'
+
+# Pruebas de error
+def test_cache_capacidad_invalida():
+    with pytest.raises(ValueError):
+        CacheTransposiciones(capacidad=0)